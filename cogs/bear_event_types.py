@@ -1,7 +1,15 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple
+import functools
+import logging
+import logging.handlers
+import os
+import queue
 import pytz
 
+# Name of the queue handler get_bear_trap_logger() attaches, so later calls can find it
+BEAR_TRAP_LOG_HANDLER_NAME = 'bear_trap.queue'
+
 # Event type configuration metadata
 EVENT_CONFIG = {
     "Bear Trap": {
@@ -168,6 +176,36 @@ def get_event_config(event_type: str) -> Optional[Dict]:
     """
     return EVENT_CONFIG.get(event_type)
 
+def get_bear_trap_logger() -> logging.Logger:
+    """
+    Return the 'bear_trap' logger shared by the bear trap cogs, setting it up on first use
+
+    Records are queued and written to log/bear_trap.txt by a listener thread, off the event loop.
+    The setup lives for the whole process, so cog reloads neither add handlers nor reopen the file.
+    """
+    logger = logging.getLogger('bear_trap')
+    if any(handler.get_name() == BEAR_TRAP_LOG_HANDLER_NAME for handler in logger.handlers):
+        return logger
+
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    os.makedirs('log', exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        os.path.join('log', 'bear_trap.txt'), maxBytes=3 * 1024 * 1024, backupCount=1, encoding='utf-8'
+    )
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    log_queue = queue.Queue(-1)
+    logging.handlers.QueueListener(log_queue, file_handler).start()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.set_name(BEAR_TRAP_LOG_HANDLER_NAME)
+    logger.addHandler(queue_handler)
+    return logger
+
+@functools.lru_cache(maxsize=256)
+def get_timezone(name: str) -> pytz.BaseTzInfo:
+    """Cached pytz.timezone(); raises UnknownTimeZoneError for unknown names like pytz does"""
+    return pytz.timezone(name)
+
 def get_event_types() -> List[str]:
     """Get list of all available event types"""
     return EVENT_TYPES.copy()
@@ -6,13 +6,33 @@ import pytz
 import os
 import asyncio
 import json
-import traceback
+import functools
 import time
 import re
-from .bear_event_types import get_event_types, get_event_icon
+import threading
+import queue
+import logging
+from collections import namedtuple
+from dataclasses import dataclass
+from .bear_event_types import get_event_types, get_event_icon, get_event_config, get_timezone, get_bear_trap_logger
 from .permission_handler import PermissionManager
 from .pimp_my_bot import theme
 
+# Shared with the other bear trap cogs, written to log/bear_trap.txt
+logger = logging.getLogger('bear_trap')
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_pretty(data) -> str:
+    """Serialize to 2-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 
 def check_mention_placeholder_misuse(text: str, is_embed: bool = False) -> str | None:
     """
@@ -51,20 +71,371 @@ def check_mention_placeholder_misuse(text: str, is_embed: bool = False) -> str |
             )
     return None
 
+
+def bot_can_send(interaction: discord.Interaction, channel_id: int) -> bool:
+    """Whether the bot can send messages in channel_id.
+
+    For the channel the interaction came from, Discord already sent the bot's resolved permissions.
+    """
+    if channel_id == interaction.channel_id:
+        return interaction.app_permissions.send_messages
+    channel = interaction.guild.get_channel(channel_id)
+    return channel is not None and channel.permissions_for(interaction.guild.me).send_messages
+
+
+async def send_error(interaction: discord.Interaction, message: str):
+    """Send an ephemeral error as the initial response, or as a followup if the interaction was already answered."""
+    if interaction.response.is_done():
+        await interaction.followup.send(message, ephemeral=True)
+    else:
+        await interaction.response.send_message(message, ephemeral=True)
+
+# bear_notifications.message_kind values; an embed inside CUSTOM_TIMES still counts as an embed
+NOTIFICATION_KIND_PLAIN = 0
+NOTIFICATION_KIND_CUSTOM_TIMES = 1
+NOTIFICATION_KIND_EMBED = 2
+
+MESSAGE_KIND_SQL_TMPL = (
+    f"CASE WHEN instr({{col}}, 'EMBED_MESSAGE:') > 0 THEN {NOTIFICATION_KIND_EMBED} "
+    f"WHEN substr({{col}}, 1, 13) = 'CUSTOM_TIMES:' THEN {NOTIFICATION_KIND_CUSTOM_TIMES} "
+    f"ELSE {NOTIFICATION_KIND_PLAIN} END"
+)
+
+# Statements shared by the notification buttons; kept as constants so every call
+# hands sqlite3 the same string and hits the connection's statement cache
+SQL_GET_NOTIFICATION_DAYS = "SELECT weekday FROM notification_days WHERE notification_id = ?"
+SQL_NOTIFICATION_EXISTS = "SELECT 1 FROM bear_notifications WHERE id = ?"
+SQL_GET_DELETE_DELAY = "SELECT custom_delete_delay_minutes FROM bear_notifications WHERE id = ?"
+SQL_SET_DELETE_DELAY = "UPDATE bear_notifications SET custom_delete_delay_minutes = ? WHERE id = ?"
+SQL_SET_CHANNEL = "UPDATE bear_notifications SET channel_id = ? WHERE id = ?"
+SQL_GET_DELETION_SETTINGS = (
+    "SELECT delete_messages_enabled, default_delete_delay_minutes FROM bear_trap_settings WHERE guild_id = ?"
+)
+# Creates the default row if missing and returns the stored values either way
+SQL_ENSURE_DELETION_SETTINGS = (
+    "INSERT INTO bear_trap_settings (guild_id, delete_messages_enabled, default_delete_delay_minutes) VALUES (?, 1, 60) "
+    "ON CONFLICT(guild_id) DO UPDATE SET guild_id = guild_id "
+    "RETURNING delete_messages_enabled, default_delete_delay_minutes"
+)
+
+REPEAT_TIME_UNITS = (
+    ("month", 43200),
+    ("week", 10080),
+    ("day", 1440),
+    ("hour", 60),
+    ("minute", 1),
+)
+
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+@functools.lru_cache(maxsize=512)
+def format_repeat_interval(repeat_minutes: int) -> str:
+    """Break a repeat interval in minutes into e.g. '1 day and 2 hours'."""
+    result = []
+    for name, unit in REPEAT_TIME_UNITS:
+        value, repeat_minutes = divmod(repeat_minutes, unit)
+        if value > 0:
+            result.append(f"{value} {name}{'s' if value > 1 else ''}")
+    return " and ".join(result)
+
+
+@functools.lru_cache(maxsize=512)
+def format_repeat_weekdays(weekday_rows: tuple[str, ...]) -> str:
+    """Format notification_days weekday strings (e.g. '0|2|4') as 'Every Monday, Wednesday and Friday'."""
+    day_set = set()
+    for weekday in weekday_rows:
+        for part in weekday.split('|'):
+            if part.strip().isdigit():
+                day_set.add(int(part))
+
+    day_list = [WEEKDAY_NAMES[day] for day in sorted(day_set)]
+
+    if len(day_list) == 1:
+        return f"Every {day_list[0]}"
+    return "Every " + ", ".join(day_list[:-1]) + " and " + day_list[-1]
+
+
+# Theme icons are filled in per render since the active theme can change at runtime
+NOTIFICATION_DETAILS_TEMPLATE = (
+    "**{calendar_icon} Next Notification date:** {next_date}\n"
+    "**{clock_icon} Time:** {hour:02d}:{minute:02d} ({timezone})\n"
+    "**{announce_icon} Channel:** {channel}\n"
+    "**{edit_icon} Description:** {description}\n\n"
+    "**{settings_icon} Notification Type:** \n{notification_type}\n\n"
+    "**{user_icon} Mention:** {mention}\n"
+    "**{refresh_icon} Repeat:** {repeat}\n"
+    "**{trash_icon} Message Cleanup:** {cleanup}\n"
+)
+
+# Menu error texts; the denied icon is prefixed at send time since the theme can change at runtime
+ERR_SCHEDULE_BOARDS = "An error occurred while loading schedule boards!"
+ERR_TEMPLATES = "An error occurred while loading templates."
+ERR_SETTINGS = "An error occurred while loading settings."
+ERR_MAIN_MENU = "An error occurred while returning to main menu."
+ERR_SELECTION = "An error occurred while processing your selection!"
+ERR_EDIT_NOTIFICATION = "An error occurred while editing notification!"
+ERR_START_EDIT = "An error occurred while starting the edit process!"
+ERR_NO_SEND_PERMISSION = "I don't have permission to send messages in this channel!"
+
+# Body of the "Select Notification Type" step shown after a channel is picked
+NOTIFICATION_TYPE_CHOICES_TEXT = (
+    "Choose when to send notifications:\n\n"
+    "**30m, 10m, 5m & Time**\n"
+    "• 30 minutes before\n"
+    "• 10 minutes before\n"
+    "• 5 minutes before\n"
+    "• When time's up\n\n"
+    "**10m, 5m & Time**\n"
+    "• 10 minutes before\n"
+    "• 5 minutes before\n"
+    "• When time's up\n\n"
+    "**5m & Time**\n"
+    "• 5 minutes before\n"
+    "• When time's up\n\n"
+    "**Only 5m**\n"
+    "• Only 5 minutes before\n\n"
+    "**Only Time**\n"
+    "• Only when time's up\n\n"
+    "**Custom Times**\n"
+    "• Set your own notification times"
+)
+
+# Help text shown above the notification details; {change_channel} is one of the two lines below
+NOTIFICATION_HELP_TEMPLATE = (
+    "- **{search_icon} Search:** Filter the menu options based on specific keywords\n"
+    "- **{edit_icon} Edit:** Modify notification details.\n"
+    "- **{toggle_icon} Notification is active/inactive:** Toggles between enabling or disabling the notification.\n"
+    "  - -# Click to toggle between enabling or disabling.\n"
+    "  - -# Enabling a non-repeating notification will keep its time but change its date to today's date or tomorrow if the time had passed.\n"
+    "- **{eyes_icon} Preview:** See how the notification will look when it's sent.\n"
+    "{extra_lines}"
+    "- **{trash_icon} Delete:** Remove the selected notification.\n\n"
+)
+NOTIFICATION_HELP_EXTRA_LINES = (
+    "- **{trash_icon} Message Cleanup:** Configure custom message deletion delay for this notification.\n"
+    "- **{edit_icon} Change Channel:** {change_channel}\n"
+)
+CHANGE_CHANNEL_HELP = "Update the channel for this notification."
+CHANGE_CHANNEL_MISSING_HELP = "{warn_icon} Update the channel for this notification (current channel is unavailable)."
+
+
+def build_notification_help(channel_available: bool | None = None, toggle_icon: str | None = None) -> str:
+    """Fill the help template with the current theme icons.
+
+    Passing channel_available=None leaves out the Message Cleanup and Change Channel lines.
+    """
+    icons = {
+        "search_icon": theme.searchIcon,
+        "edit_icon": theme.editListIcon,
+        "toggle_icon": toggle_icon or theme.settingsIcon,
+        "eyes_icon": theme.eyesIcon,
+        "trash_icon": theme.trashIcon,
+        "warn_icon": theme.warnIcon,
+    }
+    if channel_available is None:
+        icons["extra_lines"] = ""
+    else:
+        change_channel = CHANGE_CHANNEL_HELP if channel_available else CHANGE_CHANNEL_MISSING_HELP
+        icons["change_channel"] = change_channel.format_map(icons)
+        icons["extra_lines"] = NOTIFICATION_HELP_EXTRA_LINES.format_map(icons)
+    return NOTIFICATION_HELP_TEMPLATE.format_map(icons)
+
+
+# The "Message Cleanup" line of NOTIFICATION_DETAILS_TEMPLATE; group 1 is the theme icon
+CLEANUP_LINE_RE = re.compile(r"(?m)^\*\*(.+?) Message Cleanup:\*\*.*$")
+
+# Splits "role_<id>" / "member_<id>" mention types into kind and id
+MENTION_ID_RE = re.compile(r"(role|member)_(\d+)$")
+
+# Keyed by the first five characters of mention_type ("role_<id>", "member_<id>", "everyone", "none")
+MENTION_DISPLAY_FORMATTERS = {
+    "role_": lambda mention: f"<@&{mention[5:]}>",
+    "membe": lambda mention: f"<@{mention[7:]}>",
+    "every": lambda mention: "@everyone",
+    "none": lambda mention: "No mention",
+}
+
+
+def format_mention_display(mention_type: str) -> str:
+    """Render a stored mention_type for the notification details embed."""
+    formatter = MENTION_DISPLAY_FORMATTERS.get(mention_type[:5])
+    return formatter(mention_type) if formatter else mention_type
+
+
+@dataclass(slots=True)
+class Notification:
+    """One bear_notifications row as returned by BearTrap.get_notifications."""
+    id: int
+    guild_id: int
+    channel_id: int
+    hour: int
+    minute: int
+    timezone: str
+    description: str
+    notification_type: int
+    mention_type: str
+    repeat_enabled: int
+    repeat_minutes: int
+    is_enabled: int
+    created_at: str
+    created_by: int
+    last_notification: str | None
+    next_notification: str | None
+    event_type: str | None
+    custom_delete_delay_minutes: int | None
+    message_kind: int
+
+
+# A bear_notification_embeds row; field order is the order of the "Show Code" JSON
+NotificationEmbed = namedtuple(
+    "NotificationEmbed",
+    "title description color footer author image_url thumbnail_url mention_message"
+)
+EMBED_CONTENT_FIELDS = ("title", "description", "image_url", "thumbnail_url", "footer", "author", "mention_message")
+
+# Preview fields of a bear_notifications row plus its NotificationEmbed (or None)
+NotificationWithEmbed = namedtuple(
+    "NotificationWithEmbed",
+    "channel_id hour minute description mention_type next_notification event_type embed"
+)
+
+
+@dataclass(slots=True)
+class NotificationDisplay:
+    """Precomputed select-menu rendering and search text for one notification row."""
+    label: str
+    description: str
+    value: str
+    search_text_lower: str
+
+
+def build_notification_display(notif: Notification, channel, embed_title: str | None) -> NotificationDisplay:
+    """Resolve the label, description, option value and search text for a notification row.
+
+    channel is the resolved guild channel for the row, or None if it no longer exists.
+    """
+    status_emoji = "🟢" if notif.is_enabled else "🔴"
+    status = "Enabled" if notif.is_enabled else "Disabled"
+
+    if channel:
+        channel_warning = ""
+        channel_name = f"#{channel.name}"
+    else:
+        channel_warning = f"{theme.warnIcon} "
+        channel_name = "Unknown"
+
+    notification_desc = notif.description
+    is_embed = notif.message_kind == NOTIFICATION_KIND_EMBED
+
+    event_type = notif.event_type if notif.event_type else None
+
+    # Get event emoji and display name
+    if event_type:
+        event_emoji = get_event_icon(event_type)
+        display_name = event_type
+    else:
+        # Custom notification - get title from description or embed
+        event_emoji = theme.editListIcon
+
+        if is_embed:
+            display_name = f"{embed_title} (Custom)" if embed_title else "Custom Notification"
+        elif notif.message_kind == NOTIFICATION_KIND_CUSTOM_TIMES:
+            # Extract description after CUSTOM_TIMES:
+            parts = notification_desc.split("|", 1)
+            if len(parts) > 1:
+                custom_desc = parts[1].replace("PLAIN_MESSAGE:", "").strip()
+                display_name = f"{custom_desc[:30]} (Custom)" if custom_desc else "Custom Notification"
+            else:
+                display_name = "Custom Notification"
+        else:
+            # Plain notification
+            plain_desc = notification_desc.replace("PLAIN_MESSAGE:", "").strip()
+            display_name = f"{plain_desc[:30]} (Custom)" if plain_desc else "Custom Notification"
+
+    # Format next occurrence time
+    if notif.next_notification:
+        try:
+            next_time = datetime.fromisoformat(notif.next_notification)
+            tz = get_timezone(notif.timezone)
+            next_time_local = next_time.astimezone(tz)
+            time_display = next_time_local.strftime("%m/%d %H:%M")
+        except:
+            time_display = f"{notif.hour:02d}:{notif.minute:02d}"
+    else:
+        time_display = f"{notif.hour:02d}:{notif.minute:02d}"
+
+    # Build label: [Emoji] [Event Type/Title] - [Time]
+    label = f"{channel_warning}{event_emoji} {display_name} - {time_display}"
+    description = f"{status_emoji} {status} | {channel_name} | ID: {notif.id}"
+
+    # Search matches the embed title, or the message text after any CUSTOM_TIMES prefix
+    if is_embed:
+        search_text = embed_title or "Embed Message"
+    else:
+        search_text = notification_desc.split('|')[-1] if '|' in notification_desc else notification_desc
+        if search_text.startswith("PLAIN_MESSAGE:"):
+            search_text = search_text.replace("PLAIN_MESSAGE:", "", 1)
+
+    return NotificationDisplay(
+        label=label[:100],  # Discord max 100 chars
+        description=description[:100],
+        value=f"{notif.id}|embed" if is_embed else f"{notif.id}|plain",
+        search_text_lower=search_text.lower()
+    )
+
+
 class BearTrap(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+        get_bear_trap_logger()
+
         self.db_path = 'db/beartime.sqlite'
         os.makedirs('db', exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self.conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False, cached_statements=256)
         self.cursor = self.conn.cursor()
 
         # Enable WAL mode for better concurrency with other cogs
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
         self.conn.commit()
 
+        # The cog's only writer after setup: db_execute and friends use it from worker threads under
+        # _db_lock, so no write ever blocks the event loop; self.conn is left to event-loop reads
+        self._worker_conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False, cached_statements=256)
+        self._worker_conn.execute("PRAGMA synchronous=NORMAL")
+        self._worker_conn.execute("PRAGMA temp_store=MEMORY")
+        self._worker_conn.execute("PRAGMA mmap_size=268435456")
+        self._db_lock = threading.Lock()
+
+        # Read-only connections for db_fetchone/db_fetchall; under WAL they read alongside the writer
+        self.read_pool_size = 4
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(self.read_pool_size):
+            reader = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=30.0,
+                                     check_same_thread=False, cached_statements=256)
+            reader.execute("PRAGMA temp_store=MEMORY")
+            reader.execute("PRAGMA mmap_size=268435456")
+            self._readers.put(reader)
+
+        # bear_notification_embeds rows for previews: notification_id -> (fetched_at, row)
+        self._embed_cache: dict[int, tuple[float, tuple | None]] = {}
+        self.embed_cache_ttl = 30
+        # Rendered PreviewButton output: notification_id -> (source key, (content, embed, embed_json))
+        self._preview_cache: dict[int, tuple] = {}
+
+        # Companion cogs (schedule, templates, editor, ...) by name, filled on first successful lookup
+        self._linked_cogs: dict[str, commands.Cog] = {}
+
+        # bear_trap_settings deletion columns per guild: guild_id -> (delete_messages_enabled, default_delete_delay_minutes)
+        self._settings_cache: dict[int, tuple[int, int]] = {}
+
+        # Sorted role/member mention options per guild, invalidated by member/role events
+        self._mention_options: dict[int, list[discord.SelectOption]] = {}
+
         # Rate limiting for channel unavailable warnings
         self.channel_warning_timestamps = {}
         self.channel_warning_interval = 300
@@ -196,15 +567,47 @@ class BearTrap(commands.Cog):
         except sqlite3.OperationalError:
             self.cursor.execute("ALTER TABLE bear_trap_settings ADD COLUMN show_daily_reset_on_schedule INTEGER DEFAULT 0")
 
+        # Message kind derived from the description prefix (see NOTIFICATION_KIND_*), kept in sync by triggers
+        try:
+            self.cursor.execute("SELECT message_kind FROM bear_notifications LIMIT 1")
+        except sqlite3.OperationalError:
+            self.cursor.execute("ALTER TABLE bear_notifications ADD COLUMN message_kind INTEGER DEFAULT 0")
+            self.cursor.execute(f"UPDATE bear_notifications SET message_kind = {MESSAGE_KIND_SQL_TMPL.format(col='description')}")
+        for trigger_event in ("INSERT", "UPDATE OF description"):
+            trigger_name = "trg_bear_notifications_kind_" + trigger_event.split()[0].lower()
+            self.cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {trigger_name}
+                AFTER {trigger_event} ON bear_notifications
+                BEGIN
+                    UPDATE bear_notifications SET message_kind = {MESSAGE_KIND_SQL_TMPL.format(col='NEW.description')}
+                    WHERE id = NEW.id;
+                END
+            """)
+
         # Initialize default settings for all guilds with notifications
         self.cursor.execute("""
             INSERT OR IGNORE INTO bear_trap_settings (guild_id, delete_messages_enabled, default_delete_delay_minutes, show_daily_reset_on_schedule)
             SELECT DISTINCT guild_id, 1, 60, 0 FROM bear_notifications
         """)
 
+        # Covering index so embed title lookups by notification are index-only
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_bne_nid_title ON bear_notification_embeds(notification_id, title)")
+        # Weekday lookups for a notification (SQL_GET_NOTIFICATION_DAYS) are index-only too
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_notification_days_nid ON notification_days(notification_id, weekday)")
+        # Partial covering index for the schedule cog's urgency scan of enabled, scheduled notifications
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_bear_notif_enabled_next
+            ON bear_notifications(is_enabled, next_notification, guild_id, channel_id)
+            WHERE next_notification IS NOT NULL
+        """)
+
         self.conn.commit()
 
     async def cog_load(self):
+        # The main menu view is stateless (timeout=None), so one instance serves every menu message.
+        # It is deliberately not registered with bot.add_view: custom_ids such as "main_menu" and
+        # "settings" are reused by other cogs' menus, and a global persistent view would capture them.
+        self.menu_view = BearTrapView(self)
 
         self.notification_task = asyncio.create_task(self.check_notifications())
         self.deletion_task = asyncio.create_task(self.check_message_deletions())
@@ -216,9 +619,14 @@ class BearTrap(commands.Cog):
         if hasattr(self, 'deletion_task'):
             self.deletion_task.cancel()
 
-        # Close database connection
+        # Close database connections
         if hasattr(self, 'conn'):
             self.conn.close()
+        if hasattr(self, '_worker_conn'):
+            self._worker_conn.close()
+        if hasattr(self, '_readers'):
+            while not self._readers.empty():
+                self._readers.get_nowait().close()
 
     def should_warn_about_channel(self, channel_id: int) -> bool:
         """Check if we should warn about this channel being unavailable."""
@@ -230,6 +638,142 @@ class BearTrap(commands.Cog):
             return True
         return False
 
+    def _build_mention_options(self, guild: discord.Guild) -> list[discord.SelectOption]:
+        """Build and cache the @everyone/none, role and member mention options for a guild."""
+        options = [
+            discord.SelectOption(
+                label="@everyone",
+                value="everyone",
+                description="Mention everyone in the server",
+                emoji=theme.announceIcon
+            ),
+            discord.SelectOption(
+                label="No Mention",
+                value="none",
+                description="Don't mention anyone",
+                emoji=theme.muteIcon
+            )
+        ]
+
+        roles = sorted(
+            [role for role in guild.roles if not role.is_default() and not role.managed],
+            key=lambda r: r.position,
+            reverse=True
+        )
+
+        for role in roles:
+            options.append(
+                discord.SelectOption(
+                    label=role.name,
+                    value=f"role_{role.id}",
+                    description=f"Role with {len(role.members)} members",
+                    emoji=theme.membersIcon
+                )
+            )
+
+        members = sorted(
+            [member for member in guild.members if not member.bot],
+            key=lambda m: m.display_name.lower()
+        )
+
+        for member in members:
+            options.append(
+                discord.SelectOption(
+                    label=member.display_name,
+                    value=f"member_{member.id}",
+                    description=f"@{member.name}",
+                    emoji=theme.userIcon
+                )
+            )
+
+        self._mention_options[guild.id] = options
+        return options
+
+    def _invalidate_mention_options(self, guild: discord.Guild):
+        self._mention_options.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._invalidate_mention_options(member.guild)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._invalidate_mention_options(member.guild)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        self._invalidate_mention_options(after.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self._invalidate_mention_options(role.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._invalidate_mention_options(role.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self._invalidate_mention_options(after.guild)
+
+    def _run_read(self, query: str, params: tuple, fetch: str):
+        reader = self._readers.get()
+        try:
+            cursor = reader.execute(query, params)
+            return cursor.fetchone() if fetch == "one" else cursor.fetchall()
+        finally:
+            self._readers.put(reader)
+
+    def _run_db(self, query: str, params: tuple, fetch: str | None, commit: bool):
+        if fetch and not commit:
+            return self._run_read(query, params, fetch)
+        with self._db_lock:
+            try:
+                cursor = self._worker_conn.execute(query, params)
+                if fetch == "one":
+                    result = cursor.fetchone()
+                elif fetch == "all":
+                    result = cursor.fetchall()
+                elif fetch == "lastrowid":
+                    result = cursor.lastrowid
+                else:
+                    result = cursor.rowcount
+                if commit:
+                    self._worker_conn.commit()
+                return result
+            except Exception:
+                self._worker_conn.rollback()
+                raise
+
+    async def db_fetchone(self, query: str, params: tuple = (), commit: bool = False):
+        """Run a statement on a worker thread and return the first row, committing if asked (e.g. for RETURNING)."""
+        return await asyncio.to_thread(self._run_db, query, params, "one", commit)
+
+    async def db_fetchall(self, query: str, params: tuple = ()) -> list:
+        """Run a SELECT on a worker thread and return all rows."""
+        return await asyncio.to_thread(self._run_db, query, params, "all", False)
+
+    async def db_execute(self, query: str, params: tuple = ()) -> int:
+        """Run a write statement on a worker thread and commit it. Returns the rowcount."""
+        return await asyncio.to_thread(self._run_db, query, params, None, True)
+
+    async def db_insert(self, query: str, params: tuple = ()) -> int:
+        """Run an INSERT on a worker thread and commit it. Returns the new row id."""
+        return await asyncio.to_thread(self._run_db, query, params, "lastrowid", True)
+
+    def _run_db_many(self, query: str, seq_of_params: list):
+        with self._db_lock:
+            try:
+                self._worker_conn.executemany(query, seq_of_params)
+                self._worker_conn.commit()
+            except Exception:
+                self._worker_conn.rollback()
+                raise
+
+    async def db_executemany(self, query: str, seq_of_params: list):
+        """Run one write statement for every parameter tuple on a worker thread, in a single commit."""
+        await asyncio.to_thread(self._run_db_many, query, seq_of_params)
+
     async def save_notification(self, guild_id: int, channel_id: int, start_date: datetime,
                                 hour: int, minute: int, timezone: str, description: str,
                                 created_by: int, notification_type: int, mention_type: str,
@@ -261,7 +805,7 @@ class BearTrap(commands.Cog):
                 tzinfo=tz
             )
 
-            self.cursor.execute("""
+            notification_id = await self.db_insert("""
                 INSERT INTO bear_notifications
                 (guild_id, channel_id, hour, minute, timezone, description, notification_type,
                 mention_type, repeat_enabled, repeat_minutes, created_by, next_notification, event_type, wizard_batch_id, instance_identifier)
@@ -270,24 +814,20 @@ class BearTrap(commands.Cog):
                   mention_type, 1 if repeat_enabled else 0, repeat_minutes, created_by,
                   next_notification.isoformat(), event_type, wizard_batch_id, instance_identifier))
 
-            notification_id = self.cursor.lastrowid
-
             if embed_data:
                 await self.save_notification_embed(notification_id, embed_data)
             if repeat_minutes == -1:
                 await self.save_notification_fixed(notification_id, selected_weekdays)
 
-            self.conn.commit()
-
             # Notify schedule boards of new notification (skip if bulk creating)
             if not skip_board_update:
-                schedule_cog = self.bot.get_cog("BearTrapSchedule")
+                schedule_cog = self.get_linked_cog("BearTrapSchedule")
                 if schedule_cog:
                     await schedule_cog.on_notification_created(guild_id, channel_id)
 
             return notification_id
-        except Exception as e:
-            print(f"Error saving notification: {e}")
+        except Exception:
+            logger.exception("Error saving notification")
             raise
 
     async def update_notification(self, notification_id: int, hour: int, minute: int, timezone: str,
@@ -318,7 +858,7 @@ class BearTrap(commands.Cog):
                     next_notification = current_next.replace(hour=hour, minute=minute, second=0, microsecond=0)
                 else:
                     next_notification = datetime.now(tz).replace(hour=hour, minute=minute, second=0, microsecond=0)
-            self.cursor.execute("""
+            await self.db_execute("""
                 UPDATE bear_notifications
                 SET hour = ?, minute = ?, timezone = ?, description = ?, notification_type = ?,
                     mention_type = ?, repeat_minutes = ?, event_type = ?, next_notification = ?,
@@ -328,27 +868,28 @@ class BearTrap(commands.Cog):
                   mention_type, repeat_minutes, event_type, next_notification.isoformat(),
                   instance_identifier, notification_id))
             if embed_data:
-                self.cursor.execute("DELETE FROM bear_notification_embeds WHERE notification_id = ?", (notification_id,))
+                await self.db_execute("DELETE FROM bear_notification_embeds WHERE notification_id = ?", (notification_id,))
+                self.invalidate_notification_cache(notification_id)
                 await self.save_notification_embed(notification_id, embed_data)
             if repeat_minutes == -1 and selected_weekdays:
-                self.cursor.execute("DELETE FROM notification_days WHERE notification_id = ?", (notification_id,))
+                await self.db_execute("DELETE FROM notification_days WHERE notification_id = ?", (notification_id,))
                 await self.save_notification_fixed(notification_id, selected_weekdays)
-            self.conn.commit()
             if not skip_board_update:
-                schedule_cog = self.bot.get_cog("BearTrapSchedule")
+                schedule_cog = self.get_linked_cog("BearTrapSchedule")
                 if schedule_cog:
                     self.cursor.execute("SELECT guild_id, channel_id FROM bear_notifications WHERE id = ?", (notification_id,))
                     row = self.cursor.fetchone()
                     if row:
                         await schedule_cog.on_notification_created(row[0], row[1])
             return True
-        except Exception as e:
-            print(f"Error updating notification: {e}")
+        except Exception:
+            logger.exception("Error updating notification")
             return False
 
     async def save_notification_embed(self, notification_id: int, embed_data: dict) -> bool:
         try:
-            self.cursor.execute("""
+            self.invalidate_notification_cache(notification_id)
+            await self.db_execute("""
                 INSERT INTO bear_notification_embeds 
                 (notification_id, title, description, color, image_url, thumbnail_url, footer, author, mention_message)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -363,10 +904,9 @@ class BearTrap(commands.Cog):
                 embed_data.get('author'),
                 embed_data.get('mention_message')
             ))
-            self.conn.commit()
             return True
-        except Exception as e:
-            print(f"Error saving embed: {e}")
+        except Exception:
+            logger.exception("Error saving embed")
             return False
 
     async def save_notification_fixed(self, notification_id: int, weekdays: list[int]):
@@ -377,14 +917,12 @@ class BearTrap(commands.Cog):
             sorted_days = sorted(weekdays)
             weekday = "|".join(str(d) for d in sorted_days)
 
-            self.cursor.execute("""
+            await self.db_execute("""
                 INSERT INTO notification_days (notification_id, weekday)
                 VALUES (?, ?)
             """, (notification_id, weekday))
-
-            self.conn.commit()
-        except Exception as e:
-            print(f"Error saving fixed weekdays: {e}")
+        except Exception:
+            logger.exception("Error saving fixed weekdays")
             raise
 
     async def get_notification_embed(self, notification_id: int) -> dict:
@@ -408,8 +946,8 @@ class BearTrap(commands.Cog):
                     'mention_message': result[7]
                 }
             return None
-        except Exception as e:
-            print(f"Error getting embed: {e}")
+        except Exception:
+            logger.exception("Error getting embed")
             return None
 
     async def check_message_deletions(self):
@@ -431,6 +969,7 @@ class BearTrap(commands.Cog):
 
                 rows = self.cursor.fetchall()
 
+                deleted = []
                 for history_id, message_id, channel_id in rows:
                     try:
                         channel = self.bot.get_channel(channel_id)
@@ -441,20 +980,22 @@ class BearTrap(commands.Cog):
                             except (discord.NotFound, discord.Forbidden, discord.HTTPException):
                                 # Message already deleted, no permission, or other error
                                 pass
-                    except Exception as e:
-                        print(f"Error deleting message {message_id}: {e}")
+                    except Exception:
+                        logger.exception("Error deleting message %s", message_id)
                     finally:
                         # Mark as deleted regardless
-                        self.cursor.execute("""
-                            UPDATE notification_history
-                            SET deleted_at = ?
-                            WHERE id = ?
-                        """, (now.isoformat(), history_id))
+                        deleted.append((now.isoformat(), history_id))
 
-                self.conn.commit()
+                # Write once after the Discord calls, so no transaction stays open across awaits
+                if deleted:
+                    await self.db_executemany("""
+                        UPDATE notification_history
+                        SET deleted_at = ?
+                        WHERE id = ?
+                    """, deleted)
 
-            except Exception as e:
-                print(f"Error in message deletion checker: {e}")
+            except Exception:
+                logger.exception("Error in message deletion checker")
 
             await asyncio.sleep(10)  # Check every 10 seconds
 
@@ -477,27 +1018,58 @@ class BearTrap(commands.Cog):
                 for notification in notifications:
                     try:
                         await self.process_notification(notification)
-                    except Exception as e:
-                        print(f"Error processing notification {notification[0]}: {e}")
+                    except Exception:
+                        logger.exception("Error processing notification %s", notification[0])
                         continue
 
-            except Exception as e:
-                print(f"Error in notification checker: {e}")
+            except Exception:
+                logger.exception("Error in notification checker")
 
             await asyncio.sleep(0.1)
 
     def get_guild_deletion_settings(self, guild_id: int) -> tuple[bool, int]:
         """Get deletion settings for a guild. Returns (enabled, default_delay_minutes)"""
-        self.cursor.execute("""
-            SELECT delete_messages_enabled, default_delete_delay_minutes
-            FROM bear_trap_settings
-            WHERE guild_id = ?
-        """, (guild_id,))
-        row = self.cursor.fetchone()
-        if row:
-            return (bool(row[0]), row[1])
-        # Default if not found
-        return (True, 60)
+        row = self._settings_cache.get(guild_id)
+        if row is None:
+            self.cursor.execute(SQL_GET_DELETION_SETTINGS, (guild_id,))
+            row = self.cursor.fetchone()
+            if not row:
+                # Default if not found
+                return (True, 60)
+            self._settings_cache[guild_id] = row
+        return (bool(row[0]), row[1])
+
+    async def ensure_deletion_settings(self, guild_id: int) -> tuple[int, int]:
+        """Get the guild's cached deletion settings row, creating the defaults on first use.
+        Returns (delete_messages_enabled, default_delete_delay_minutes)."""
+        row = self._settings_cache.get(guild_id)
+        if row is None:
+            row = await self.db_fetchone(SQL_ENSURE_DELETION_SETTINGS, (guild_id,), commit=True)
+            self._settings_cache[guild_id] = row
+        return row
+
+    linked_cog_names = ("BearTrapSchedule", "BearTrapTemplates", "BearTrapWizard", "NotificationEditor", "Alliance")
+
+    def get_linked_cog(self, name: str):
+        """Return a companion cog by name, caching it once it has loaded.
+
+        Cogs are loaded once at startup and never reloaded, so a found cog stays valid.
+        A miss picks up every companion cog loaded so far in one pass over bot.cogs;
+        missing cogs are not cached, letting a cog that loads after this one be found later.
+        """
+        cog = self._linked_cogs.get(name)
+        if cog is None:
+            loaded = self.bot.cogs
+            for linked_name in self.linked_cog_names:
+                linked = loaded.get(linked_name)
+                if linked is not None:
+                    self._linked_cogs[linked_name] = linked
+            cog = self._linked_cogs.get(name) or loaded.get(name)
+        return cog
+
+    def invalidate_settings(self, guild_id: int):
+        """Drop the cached deletion settings for a guild after its bear_trap_settings row changes."""
+        self._settings_cache.pop(guild_id, None)
 
     def calculate_delete_time(self, guild_id: int, event_type: str,
                               custom_delete_delay: int, notification_times: list, current_time: int,
@@ -523,7 +1095,6 @@ class BearTrap(commands.Cog):
             delay_minutes = custom_delete_delay
         # 2. Check for event type duration
         elif event_type:
-            from .bear_event_types import get_event_config
             event_config = get_event_config(event_type)
             if event_config:
                 event_duration = event_config.get("duration_minutes", default_delay)
@@ -544,7 +1115,7 @@ class BearTrap(commands.Cog):
         current_time_str = datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S')
         delete_at_str = scheduled_delete_at.isoformat() if scheduled_delete_at else None
 
-        self.cursor.execute("""
+        await self.db_execute("""
             INSERT INTO notification_history
             (notification_id, notification_time, message_id, channel_id, scheduled_delete_at, sent_at)
             VALUES (?, ?, ?, ?, ?, ?)
@@ -596,24 +1167,26 @@ class BearTrap(commands.Cog):
                 """, (notification_id,))
 
             rows = self.cursor.fetchall()
+            deleted = []
             for history_id, message_id in rows:
                 try:
                     msg = await channel.fetch_message(message_id)
                     await msg.delete()
-                except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
+                except (discord.NotFound, discord.Forbidden, discord.HTTPException):
                     # Message already deleted, no permission, or other error
                     pass
                 finally:
                     # Mark as deleted regardless
-                    self.cursor.execute("""
-                        UPDATE notification_history
-                        SET deleted_at = ?
-                        WHERE id = ?
-                    """, (datetime.now(pytz.UTC).isoformat(), history_id))
+                    deleted.append((datetime.now(pytz.UTC).isoformat(), history_id))
 
-            self.conn.commit()
-        except Exception as e:
-            print(f"Error deleting previous notifications: {e}")
+            if deleted:
+                await self.db_executemany("""
+                    UPDATE notification_history
+                    SET deleted_at = ?
+                    WHERE id = ?
+                """, deleted)
+        except Exception:
+            logger.exception("Error deleting previous notifications")
 
     async def process_notification(self, notification):
         id = None  # Initialize to avoid UnboundLocalError in exception handler
@@ -629,7 +1202,7 @@ class BearTrap(commands.Cog):
             channel = self.bot.get_channel(channel_id)
             if not channel:
                 if self.should_warn_about_channel(channel_id):
-                    print(f"Warning: Channel {channel_id} not found for notification {id}.")
+                    logger.warning(f"Channel {channel_id} not found for notification {id}.")
                 return
 
             tz = pytz.timezone(timezone)
@@ -645,10 +1218,7 @@ class BearTrap(commands.Cog):
                         next_time = next_time + timedelta(minutes=repeat_minutes * periods_passed)
 
                     elif repeat_minutes == -1:
-                        self.cursor.execute("""
-                                    SELECT weekday FROM notification_days
-                                    WHERE notification_id = ?
-                                """, (id,))
+                        self.cursor.execute(SQL_GET_NOTIFICATION_DAYS, (id,))
                         rows = self.cursor.fetchall()
                         notification_days = set()
 
@@ -670,12 +1240,11 @@ class BearTrap(commands.Cog):
                     if next_time < now:
                         next_time = next_time + timedelta(days=1)
 
-                self.cursor.execute("""
+                await self.db_execute("""
                     UPDATE bear_notifications 
                     SET next_notification = ? 
                     WHERE id = ?
                 """, (next_time.isoformat(), id))
-                self.conn.commit()
                 return
 
             time_until = next_time - now
@@ -778,7 +1347,6 @@ class BearTrap(commands.Cog):
                 # Get event emoji from event_types config
                 event_emoji = ""
                 if event_type:
-                    from .bear_event_types import get_event_icon
                     event_emoji = get_event_icon(event_type)
 
                 # Format event time in user's timezone
@@ -791,7 +1359,6 @@ class BearTrap(commands.Cog):
                 # Check if event has instance-specific descriptions
                 actual_description = description
                 if event_type and instance_identifier and "EMBED_MESSAGE:" not in description:
-                    from .bear_event_types import get_event_config
                     event_config = get_event_config(event_type)
                     if event_config and "descriptions" in event_config:
                         descriptions_dict = event_config["descriptions"]
@@ -833,7 +1400,6 @@ class BearTrap(commands.Cog):
 
                                 # Override with instance-specific description if available
                                 if event_type and instance_identifier:
-                                    from .bear_event_types import get_event_config
                                     event_config = get_event_config(event_type)
                                     if event_config and "descriptions" in event_config:
                                         descriptions_dict = event_config["descriptions"]
@@ -923,16 +1489,16 @@ class BearTrap(commands.Cog):
                                     else:
                                         msg = await channel.send(f"{mention_text} ⏰ **Notification**")
                                     sent_message_ids.append(msg.id)
-                            except Exception as e:
-                                print(f"Error creating embed: {e}")
+                            except Exception:
+                                logger.exception("Error creating embed")
                                 if rounded_time > 0:
                                     msg = await channel.send(
                                         f"{mention_text} ⏰ **Error sending embed notification** will start in **{time_text}**!")
                                 else:
                                     msg = await channel.send(f"{mention_text} ⏰ **Error sending embed notification**")
                                 sent_message_ids.append(msg.id)
-                    except Exception as e:
-                        print(f"Error creating embed: {e}")
+                    except Exception:
+                        logger.exception("Error creating embed")
                         if rounded_time > 0:
                             msg = await channel.send(
                                 f"{mention_text} ⏰ **Error sending embed notification** will start in **{time_text}**!")
@@ -988,7 +1554,7 @@ class BearTrap(commands.Cog):
                         id, current_time, channel_id, message_id, scheduled_delete_at
                     )
 
-                self.cursor.execute("""
+                await self.db_execute("""
                     UPDATE bear_notifications 
                     SET last_notification = ? 
                     WHERE id = ?
@@ -1013,9 +1579,9 @@ class BearTrap(commands.Cog):
                         if len(parts) > 1:
                             desc_preview = parts[1][:50]
 
-                    print(f"[INFO] Notification {id} - {event_display} {time_str} ({desc_preview}) was disabled since it is not set to repeat")
+                    logger.info(f"Notification {id} - {event_display} {time_str} ({desc_preview}) was disabled since it is not set to repeat")
 
-                    self.cursor.execute("""
+                    await self.db_execute("""
                         UPDATE bear_notifications
                         SET is_enabled = 0
                         WHERE id = ?
@@ -1027,10 +1593,7 @@ class BearTrap(commands.Cog):
                         next_time = current_next + timedelta(minutes=repeat_minutes)
 
                     elif repeat_minutes == -1:
-                        self.cursor.execute("""
-                                    SELECT weekday FROM notification_days
-                                    WHERE notification_id = ?
-                                """, (id,))
+                        self.cursor.execute(SQL_GET_NOTIFICATION_DAYS, (id,))
                         rows = self.cursor.fetchall()
                         notification_days = set()
 
@@ -1044,30 +1607,28 @@ class BearTrap(commands.Cog):
                                 next_time = potential_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
                                 break
 
-                    self.cursor.execute("""
+                    await self.db_execute("""
                         UPDATE bear_notifications
                         SET next_notification = ?
                         WHERE id = ?
                     """, (next_time.isoformat(), id))
 
-                self.conn.commit()
-
                 # Notify schedule boards after sending notification
-                schedule_cog = self.bot.get_cog("BearTrapSchedule")
+                schedule_cog = self.get_linked_cog("BearTrapSchedule")
                 if schedule_cog:
                     await schedule_cog.on_notification_sent(guild_id, channel_id)
 
-        except Exception as e:
+        except Exception:
             notif_id = id if id is not None else "unknown"
-            error_msg = f"[ERROR] Error processing notification {notif_id}: {str(e)}\nType: {type(e)}\nTrace: {traceback.format_exc()}"
-            print(error_msg)
+            logger.exception("Error processing notification %s", notif_id)
 
-    async def get_notifications(self, guild_id: int) -> list:
+    async def get_notifications(self, guild_id: int) -> list[Notification]:
         try:
             self.cursor.execute("""
                 SELECT id, guild_id, channel_id, hour, minute, timezone, description,
                        notification_type, mention_type, repeat_enabled, repeat_minutes,
-                       is_enabled, created_at, created_by, last_notification, next_notification, event_type, custom_delete_delay_minutes
+                       is_enabled, created_at, created_by, last_notification, next_notification, event_type, custom_delete_delay_minutes,
+                       message_kind
                 FROM bear_notifications
                 WHERE guild_id = ?
                 ORDER BY
@@ -1077,14 +1638,71 @@ class BearTrap(commands.Cog):
                     END,
                     next_notification
             """, (guild_id,))
-            return self.cursor.fetchall()
-        except Exception as e:
-            print(f"Error getting notifications: {e}")
+            return [Notification(*row) for row in self.cursor.fetchall()]
+        except Exception:
+            logger.exception("Error getting notifications")
             return []
 
+    async def build_notification_displays(self, guild: discord.Guild, notifications: list) -> dict:
+        """Build the NotificationDisplay for every row in one pass, keyed by notification id."""
+        try:
+            embed_titles = await self.get_embed_titles(
+                [n.id for n in notifications if n.message_kind == NOTIFICATION_KIND_EMBED]
+            )
+        except Exception:
+            logger.exception("Error fetching embed titles")
+            embed_titles = {}
+        get_channel = guild.get_channel
+        return {
+            n.id: build_notification_display(n, get_channel(n.channel_id), embed_titles.get(n.id))
+            for n in notifications
+        }
+
+    async def get_notification_with_embed(self, notification_id: int) -> NotificationWithEmbed | None:
+        """Fetch the preview fields of a notification together with its embed row in one query.
+
+        A fresh cached embed row skips the join; otherwise the joined embed row refreshes the cache.
+        """
+        cached = self._embed_cache.get(notification_id)
+        if cached and time.time() - cached[0] < self.embed_cache_ttl:
+            row = await self.db_fetchone("""
+                SELECT channel_id, hour, minute, description, mention_type, next_notification, event_type
+                FROM bear_notifications WHERE id = ?
+            """, (notification_id,))
+            return NotificationWithEmbed(*row, cached[1]) if row else None
+
+        row = await self.db_fetchone("""
+            SELECT n.channel_id, n.hour, n.minute, n.description, n.mention_type, n.next_notification, n.event_type,
+                   e.notification_id, e.title, e.description, e.color, e.footer, e.author,
+                   e.image_url, e.thumbnail_url, e.mention_message
+            FROM bear_notifications n
+            LEFT JOIN bear_notification_embeds e ON e.notification_id = n.id
+            WHERE n.id = ?
+        """, (notification_id,))
+        if not row:
+            return None
+        embed_row = NotificationEmbed(*row[8:]) if row[7] is not None else None
+        self._embed_cache[notification_id] = (time.time(), embed_row)
+        return NotificationWithEmbed(*row[:7], embed_row)
+
+    def invalidate_notification_cache(self, notification_id: int):
+        """Drop cached data for a notification after it is edited or deleted."""
+        self._embed_cache.pop(notification_id, None)
+        self._preview_cache.pop(notification_id, None)
+
+    async def get_embed_titles(self, notification_ids: list[int]) -> dict[int, str]:
+        """Fetch embed titles for several notifications in one query, keyed by notification id."""
+        if not notification_ids:
+            return {}
+        placeholders = ",".join("?" * len(notification_ids))
+        rows = await self.db_fetchall(f"""
+            SELECT notification_id, title FROM bear_notification_embeds
+            WHERE notification_id IN ({placeholders})
+        """, tuple(notification_ids))
+        return dict(rows)
+
     async def delete_notification(self, notification_id):
         try:
-            # Ensure we're using the same connection as toggle_notification
             self.cursor.execute("""SELECT id, guild_id, channel_id FROM bear_notifications WHERE id = ?""", (notification_id,))
             result = self.cursor.fetchone()
             if not result:
@@ -1093,17 +1711,17 @@ class BearTrap(commands.Cog):
             notif_id, guild_id, channel_id = result
 
             # If the notification exists, proceed to delete
-            self.cursor.execute("""DELETE FROM bear_notifications WHERE id = ?""", (notification_id,))
-            self.conn.commit()  # Commit the changes using the same connection as toggle_notification
+            await self.db_execute("""DELETE FROM bear_notifications WHERE id = ?""", (notification_id,))
+            self.invalidate_notification_cache(notification_id)
 
             # Notify schedule boards of deletion
-            schedule_cog = self.bot.get_cog("BearTrapSchedule")
+            schedule_cog = self.get_linked_cog("BearTrapSchedule")
             if schedule_cog:
                 await schedule_cog.on_notification_deleted(guild_id, channel_id)
 
             return True
-        except Exception as e:
-            print(f"[ERROR] Error deleting notification {notification_id}: {e}")
+        except Exception:
+            logger.exception("Error deleting notification %s", notification_id)
             return False
 
     def get_wizard_notifications_for_channel(self, guild_id: int, channel_id: int) -> dict:
@@ -1131,8 +1749,8 @@ class BearTrap(commands.Cog):
                         "description": row[8]
                     }
             return notifications
-        except Exception as e:
-            print(f"Error getting wizard notifications: {e}")
+        except Exception:
+            logger.exception("Error getting wizard notifications")
             return {}
 
     def get_all_wizard_notifications_for_channel(self, guild_id: int, channel_id: int) -> list:
@@ -1161,63 +1779,72 @@ class BearTrap(commands.Cog):
                     "is_enabled": row[10]
                 })
             return notifications
-        except Exception as e:
-            print(f"Error getting all wizard notifications: {e}")
+        except Exception:
+            logger.exception("Error getting all wizard notifications")
             return []
 
-    def delete_wizard_notifications_for_channel(self, guild_id: int, channel_id: int, event_types_to_keep: list = None) -> int:
+    async def delete_wizard_notifications_for_channel(self, guild_id: int, channel_id: int, event_types_to_keep: list = None) -> int:
         """Delete wizard notifications that are no longer needed"""
         try:
             wizard_batch_id = f"wizard_{guild_id}_{channel_id}"
             if event_types_to_keep:
                 placeholders = ",".join(["?"] * len(event_types_to_keep))
-                self.cursor.execute(f"""
+                return await self.db_execute(f"""
                     DELETE FROM bear_notifications
                     WHERE guild_id = ? AND channel_id = ? AND wizard_batch_id = ?
                     AND event_type NOT IN ({placeholders})
                 """, (guild_id, channel_id, wizard_batch_id, *event_types_to_keep))
-            else:
-                self.cursor.execute("""
-                    DELETE FROM bear_notifications
-                    WHERE guild_id = ? AND channel_id = ? AND wizard_batch_id = ?
-                """, (guild_id, channel_id, wizard_batch_id))
-            deleted_count = self.cursor.rowcount
-            self.conn.commit()
-            return deleted_count
-        except Exception as e:
-            print(f"Error deleting wizard notifications: {e}")
+            return await self.db_execute("""
+                DELETE FROM bear_notifications
+                WHERE guild_id = ? AND channel_id = ? AND wizard_batch_id = ?
+            """, (guild_id, channel_id, wizard_batch_id))
+        except Exception:
+            logger.exception("Error deleting wizard notifications")
             return 0
 
     async def toggle_notification(self, notification_id: int, enabled: bool, skip_board_update: bool = False) -> bool:
         try:
-
-            self.cursor.execute("""
-                SELECT is_enabled, guild_id, channel_id FROM bear_notifications WHERE id = ?
-            """, (notification_id,))
-            result = self.cursor.fetchone()
-            if not result:
-                return False
-
-            old_enabled, guild_id, channel_id = result
-
-            self.cursor.execute("""
+            result = await self.db_fetchone("""
                 UPDATE bear_notifications
                 SET is_enabled = ?
                 WHERE id = ?
-            """, (1 if enabled else 0, notification_id))
-            self.conn.commit()
+                RETURNING guild_id, channel_id
+            """, (1 if enabled else 0, notification_id), commit=True)
+            if not result:
+                return False
+
+            guild_id, channel_id = result
 
             # Notify schedule boards of toggle
             if not skip_board_update:
-                schedule_cog = self.bot.get_cog("BearTrapSchedule")
+                schedule_cog = self.get_linked_cog("BearTrapSchedule")
                 if schedule_cog:
                     await schedule_cog.on_notification_toggled(guild_id, channel_id)
 
             return True
-        except Exception as e:
-            print(f"Error toggling notification: {e}")
+        except Exception:
+            logger.exception("Error toggling notification")
             return False
 
+    async def flip_notification(self, notification_id: int) -> bool | None:
+        """Invert is_enabled in a single statement. Returns the new state, or None if the notification is gone."""
+        result = await self.db_fetchone("""
+            UPDATE bear_notifications
+            SET is_enabled = NOT is_enabled
+            WHERE id = ?
+            RETURNING is_enabled, guild_id, channel_id
+        """, (notification_id,), commit=True)
+        if not result:
+            return None
+
+        new_enabled, guild_id, channel_id = result
+
+        schedule_cog = self.get_linked_cog("BearTrapSchedule")
+        if schedule_cog:
+            await schedule_cog.on_notification_toggled(guild_id, channel_id)
+
+        return bool(new_enabled)
+
     async def show_bear_trap_menu(self, interaction: discord.Interaction):
         try:
             embed = discord.Embed(
@@ -1256,15 +1883,15 @@ class BearTrap(commands.Cog):
             embed.set_footer(text="Last Updated")
             embed.timestamp = datetime.now()
 
-            view = BearTrapView(self)
+            view = self.menu_view
 
             try:
                 await interaction.response.edit_message(embed=embed, view=view)
             except discord.InteractionResponded:
                 pass
 
-        except Exception as e:
-            print(f"Error in show_bear_trap_menu: {e}")
+        except Exception:
+            logger.exception("Error in show_bear_trap_menu")
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     f"{theme.deniedIcon} An error occurred. Please try again.",
@@ -1311,8 +1938,8 @@ class BearTrap(commands.Cog):
                 view=view
             )
 
-        except Exception as e:
-            print(f"Error in show_channel_selection: {e}")
+        except Exception:
+            logger.exception("Error in show_channel_selection")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while showing channel selection!",
                 ephemeral=True
@@ -1451,8 +2078,8 @@ class RepeatOptionView(discord.ui.View):
                 view=None
             )
 
-        except Exception as e:
-            print(f"Error saving notification: {e}")
+        except Exception:
+            logger.exception("Error saving notification")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while saving the notification.",
                 ephemeral=True
@@ -1559,8 +2186,8 @@ class RepeatIntervalModal(discord.ui.Modal):
 
             await self.repeat_view.save_notification(interaction, True, total_minutes, interval_text)
 
-        except Exception as e:
-            print(f"Error in repeat interval modal: {e}")
+        except Exception:
+            logger.exception("Error in repeat interval modal")
             await interaction.response.send_message(
                 f"{theme.deniedIcon} An error occurred while setting the repeat interval.",
                 ephemeral=True
@@ -1670,26 +2297,21 @@ class EmbedEditorView(discord.ui.View):
             example_event_time = f"{self.hour:02d}:{self.minute:02d}"
             example_date = self.start_date.strftime("%b %d") if self.start_date else "Dec 06"
 
-            def replace_variables(text):
-                """Replace all notification variables with sample values for preview."""
-                return (text
-                    .replace("%t", example_time)
-                    .replace("{time}", example_time)
-                    .replace("%n", example_name)
-                    .replace("%e", example_event_time)
-                    .replace("%d", example_date)
-                    .replace("%i", example_emoji))
+            preview_values = {
+                "%t": example_time, "{time}": example_time, "%n": example_name,
+                "%e": example_event_time, "%d": example_date, "%i": example_emoji,
+            }
 
             embed = discord.Embed(color=self.embed_data.get("color", discord.Color.blue().value))
 
             if "title" in self.embed_data:
-                embed.title = replace_variables(self.embed_data["title"])
+                embed.title = replace_preview_vars(self.embed_data["title"], preview_values)
             if "description" in self.embed_data:
-                embed.description = replace_variables(self.embed_data["description"])
+                embed.description = replace_preview_vars(self.embed_data["description"], preview_values)
             if "footer" in self.embed_data:
-                embed.set_footer(text=replace_variables(self.embed_data["footer"]))
+                embed.set_footer(text=replace_preview_vars(self.embed_data["footer"], preview_values))
             if "author" in self.embed_data:
-                embed.set_author(name=replace_variables(self.embed_data["author"]))
+                embed.set_author(name=replace_preview_vars(self.embed_data["author"], preview_values))
             if "image_url" in self.embed_data and self.embed_data["image_url"]:
                 embed.set_image(url=self.embed_data["image_url"])
             if "thumbnail_url" in self.embed_data and self.embed_data["thumbnail_url"]:
@@ -1697,7 +2319,7 @@ class EmbedEditorView(discord.ui.View):
 
             mention_preview = self.embed_data.get('mention_message', '@tag')
             if mention_preview:
-                mention_preview = replace_variables(mention_preview)
+                mention_preview = replace_preview_vars(mention_preview, preview_values)
 
             content = (
                 f"{theme.editListIcon} **Embed Editor**\n\n"
@@ -1712,8 +2334,8 @@ class EmbedEditorView(discord.ui.View):
                 await interaction.followup.edit_message(message_id=interaction.message.id, content=content, embed=embed,
                                                         view=self)
 
-        except Exception as e:
-            print(f"Error updating embed: {e}")
+        except Exception:
+            logger.exception("Error updating embed")
             try:
                 await interaction.followup.send(f"{theme.deniedIcon} An error occurred while updating the embed!", ephemeral=True)
             except:
@@ -1736,8 +2358,8 @@ class EmbedEditorView(discord.ui.View):
                 self.embed_data["mention_message"] = modal.value
                 await self.update_embed(interaction)
 
-        except Exception as e:
-            print(f"Error in edit_mention_message: {e}")
+        except Exception:
+            logger.exception("Error in edit_mention_message")
             await interaction.followup.send(f"{theme.deniedIcon} An error occurred while editing the mention message!", ephemeral=True)
 
     @discord.ui.button(label="Title", style=discord.ButtonStyle.primary, row=0)
@@ -1757,8 +2379,8 @@ class EmbedEditorView(discord.ui.View):
                 self.embed_data["title"] = modal.value
                 await self.update_embed(interaction)
 
-        except Exception as e:
-            print(f"Error in edit_title: {e}")
+        except Exception:
+            logger.exception("Error in edit_title")
             await interaction.followup.send(f"{theme.deniedIcon} An error occurred while editing the title!", ephemeral=True)
 
     @discord.ui.button(label="Description", style=discord.ButtonStyle.primary, row=0)
@@ -1779,8 +2401,8 @@ class EmbedEditorView(discord.ui.View):
                 self.embed_data["description"] = modal.value
                 await self.update_embed(interaction)
 
-        except Exception as e:
-            print(f"Error in edit_description: {e}")
+        except Exception:
+            logger.exception("Error in edit_description")
             await interaction.followup.send(f"{theme.deniedIcon} An error occurred while editing the description!", ephemeral=True)
 
     @discord.ui.button(label="Color", style=discord.ButtonStyle.success, row=0)
@@ -1808,8 +2430,8 @@ class EmbedEditorView(discord.ui.View):
                 except ValueError:
                     await interaction.followup.send(f"{theme.deniedIcon} Invalid color code! Example: #FF0000", ephemeral=True)
 
-        except Exception as e:
-            print(f"Error in edit_color: {e}")
+        except Exception:
+            logger.exception("Error in edit_color")
             await interaction.followup.send(f"{theme.deniedIcon} An error occurred while editing the color!", ephemeral=True)
 
     @discord.ui.button(label="Footer", style=discord.ButtonStyle.secondary, row=1)
@@ -1829,8 +2451,8 @@ class EmbedEditorView(discord.ui.View):
                 self.embed_data["footer"] = modal.value
                 await self.update_embed(interaction)
 
-        except Exception as e:
-            print(f"Error in edit_footer: {e}")
+        except Exception:
+            logger.exception("Error in edit_footer")
             await interaction.followup.send(f"{theme.deniedIcon} An error occurred while editing the footer!", ephemeral=True)
 
     @discord.ui.button(label="Author", style=discord.ButtonStyle.secondary, row=1)
@@ -1850,8 +2472,8 @@ class EmbedEditorView(discord.ui.View):
                 self.embed_data["author"] = modal.value
                 await self.update_embed(interaction)
 
-        except Exception as e:
-            print(f"Error in edit_author: {e}")
+        except Exception:
+            logger.exception("Error in edit_author")
             await interaction.followup.send(f"{theme.deniedIcon} An error occurred while editing the author!", ephemeral=True)
 
     @discord.ui.button(label="Add Image", style=discord.ButtonStyle.secondary, row=2)
@@ -1876,8 +2498,8 @@ class EmbedEditorView(discord.ui.View):
                 self.embed_data["image_url"] = modal.value
                 await self.update_embed(interaction)
 
-        except Exception as e:
-            print(f"Error in add_image: {e}")
+        except Exception:
+            logger.exception("Error in add_image")
             await interaction.followup.send(f"{theme.deniedIcon} An error occurred while adding the image!", ephemeral=True)
 
     @discord.ui.button(label="Add Thumbnail", style=discord.ButtonStyle.secondary, row=2)
@@ -1902,8 +2524,8 @@ class EmbedEditorView(discord.ui.View):
                 self.embed_data["thumbnail_url"] = modal.value
                 await self.update_embed(interaction)
 
-        except Exception as e:
-            print(f"Error in add_thumbnail: {e}")
+        except Exception:
+            logger.exception("Error in add_thumbnail")
             await interaction.followup.send(f"{theme.deniedIcon} An error occurred while adding the thumbnail!", ephemeral=True)
 
     @discord.ui.button(label="Confirm", emoji=theme.verifiedIcon, style=discord.ButtonStyle.green, row=3)
@@ -1924,8 +2546,8 @@ class EmbedEditorView(discord.ui.View):
                 event_type=self.event_type
             )
 
-        except Exception as e:
-            print(f"Error in confirm button: {e}")
+        except Exception:
+            logger.exception("Error in confirm button")
             try:
                 await interaction.followup.send(
                     f"{theme.deniedIcon} An error occurred while confirming the embed! Please try again.",
@@ -1974,8 +2596,8 @@ class MessageTypeView(discord.ui.View):
                 view=view
             )
 
-        except Exception as e:
-            print(f"Error in embed_message: {e}")
+        except Exception:
+            logger.exception("Error in embed_message")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while starting the event type selection!",
                 ephemeral=True
@@ -2040,7 +2662,7 @@ class EventTypeSelectView(discord.ui.View):
             template_data = None
             if self.selected_event_type:
                 # Get templates cog to fetch template defaults
-                templates_cog = self.cog.bot.get_cog("BearTrapTemplates")
+                templates_cog = self.cog.get_linked_cog("BearTrapTemplates")
                 if templates_cog:
                     # Get templates for this event type
                     templates = templates_cog.get_templates_by_event_type(self.selected_event_type)
@@ -2078,24 +2700,18 @@ class EventTypeSelectView(discord.ui.View):
             example_event_time = f"{self.hour:02d}:{self.minute:02d}"
             example_date = self.start_date.strftime("%b %d") if self.start_date else "Dec 06"
 
-            def replace_vars(text):
-                if not text:
-                    return text
-                return (text
-                    .replace("%t", example_time)
-                    .replace("{time}", example_time)
-                    .replace("%n", example_name)
-                    .replace("%e", example_event_time)
-                    .replace("%d", example_date)
-                    .replace("%i", example_emoji))
+            preview_values = {
+                "%t": example_time, "{time}": example_time, "%n": example_name,
+                "%e": example_event_time, "%d": example_date, "%i": example_emoji,
+            }
 
             # Create preview embed with variables replaced
             embed = discord.Embed(
-                title=replace_vars(embed_data["title"]),
-                description=replace_vars(embed_data["description"]),
+                title=replace_preview_vars(embed_data["title"], preview_values),
+                description=replace_preview_vars(embed_data["description"], preview_values),
                 color=embed_data["color"]
             )
-            embed.set_footer(text=replace_vars(embed_data.get("footer", "Notification System")))
+            embed.set_footer(text=replace_preview_vars(embed_data.get("footer", "Notification System"), preview_values))
             if embed_data.get("image_url"):
                 embed.set_image(url=embed_data["image_url"])
             if embed_data.get("thumbnail_url"):
@@ -2125,10 +2741,8 @@ class EventTypeSelectView(discord.ui.View):
                 view=view
             )
 
-        except Exception as e:
-            print(f"Error in EventTypeSelectView continue: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error in EventTypeSelectView continue")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while loading the embed editor!",
                 ephemeral=True
@@ -2202,7 +2816,7 @@ class TimeSelectModal(discord.ui.Modal):
             min_length=8,
             max_length=10,
             required=True,
-            default=current_utc.strftime("%d/%m/%Y")
+            default=f"{current_utc.day:02d}/{current_utc.month:02d}/{current_utc.year}"
         )
 
         self.hour = discord.ui.TextInput(
@@ -2211,7 +2825,7 @@ class TimeSelectModal(discord.ui.Modal):
             min_length=1,
             max_length=2,
             required=True,
-            default=current_utc.strftime("%H")
+            default=f"{current_utc.hour:02d}"
         )
 
         self.minute = discord.ui.TextInput(
@@ -2220,7 +2834,7 @@ class TimeSelectModal(discord.ui.Modal):
             min_length=1,
             max_length=2,
             required=True,
-            default=current_utc.strftime("%M")
+            default=f"{current_utc.minute:02d}"
         )
 
         self.timezone = discord.ui.TextInput(
@@ -2305,8 +2919,8 @@ class TimeSelectModal(discord.ui.Modal):
                 f"{theme.deniedIcon} Invalid time format! Please use numbers for hour (0-23) and minute (0-59).",
                 ephemeral=True
             )
-        except Exception as e:
-            print(f"Error in time modal: {e}")
+        except Exception:
+            logger.exception("Error in time modal")
             await interaction.response.send_message(
                 f"{theme.deniedIcon} An error occurred while setting the time.",
                 ephemeral=True
@@ -2383,8 +2997,8 @@ class NotificationTypeView(discord.ui.View):
                 embed=embed,
                 view=view
             )
-        except Exception as e:
-            print(f"Error in show_mention_type_menu: {e}")
+        except Exception:
+            logger.exception("Error in show_mention_type_menu")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while showing mention options!",
                 ephemeral=True
@@ -2463,8 +3077,8 @@ class CustomTimesModal(discord.ui.Modal):
                 f"{theme.deniedIcon} Invalid input: {str(e)}",
                 ephemeral=True
             )
-        except Exception as e:
-            print(f"Error in custom times modal: {e}")
+        except Exception:
+            logger.exception("Error in custom times modal")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while processing custom times.",
                 ephemeral=True
@@ -2485,6 +3099,25 @@ class MentionTypeView(discord.ui.View):
         self.original_message = original_message
         self.event_type = event_type
 
+        # Build the member/role pickers once and reuse them across repeat clicks
+        user_select = discord.ui.UserSelect(
+            placeholder="Select a member to mention",
+            min_values=1,
+            max_values=1
+        )
+        user_select.callback = self._on_user_select
+        self._user_select_view = discord.ui.View(timeout=300)
+        self._user_select_view.add_item(user_select)
+
+        role_select = discord.ui.RoleSelect(
+            placeholder="Select a role to mention",
+            min_values=1,
+            max_values=1
+        )
+        role_select.callback = self._on_role_select
+        self._role_select_view = discord.ui.View(timeout=300)
+        self._role_select_view.add_item(role_select)
+
     async def show_mention_type_menu(self, interaction, mention_type):
         try:
             embed = discord.Embed(
@@ -2518,8 +3151,8 @@ class MentionTypeView(discord.ui.View):
                 embed=embed,
                 view=view
             )
-        except Exception as e:
-            print(f"Error in show_mention_type_menu: {e}")
+        except Exception:
+            logger.exception("Error in show_mention_type_menu")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while showing mention options!",
                 ephemeral=True
@@ -2529,8 +3162,8 @@ class MentionTypeView(discord.ui.View):
     async def everyone_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.show_mention_type_menu(interaction, "everyone")
-        except Exception as e:
-            print(f"Error in everyone button: {e}")
+        except Exception:
+            logger.exception("Error in everyone button")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while setting @everyone mention!",
                 ephemeral=True
@@ -2539,87 +3172,67 @@ class MentionTypeView(discord.ui.View):
     @discord.ui.button(label="Select Member", style=discord.ButtonStyle.primary, emoji=f"{theme.userIcon}", row=0)
     async def member_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
-            select = discord.ui.UserSelect(
-                placeholder="Select a member to mention",
-                min_values=1,
-                max_values=1
-            )
-
-            async def user_select_callback(select_interaction):
-                try:
-                    selected_user_id = select_interaction.data["values"][0]
-                    await self.show_mention_type_menu(select_interaction, f"member_{selected_user_id}")
-                except Exception as e:
-                    print(f"Error in user selection: {e}")
-                    await select_interaction.followup.send(
-                        f"{theme.deniedIcon} An error occurred while selecting the member!",
-                        ephemeral=True
-                    )
-
-            select.callback = user_select_callback
-            view = discord.ui.View(timeout=300)
-            view.add_item(select)
-
             await interaction.response.edit_message(
                 embed=discord.Embed(
                     title=f"{theme.userIcon} Select Member",
                     description="Choose a member to mention:",
                     color=theme.emColor1
                 ),
-                view=view
+                view=self._user_select_view
             )
-        except Exception as e:
-            print(f"Error in member button: {e}")
+        except Exception:
+            logger.exception("Error in member button")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while showing member selection!",
                 ephemeral=True
             )
 
-    @discord.ui.button(label="Select Role", style=discord.ButtonStyle.success, emoji=f"{theme.membersIcon}", row=0)
-    async def role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _on_user_select(self, select_interaction: discord.Interaction):
         try:
-            select = discord.ui.RoleSelect(
-                placeholder="Select a role to mention",
-                min_values=1,
-                max_values=1
+            selected_user_id = select_interaction.data["values"][0]
+            await self.show_mention_type_menu(select_interaction, f"member_{selected_user_id}")
+        except Exception:
+            logger.exception("Error in user selection")
+            await select_interaction.followup.send(
+                f"{theme.deniedIcon} An error occurred while selecting the member!",
+                ephemeral=True
             )
 
-            async def role_select_callback(select_interaction):
-                try:
-                    selected_role_id = select_interaction.data["values"][0]
-                    await self.show_mention_type_menu(select_interaction, f"role_{selected_role_id}")
-                except Exception as e:
-                    print(f"Error in role selection: {e}")
-                    await select_interaction.followup.send(
-                        f"{theme.deniedIcon} An error occurred while selecting the role!",
-                        ephemeral=True
-                    )
-
-            select.callback = role_select_callback
-            view = discord.ui.View(timeout=300)
-            view.add_item(select)
-
+    @discord.ui.button(label="Select Role", style=discord.ButtonStyle.success, emoji=f"{theme.membersIcon}", row=0)
+    async def role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        try:
             await interaction.response.edit_message(
                 embed=discord.Embed(
                     title=f"{theme.membersIcon} Select Role",
                     description="Choose a role to mention:",
                     color=theme.emColor1
                 ),
-                view=view
+                view=self._role_select_view
             )
-        except Exception as e:
-            print(f"Error in role button: {e}")
+        except Exception:
+            logger.exception("Error in role button")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while showing role selection!",
                 ephemeral=True
             )
 
+    async def _on_role_select(self, select_interaction: discord.Interaction):
+        try:
+            selected_role_id = select_interaction.data["values"][0]
+            await self.show_mention_type_menu(select_interaction, f"role_{selected_role_id}")
+        except Exception:
+            logger.exception("Error in role selection")
+            await select_interaction.followup.send(
+                f"{theme.deniedIcon} An error occurred while selecting the role!",
+                ephemeral=True
+            )
+
     @discord.ui.button(label="No Mention", style=discord.ButtonStyle.secondary, emoji=f"{theme.muteIcon}", row=0)
     async def no_mention_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             await self.show_mention_type_menu(interaction, "none")
-        except Exception as e:
-            print(f"Error in no mention button: {e}")
+        except Exception:
+            logger.exception("Error in no mention button")
             await interaction.followup.send(
                 f"{theme.deniedIcon} An error occurred while setting no mention!",
                 ephemeral=True
@@ -2629,63 +3242,15 @@ class MentionSelectMenu(discord.ui.Select):
     def __init__(self, view):
         self.parent_view = view
 
-        options = []
-
-        options.append(
-            discord.SelectOption(
-                label="@everyone",
-                value="everyone",
-                description="Mention everyone in the server",
-                emoji=theme.announceIcon
-            )
-        )
-
-        options.append(
-            discord.SelectOption(
-                label="No Mention",
-                value="none",
-                description="Don't mention anyone",
-                emoji=theme.muteIcon
-            )
-        )
-
         guild = view.original_message.guild
-        roles = sorted(
-            [role for role in guild.roles if not role.is_default() and not role.managed],
-            key=lambda r: r.position,
-            reverse=True
-        )
-
-        for role in roles:
-            options.append(
-                discord.SelectOption(
-                    label=role.name,
-                    value=f"role_{role.id}",
-                    description=f"Role with {len(role.members)} members",
-                    emoji=theme.membersIcon
-                )
-            )
-
-        members = sorted(
-            [member for member in guild.members if not member.bot],
-            key=lambda m: m.display_name.lower()
-        )
-
-        for member in members:
-            options.append(
-                discord.SelectOption(
-                    label=member.display_name,
-                    value=f"member_{member.id}",
-                    description=f"@{member.name}",
-                    emoji=theme.userIcon
-                )
-            )
+        cog = view.cog
+        options = cog._mention_options.get(guild.id) or cog._build_mention_options(guild)
 
         super().__init__(
             placeholder=f"{theme.searchIcon} Search and select who to mention...",
             min_values=1,
             max_values=1,
-            options=options,
+            options=list(options),
             row=0
         )
 
@@ -2695,10 +3260,10 @@ class MentionSelectMenu(discord.ui.Select):
 
             await self.parent_view.show_mention_type_menu(interaction, selected_value)
 
-        except Exception as e:
-            print(f"Error in mention selection: {e}")
+        except Exception:
+            logger.exception("Error in mention selection")
             await interaction.followup.send(
-                f"{theme.deniedIcon} An error occurred while processing your selection!",
+                f"{theme.deniedIcon} {ERR_SELECTION}",
                 ephemeral=True
             )
 
@@ -2708,9 +3273,6 @@ class SettingsView(discord.ui.View):
         self.cog = cog
         self.delete_enabled = delete_enabled
         self.default_delay = default_delay
-        # Use cog's connection instead of creating new one
-        self.conn = cog.conn
-        self.cursor = cog.cursor
 
     def build_settings_embed(self):
         """Build the settings embed with current values"""
@@ -2740,20 +3302,19 @@ class SettingsView(discord.ui.View):
     async def toggle_deletion(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
             new_value = 0 if self.delete_enabled else 1
-            self.cursor.execute("""
-                UPDATE bear_trap_settings
-                SET delete_messages_enabled = ?
-                WHERE guild_id = ?
-            """, (new_value, interaction.guild_id))
-            self.conn.commit()
+            await self.cog.db_execute("""
+                INSERT INTO bear_trap_settings (guild_id, delete_messages_enabled)
+                VALUES (?, ?)
+                ON CONFLICT(guild_id) DO UPDATE SET delete_messages_enabled = excluded.delete_messages_enabled
+            """, (interaction.guild_id, new_value))
+            self.cog.invalidate_settings(interaction.guild_id)
 
             self.delete_enabled = bool(new_value)
 
             await interaction.response.edit_message(embed=self.build_settings_embed(), view=self)
 
-        except Exception as e:
-            print(f"Error toggling deletion: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error toggling deletion")
             await interaction.response.send_message(
                 f"{theme.deniedIcon} An error occurred while updating settings.",
                 ephemeral=True
@@ -2787,12 +3348,12 @@ class SettingsView(discord.ui.View):
                         )
                         return
 
-                    self.cursor.execute("""
-                        UPDATE bear_trap_settings
-                        SET default_delete_delay_minutes = ?
-                        WHERE guild_id = ?
-                    """, (new_delay, modal_interaction.guild_id))
-                    self.conn.commit()
+                    await self.cog.db_execute("""
+                        INSERT INTO bear_trap_settings (guild_id, default_delete_delay_minutes)
+                        VALUES (?, ?)
+                        ON CONFLICT(guild_id) DO UPDATE SET default_delete_delay_minutes = excluded.default_delete_delay_minutes
+                    """, (modal_interaction.guild_id, new_delay))
+                    self.cog.invalidate_settings(modal_interaction.guild_id)
 
                     self.default_delay = new_delay
 
@@ -2803,9 +3364,8 @@ class SettingsView(discord.ui.View):
                         f"{theme.deniedIcon} Please enter a valid number.",
                         ephemeral=True
                     )
-                except Exception as e:
-                    print(f"Error in modal callback: {e}")
-                    traceback.print_exc()
+                except Exception:
+                    logger.exception("Error in modal callback")
                     await modal_interaction.response.send_message(
                         f"{theme.deniedIcon} An error occurred while updating the delay.",
                         ephemeral=True
@@ -2814,25 +3374,597 @@ class SettingsView(discord.ui.View):
             modal.on_submit = modal_callback
             await interaction.response.send_modal(modal)
 
-        except Exception as e:
-            print(f"Error opening delay modal: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error opening delay modal")
             await interaction.response.send_message(
                 f"{theme.deniedIcon} An error occurred while opening the settings modal.",
                 ephemeral=True
             )
 
-class BearTrapView(discord.ui.View):
-    def __init__(self, cog):
-        super().__init__(timeout=None)
-        self.cog = cog
-        # Use cog's connection instead of creating new one
-        self.conn = cog.conn
-        self.cursor = cog.cursor
+class NotificationListState:
+    """Shared paging and search state for the Manage Notifications list and its buttons."""
 
-    @discord.ui.button(
-        label="Setup Wizard",
-        emoji=f"{theme.wizardIcon}",
+    __slots__ = (
+        "all_notifications", "notifications", "by_id", "displays", "current_page", "search_keywords",
+        "select", "view", "prev_button", "next_button", "search_button", "reset_button",
+        "_filter_cache",
+    )
+
+    page_size = 25
+
+    def __init__(self, notifications: list, displays: dict):
+        # Filters only ever rebind self.notifications, so the full result set is shared, never copied
+        self.all_notifications = tuple(notifications)
+        self.notifications = self.all_notifications
+        self.by_id = {notif.id: notif for notif in self.all_notifications}
+        self.displays = displays
+        self.current_page = 0
+        self.search_keywords = []
+        self.select = None
+        self.view = None
+        self.prev_button = None
+        self.next_button = None
+        self.search_button = None
+        self.reset_button = None
+        # Filter results keyed by the full set of lowered keywords applied so far
+        self._filter_cache: dict[tuple[str, ...], list] = {}
+
+    @property
+    def total_pages(self) -> int:
+        return (len(self.notifications) // self.page_size) + (1 if len(self.notifications) % self.page_size != 0 else 0)
+
+    def placeholder(self) -> str:
+        return f"Page {self.current_page + 1}/{self.total_pages} — Select a notification to view"
+
+    def page_options(self) -> list[discord.SelectOption]:
+        start = self.current_page * self.page_size
+        end = start + self.page_size
+        return [
+            discord.SelectOption(label=d.label, description=d.description, value=d.value)
+            for d in (self.displays[notif.id] for notif in self.notifications[start:end])
+        ]
+
+    def filter_by_keyword(self, keyword: str) -> list:
+        """Return the current rows matching keyword."""
+        keyword = keyword.lower()
+        cache_key = tuple(sorted({k.lower() for k in self.search_keywords} | {keyword}))
+        filtered = self._filter_cache.get(cache_key)
+        if filtered is None:
+            filtered = [n for n in self.notifications if keyword in self.displays[n.id].search_text_lower]
+            self._filter_cache[cache_key] = filtered
+        return filtered
+
+    def build_base_view(self) -> discord.ui.View:
+        """Create a view holding the select menu and the paging/search buttons."""
+        view = discord.ui.View()
+        view.add_item(self.select)
+        if self.total_pages > 1:
+            view.add_item(self.prev_button)
+            view.add_item(self.next_button)
+        view.add_item(self.search_button)
+        view.add_item(self.reset_button)
+        return view
+
+    def refresh_select(self):
+        """Re-render the select menu and button states for the current page and filter."""
+        self.select.options = self.page_options()
+        self.select.placeholder = self.placeholder()
+
+        self.reset_button.disabled = not self.search_keywords
+        self.prev_button.disabled = self.current_page == 0
+        self.next_button.disabled = self.current_page == self.total_pages - 1
+
+
+class PaginationButton(discord.ui.Button):
+    def __init__(self, state: NotificationListState, label, page_change, emoji=None):
+        super().__init__(label=label, emoji=emoji, style=discord.ButtonStyle.primary)
+        self.state = state
+        self.page_change = page_change
+
+    async def callback(self, interaction: discord.Interaction):
+        new_page = self.state.current_page + self.page_change
+        if 0 <= new_page < self.state.total_pages:
+            self.state.current_page = new_page
+            self.state.refresh_select()
+
+            await interaction.response.edit_message(
+                view=self.state.view
+            )
+
+
+class SearchModal(discord.ui.Modal, title="Search Notifications"):
+    keyword = discord.ui.TextInput(
+        label="Search Term",
+        placeholder="Enter text to search for..."
+    )
+
+    def __init__(self, state: NotificationListState):
+        super().__init__()
+        self.state = state
+
+    async def on_submit(self, interaction: discord.Interaction):
+        state = self.state
+
+        keyword_value = self.keyword.value
+        filtered = state.filter_by_keyword(keyword_value)
+
+        if not filtered:
+            if state.search_keywords:
+                prev_keywords_display = " and ".join(f"`{k}`" for k in state.search_keywords)
+                message = (
+                    f"{theme.deniedIcon} No notifications found with `{keyword_value}` "
+                    f"among those already filtered by: {prev_keywords_display}"
+                )
+            else:
+                message = f"{theme.deniedIcon} No notifications found for keyword `{keyword_value}`."
+
+            await interaction.response.send_message(message, ephemeral=True)
+            return
+
+        state.search_keywords.append(keyword_value)
+
+        state.notifications = filtered
+        state.current_page = 0
+        state.refresh_select()
+
+        keywords_display = " and ".join(f"`{k}`" for k in state.search_keywords)
+        content_message = f"{theme.searchIcon} Showing notifications that contain the keyword(s): {keywords_display}"
+
+        await interaction.response.edit_message(content=content_message, view=state.view)
+
+
+class SearchButton(discord.ui.Button):
+    def __init__(self, state: NotificationListState, label):
+        super().__init__(label=label, style=discord.ButtonStyle.primary)
+        self.state = state
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.send_modal(SearchModal(self.state))
+
+
+class ResetButton(discord.ui.Button):
+    def __init__(self, state: NotificationListState, label):
+        super().__init__(label=label, style=discord.ButtonStyle.secondary)
+        self.state = state
+
+    async def callback(self, interaction: discord.Interaction):
+        state = self.state
+        state.notifications = state.all_notifications
+        state.search_keywords.clear()
+        state.current_page = 0
+        state.refresh_select()
+
+        await interaction.response.edit_message(content="Showing all notifications.", view=state.view)
+
+
+def replace_preview_vars(text, values: dict):
+    """Replace the notification variables in text with the sample values used for previews."""
+    # Static text has no variables to substitute, skip the replace chain
+    if not text or ("%" not in text and "{" not in text):
+        return text
+    for variable, value in values.items():
+        text = text.replace(variable, value)
+    return text
+
+
+def build_notification_preview(hours, minutes, description, next_notification, event_type,
+                               embed_result: NotificationEmbed | None):
+    """Render a notification preview with sample variable values.
+
+    Returns (content, embed, embed_json); embed and embed_json are None for plain messages,
+    and embed_json is None for an embed with no fields filled in.
+    The content still contains @tag, which the caller replaces with the current mention.
+    """
+    # Sample values for preview variable replacement
+    example_time = "30 minutes"
+    example_name = event_type if event_type else "Event"
+    example_emoji = get_event_icon(event_type) if event_type else "📅"
+    example_event_time = f"{hours:02d}:{minutes:02d}"
+    try:
+        next_dt = datetime.fromisoformat(next_notification.replace("+00:00", ""))
+        example_date = next_dt.strftime("%b %d")
+    except:
+        example_date = "Dec 06"
+
+    preview_values = {
+        "%t": example_time, "{time}": example_time, "%n": example_name,
+        "%e": example_event_time, "%d": example_date, "%i": example_emoji,
+    }
+
+    if not embed_result:
+        message_preview = description.split("PLAIN_MESSAGE:", 1)[-1].strip()
+        return replace_preview_vars(message_preview, preview_values), None, None
+
+    mention_preview = embed_result.mention_message if embed_result.mention_message else ""
+
+    preview_embed = discord.Embed(
+        title=replace_preview_vars(embed_result.title, preview_values) if embed_result.title else "No Title",
+        description=replace_preview_vars(embed_result.description, preview_values) if embed_result.description else "No Description",
+        color=embed_result.color if embed_result.color else discord.Color.blue()
+    )
+
+    if embed_result.image_url:
+        preview_embed.set_image(url=embed_result.image_url)
+    if embed_result.thumbnail_url:
+        preview_embed.set_thumbnail(url=embed_result.thumbnail_url)
+    if embed_result.footer:
+        preview_embed.set_footer(text=replace_preview_vars(embed_result.footer, preview_values))
+    if embed_result.author:
+        preview_embed.set_author(name=replace_preview_vars(embed_result.author, preview_values))
+
+    # Create copyable JSON data for the embed, unless every content field is still empty
+    # (color is always stored, so it says nothing about whether the embed was filled in)
+    embed_json = None
+    if any(getattr(embed_result, field) not in (None, "") for field in EMBED_CONTENT_FIELDS):
+        embed_json = dumps_pretty(embed_result._asdict())
+
+    return replace_preview_vars(mention_preview, preview_values), preview_embed, embed_json
+
+
+class PreviewButton(discord.ui.Button):
+    def __init__(self, cog, notification_id):
+        super().__init__(label="👀 Preview", style=discord.ButtonStyle.primary)
+        self.cog = cog
+        self.notification_id = notification_id
+
+    async def callback(self, interaction: discord.Interaction):
+        try:
+            selected_notif = await self.cog.get_notification_with_embed(self.notification_id)
+
+            if not selected_notif:
+                await interaction.response.send_message(f"{theme.deniedIcon} Notification not found.", ephemeral=True)
+                return
+
+            hours, minutes = selected_notif.hour, selected_notif.minute
+            description, mention_type = selected_notif.description, selected_notif.mention_type
+            next_notification, event_type = selected_notif.next_notification, selected_notif.event_type
+
+            embed_result = None
+            if "EMBED_MESSAGE:" in description:
+                embed_result = selected_notif.embed
+
+            # Rendered previews are reused while the row and embed they were built from are unchanged
+            cache_key = (hours, minutes, description, next_notification, event_type, embed_result)
+            cached = self.cog._preview_cache.get(self.notification_id)
+            if cached and cached[0] == cache_key:
+                content_template, preview_embed, embed_json = cached[1]
+            else:
+                content_template, preview_embed, embed_json = build_notification_preview(
+                    hours, minutes, description, next_notification, event_type, embed_result
+                )
+                self.cog._preview_cache[self.notification_id] = (
+                    cache_key, (content_template, preview_embed, embed_json)
+                )
+
+            mention_match = MENTION_ID_RE.match(mention_type)
+            if mention_match:
+                kind, target_id = mention_match.groups()
+                mention_display = f"<@&{target_id}>" if kind == "role" else f"<@{target_id}>"
+            elif mention_type == "everyone":
+                mention_display = "@everyone"
+            else:
+                mention_display = ""
+
+            if embed_json:
+                # Create view with a "Show Code" button
+                view = discord.ui.View()
+                view.add_item(ShowCodeButton(embed_json))
+
+                await interaction.response.send_message(
+                    content=content_template.replace("@tag", mention_display),
+                    embed=preview_embed,
+                    view=view,
+                    ephemeral=True
+                )
+            elif preview_embed:
+                await interaction.response.send_message(
+                    content=content_template.replace("@tag", mention_display),
+                    embed=preview_embed,
+                    ephemeral=True
+                )
+            else:
+                await interaction.response.send_message(
+                    content=content_template.replace("@tag", mention_display),
+                    ephemeral=True
+                )
+
+        except Exception:
+            logger.exception("Exception in PreviewButton")
+            await interaction.response.send_message(
+                f"{theme.deniedIcon} An error occurred while fetching the preview.", ephemeral=True)
+
+
+class AdvancedSettingsButton(discord.ui.Button):
+    def __init__(self, cog, notification_id):
+        super().__init__(label="🧹 Message Cleanup", style=discord.ButtonStyle.secondary)
+        self.cog = cog
+        self.notification_id = notification_id
+
+    async def callback(self, interaction: discord.Interaction):
+        try:
+            # Get current custom delete delay
+            row = await self.cog.db_fetchone(SQL_GET_DELETE_DELAY, (self.notification_id,))
+            current_delay = row[0] if row and row[0] is not None else None
+
+            modal = discord.ui.Modal(title="Message Cleanup Settings")
+            delay_input = discord.ui.TextInput(
+                label="Custom Delete Delay (minutes)",
+                placeholder="Leave empty to use default delay (60 min)",
+                default=str(current_delay) if current_delay is not None else "",
+                required=False,
+                max_length=5
+            )
+            modal.add_item(delay_input)
+
+            async def modal_callback(modal_interaction: discord.Interaction):
+                try:
+                    if delay_input.value.strip():
+                        new_delay = int(delay_input.value)
+                        if new_delay < 1:
+                            await modal_interaction.response.send_message(
+                                f"{theme.deniedIcon} Delay must be at least 1 minute.",
+                                ephemeral=True
+                            )
+                            return
+                    else:
+                        # Empty = use default
+                        new_delay = None
+
+                    await self.cog.db_execute(SQL_SET_DELETE_DELAY, (new_delay, self.notification_id))
+
+                    # Update delete delay display from the value just written
+                    custom_delay = new_delay
+                    if custom_delay is not None:
+                        delete_delay_display = f"{custom_delay} minutes (custom)"
+                    else:
+                        delete_delay_display = "Using default delay"
+
+                    # Get current embed and update it
+                    current_embed = modal_interaction.message.embeds[0]
+
+                    # Swap in the updated delete delay, keeping whichever icon the line was rendered with
+                    current_embed.description = CLEANUP_LINE_RE.sub(
+                        lambda m: f"**{m.group(1)} Message Cleanup:** {delete_delay_display}",
+                        current_embed.description,
+                        count=1
+                    )
+
+                    await modal_interaction.response.edit_message(embed=current_embed)
+
+                except ValueError:
+                    await modal_interaction.response.send_message(
+                        f"{theme.deniedIcon} Please enter a valid number.",
+                        ephemeral=True
+                    )
+                except Exception:
+                    logger.exception("Error updating custom delay")
+                    await modal_interaction.response.send_message(
+                        f"{theme.deniedIcon} An error occurred while updating settings.",
+                        ephemeral=True
+                    )
+
+            modal.on_submit = modal_callback
+            await interaction.response.send_modal(modal)
+
+        except Exception:
+            logger.exception("Error opening advanced settings")
+            await interaction.response.send_message(
+                f"{theme.deniedIcon} An error occurred while opening advanced settings.",
+                ephemeral=True
+            )
+
+
+class DeleteButton(discord.ui.Button):
+    def __init__(self, cog, notification_id):
+        super().__init__(label="🗑️ Delete", style=discord.ButtonStyle.danger)
+        self.cog = cog
+        self.notification_id = notification_id
+
+    async def callback(self, interaction: discord.Interaction):
+        try:
+            confirm_view = discord.ui.View()
+
+            confirm_button = discord.ui.Button(label="Confirm", style=discord.ButtonStyle.danger)
+            cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.primary)
+
+            async def confirm_callback(interaction: discord.Interaction):
+                try:
+                    result = await self.cog.delete_notification(self.notification_id)
+
+                    if result:
+                        # The message only holds Confirm/Cancel at this point, clear them
+                        await interaction.response.edit_message(view=None)
+                        await interaction.followup.send(f"{theme.verifiedIcon} Successfully deleted.", ephemeral=True)
+
+                    else:
+                        logger.warning(f"Deletion failed for notification_id {self.notification_id}")
+                        await interaction.response.send_message(
+                            f"{theme.deniedIcon} Failed to delete the notification.", ephemeral=True
+                        )
+
+                except Exception:
+                    logger.exception("Exception in confirm_callback")
+                    await interaction.response.send_message(
+                        f"{theme.deniedIcon} An error occurred while deleting the notification.", ephemeral=True
+                    )
+
+            async def cancel_callback(interaction: discord.Interaction):
+                try:
+                    await interaction.response.edit_message(
+                        content=build_notification_help(toggle_icon=theme.warnIcon),
+                        view=self.view
+                    )
+                except Exception:
+                    logger.exception("Exception in cancel callback")
+
+            confirm_button.callback = confirm_callback
+            cancel_button.callback = cancel_callback
+            confirm_view.add_item(confirm_button)
+            confirm_view.add_item(cancel_button)
+
+            await interaction.response.edit_message(
+                content="Are you sure you want to delete this notification?",
+                view=confirm_view
+            )
+
+        except Exception:
+            logger.exception("Exception in DeleteButton callback")
+            await interaction.response.send_message(
+                f"{theme.deniedIcon} An error occurred while attempting to delete the notification.",
+                ephemeral=True
+            )
+
+
+class EditButton(discord.ui.Button):
+    def __init__(self, notification_id):
+        super().__init__(label=f"{theme.editListIcon} Edit", style=discord.ButtonStyle.primary)
+        self.notification_id = notification_id
+
+    async def callback(self, button_interaction: discord.Interaction):
+        editor_cog = self.view.editor_cog
+        if editor_cog:
+            try:
+                await editor_cog.start_edit_process(button_interaction, self.notification_id)
+            except Exception:
+                logger.exception("Error in starting edit process")
+        else:
+            await button_interaction.response.send_message(
+                f"{theme.deniedIcon} Editor module not found!",
+                ephemeral=True
+            )
+
+
+class ToggleButton(discord.ui.Button):
+    def __init__(self, cog, notif, state: NotificationListState):
+        self.cog = cog
+        self.notif = notif
+        self.state = state
+        self.notification_id = notif.id
+
+        initial_label = "🟢 Notification is active" if notif.is_enabled else "🔴 Notification is inactive"
+        super().__init__(label=initial_label,
+                         style=discord.ButtonStyle.success if notif.is_enabled else discord.ButtonStyle.danger)
+
+    async def callback(self, interaction: discord.Interaction):
+        try:
+            new_status = await self.cog.flip_notification(self.notification_id)
+
+            if new_status is None:
+                await interaction.response.send_message(f"{theme.deniedIcon} Notification not found.", ephemeral=True)
+                return
+
+            # Keep the list snapshot and its select option in step with the new state
+            self.notif.is_enabled = int(new_status)
+            self.state.displays.update(
+                await self.cog.build_notification_displays(interaction.guild, [self.notif])
+            )
+            self.state.refresh_select()
+
+            new_label = "🟢 Notification is active" if new_status else "🔴 Notification is inactive"
+            new_style = discord.ButtonStyle.success if new_status else discord.ButtonStyle.danger
+            self.label = new_label
+            self.style = new_style
+
+            await interaction.response.edit_message(view=self.view)
+
+        except Exception:
+            logger.exception("Exception in ToggleButton callback")
+            await interaction.response.send_message(
+                f"{theme.deniedIcon} An error occurred while toggling notification!", ephemeral=True
+            )
+
+
+class ChangeChannelButton(discord.ui.Button):
+    def __init__(self, cog, notification_id, channel_exists):
+        self.cog = cog
+        self.notification_id = notification_id
+        # Only show button if channel doesn't exist
+        if not channel_exists:
+            super().__init__(label=f"{theme.editListIcon} Change Channel", style=discord.ButtonStyle.primary)
+        else:
+            super().__init__(label=f"{theme.editListIcon} Change Channel", style=discord.ButtonStyle.secondary)
+
+    async def callback(self, interaction: discord.Interaction):
+        try:
+            # Make sure the notification still exists
+            if not await self.cog.db_fetchone(SQL_NOTIFICATION_EXISTS, (self.notification_id,)):
+                await interaction.response.send_message(f"{theme.deniedIcon} Notification not found.", ephemeral=True)
+                return
+
+            # Create channel selector view
+            channel_select = discord.ui.ChannelSelect(
+                placeholder="Select a new channel for this notification",
+                channel_types=[discord.ChannelType.text],
+                min_values=1,
+                max_values=1
+            )
+
+            async def channel_select_callback(select_interaction: discord.Interaction):
+                try:
+                    new_channel_id = int(select_interaction.data["values"][0])
+
+                    # Check if bot has permissions in the new channel
+                    if not bot_can_send(select_interaction, new_channel_id):
+                        await select_interaction.response.send_message(
+                            f"{theme.deniedIcon} I don't have permission to send messages in that channel!",
+                            ephemeral=True
+                        )
+                        return
+
+                    # Update the notification's channel
+                    await self.cog.db_execute(SQL_SET_CHANNEL, (new_channel_id, self.notification_id))
+
+                    await select_interaction.response.send_message(
+                        f"{theme.verifiedIcon} Notification channel updated to <#{new_channel_id}>!",
+                        ephemeral=True
+                    )
+
+                except Exception:
+                    logger.exception("Error updating channel")
+                    await select_interaction.response.send_message(
+                        f"{theme.deniedIcon} An error occurred while updating the channel.",
+                        ephemeral=True
+                    )
+
+            channel_select.callback = channel_select_callback
+            temp_view = discord.ui.View()
+            temp_view.add_item(channel_select)
+
+            await interaction.response.send_message(
+                "Select a new channel for this notification:",
+                view=temp_view,
+                ephemeral=True
+            )
+
+        except Exception:
+            logger.exception("Exception in ChangeChannelButton callback")
+            await interaction.response.send_message(
+                f"{theme.deniedIcon} An error occurred!",
+                ephemeral=True
+            )
+
+
+class ShowCodeButton(discord.ui.Button):
+    def __init__(self, embed_json):
+        super().__init__(label="💾 Show Code", style=discord.ButtonStyle.secondary)
+        self.embed_json = embed_json
+        self.content = f"```json\n{embed_json}\n```"
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.send_message(
+            content=self.content,
+            ephemeral=True
+        )
+
+
+class BearTrapView(discord.ui.View):
+    def __init__(self, cog):
+        super().__init__(timeout=None)
+        self.cog = cog
+
+    @discord.ui.button(
+        label="Setup Wizard",
+        emoji=f"{theme.wizardIcon}",
         style=discord.ButtonStyle.success,
         custom_id="setup_wizard",
         row=0
@@ -2841,7 +3973,7 @@ class BearTrapView(discord.ui.View):
         if not await self.cog.check_admin(interaction):
             return
         try:
-            wizard_cog = self.cog.bot.get_cog("BearTrapWizard")
+            wizard_cog = self.cog.get_linked_cog("BearTrapWizard")
             if wizard_cog:
                 await wizard_cog.show_wizard(interaction)
             else:
@@ -2849,8 +3981,8 @@ class BearTrapView(discord.ui.View):
                     f"{theme.deniedIcon} Setup Wizard not found. Don't worry, I'm sure he will arrive precisely when he means to.",
                     ephemeral=True
                 )
-        except Exception as e:
-            print(f"Error loading Setup Wizard: {e}")
+        except Exception:
+            logger.exception("Error loading Setup Wizard")
             await interaction.response.send_message(
                 f"{theme.deniedIcon} We couldn't summon the Setup Wizard. Try summoning him off and on again?",
                 ephemeral=True
@@ -2871,23 +4003,13 @@ class BearTrapView(discord.ui.View):
             modal = TimeSelectModal(self.cog)
             await interaction.response.send_modal(modal)
 
-        except Exception as e:
-            error_msg = f"[ERROR] Error in set time button: {str(e)}\nType: {type(e)}\nTrace: {traceback.format_exc()}"
-            print(error_msg)
+        except Exception:
+            logger.exception("Error in set time button")
 
             try:
-                if not interaction.response.is_done():
-                    await interaction.response.send_message(
-                        f"{theme.deniedIcon} An error occurred!",
-                        ephemeral=True
-                    )
-                else:
-                    await interaction.followup.send(
-                        f"{theme.deniedIcon} An error occurred!",
-                        ephemeral=True
-                    )
+                await send_error(interaction, f"{theme.deniedIcon} An error occurred!")
             except Exception as notify_error:
-                print(f"[ERROR] Failed to notify user about error: {notify_error}")
+                logger.error(f"Failed to notify user about error: {notify_error}")
 
     @discord.ui.button(
         label="Manage Notifications",
@@ -2901,8 +4023,6 @@ class BearTrapView(discord.ui.View):
             return
         try:
             notifications = await self.cog.get_notifications(interaction.guild_id)
-            original_notifications = notifications.copy()
-            search_keywords = []
             if not notifications:
                 await interaction.response.send_message(
                     f"{theme.deniedIcon} No notifications found in this server.",
@@ -2910,224 +4030,25 @@ class BearTrapView(discord.ui.View):
                 )
                 return
 
-            page_size = 25
-            total_pages = (len(notifications) // page_size) + (1 if len(notifications) % page_size != 0 else 0)
-            current_page = 0
-
-            def get_page_option(page):
-                start = page * page_size
-                end = start + page_size
-                page_notifications = notifications[start:end]
-
-                options = []
-                for notif in page_notifications:
-                    status_emoji = "🟢" if notif[11] else "🔴"
-                    status = "Enabled" if notif[11] else "Disabled"
-
-                    # Check if channel exists
-                    channel = interaction.guild.get_channel(notif[2])
-                    channel_warning = f"{theme.warnIcon} " if not channel else ""
-                    channel_name = f"#{channel.name}" if channel else "Unknown"
-
-                    # Get event type from database column (index 16)
-                    event_type = notif[16] if notif[16] else None
-
-                    # Get event emoji and display name
-                    if event_type:
-                        from bear_event_types import get_event_icon
-                        event_emoji = get_event_icon(event_type)
-                        display_name = event_type
-                    else:
-                        # Custom notification - get title from description or embed
-                        event_emoji = theme.editListIcon
-                        notification_desc = notif[6]  # description field
-
-                        if "EMBED_MESSAGE:" in notification_desc:
-                            # Try to get embed title
-                            try:
-                                self.cog.cursor.execute("""
-                                    SELECT title FROM bear_notification_embeds
-                                    WHERE notification_id = ?
-                                """, (notif[0],))
-                                embed_row = self.cog.cursor.fetchone()
-                                if embed_row and embed_row[0]:
-                                    display_name = f"{embed_row[0]} (Custom)"
-                                else:
-                                    display_name = "Custom Notification"
-                            except:
-                                display_name = "Custom Notification"
-                        elif notification_desc.startswith("CUSTOM_TIMES:"):
-                            # Extract description after CUSTOM_TIMES:
-                            parts = notification_desc.split("|", 1)
-                            if len(parts) > 1:
-                                custom_desc = parts[1].replace("PLAIN_MESSAGE:", "").strip()
-                                display_name = f"{custom_desc[:30]} (Custom)" if custom_desc else "Custom Notification"
-                            else:
-                                display_name = "Custom Notification"
-                        else:
-                            # Plain notification
-                            plain_desc = notification_desc.replace("PLAIN_MESSAGE:", "").strip()
-                            display_name = f"{plain_desc[:30]} (Custom)" if plain_desc else "Custom Notification"
-
-                    # Format next occurrence time
-                    import pytz
-                    from datetime import datetime
-                    if notif[15]:  # next_notification
-                        try:
-                            next_time = datetime.fromisoformat(notif[15])
-                            tz = pytz.timezone(notif[5])
-                            next_time_local = next_time.astimezone(tz)
-                            time_display = next_time_local.strftime("%m/%d %H:%M")
-                        except:
-                            time_display = f"{notif[3]:02d}:{notif[4]:02d}"
-                    else:
-                        time_display = f"{notif[3]:02d}:{notif[4]:02d}"
-
-                    # Build label: [Emoji] [Event Type/Title] - [Time]
-                    label = f"{channel_warning}{event_emoji} {display_name} - {time_display}"
-                    description = f"{status_emoji} {status} | {channel_name} | ID: {notif[0]}"
-
-                    # Avoid nested f-strings for Python 3.9+ compatibility
-                    if "EMBED_MESSAGE:" in notif[6]:
-                        option_value = f"{notif[0]}|embed"
-                    else:
-                        option_value = f"{notif[0]}|plain"
-
-                    options.append(
-                        discord.SelectOption(
-                            label=label[:100],  # Discord max 100 chars
-                            description=description[:100],
-                            value=option_value
-                        )
-                    )
-                if len(options) > 25:
-                    options = options[:25]
-                return options
+            # Resolve display state for every notification once; paging and search reuse it
+            displays = await self.cog.build_notification_displays(interaction.guild, notifications)
 
+            state = NotificationListState(notifications, displays)
             select = discord.ui.Select(
-                placeholder=f"Page {current_page + 1}/{total_pages} — Select a notification to view",
-                options=get_page_option(current_page)
+                placeholder=state.placeholder(),
+                options=state.page_options()
             )
-
-            class PaginationButton(discord.ui.Button):
-                def __init__(self, label, page_change):
-                    super().__init__(label=label, style=discord.ButtonStyle.primary)
-                    self.page_change = page_change
-
-                async def callback(self, interaction: discord.Interaction):
-                    nonlocal current_page
-                    new_page = current_page + self.page_change
-                    if 0 <= new_page < total_pages:
-                        current_page = new_page
-
-                        new_options = get_page_option(current_page)
-                        select.options = new_options
-                        select.placeholder = f"Page {current_page + 1}/{total_pages} — Select a notification to view"
-
-                        prev_button.disabled = current_page == 0
-                        next_button.disabled = current_page == total_pages - 1
-
-                        await interaction.response.edit_message(
-                            view=view
-                        )
-
-            prev_button = PaginationButton(label="Previous", emoji=f"{theme.prevIcon}", page_change=-1)
-            prev_button.disabled = current_page == 0
-            next_button = PaginationButton(label="Next", emoji=f"{theme.nextIcon}", page_change=1)
-
-            class SearchButton(discord.ui.Button):
-                def __init__(self, label, cog):
-                    super().__init__(label=label, style=discord.ButtonStyle.primary)
-                    self.cog = cog
-
-                async def callback(self, interaction: discord.Interaction):
-                    class SearchModal(discord.ui.Modal, title="Search Notifications"):
-                        keyword = discord.ui.TextInput(
-                            label="Search Term",
-                            placeholder="Enter text to search for..."
-                        )
-
-                        async def on_submit(modal_self, interaction: discord.Interaction):
-                            nonlocal notifications, current_page, total_pages
-
-                            keyword_value = modal_self.keyword.value
-                            keyword_lower = keyword_value.lower()
-                            filtered = []
-                            
-                            for n in notifications:
-                                if "EMBED_MESSAGE:" in n[6]:
-                                    button_self.cog.cursor.execute("SELECT title FROM bear_notification_embeds WHERE notification_id = ?", (n[0],))
-                                    embed_data = button_self.cog.cursor.fetchone()
-                                    display_text = embed_data[0] if embed_data and embed_data[0] else "Embed Message"
-                                else:
-                                    display_text = n[6].split('|')[-1] if '|' in n[6] else n[6]
-                                    if display_text.startswith("PLAIN_MESSAGE:"):
-                                        display_text = display_text.replace("PLAIN_MESSAGE:", "", 1)
-                                
-                                if keyword_lower in display_text.lower():
-                                    filtered.append(n)
-
-                            if not filtered:
-                                if search_keywords:
-                                    prev_keywords_display = " and ".join(f"`{k}`" for k in search_keywords)
-                                    message = (
-                                        f"{theme.deniedIcon} No notifications found with `{keyword_value}` "
-                                        f"among those already filtered by: {prev_keywords_display}"
-                                    )
-                                else:
-                                    message = f"{theme.deniedIcon} No notifications found for keyword `{keyword_value}`."
-
-                                await interaction.response.send_message(message, ephemeral=True)
-                                return
-
-                            search_keywords.append(keyword_value)
-
-                            notifications = filtered
-                            current_page = 0
-                            total_pages = (len(notifications) // page_size) + (
-                                1 if len(notifications) % page_size != 0 else 0
-                            )
-
-                            select.options = get_page_option(current_page)
-                            select.placeholder = f"Page {current_page + 1}/{total_pages} — Select a notification to view"
-
-                            reset_button.disabled = not search_keywords
-                            prev_button.disabled = current_page == 0
-                            next_button.disabled = current_page == total_pages - 1
-
-                            keywords_display = " and ".join(f"`{k}`" for k in search_keywords)
-                            content_message = f"{theme.searchIcon} Showing notifications that contain the keyword(s): {keywords_display}"
-
-                            await interaction.response.edit_message(content=content_message, view=view)
-
-                    button_self = self
-                    await interaction.response.send_modal(SearchModal())
-
-            search_button = SearchButton(label=f"{theme.searchIcon} Search", cog=self.cog)
-
-            class ResetButton(discord.ui.Button):
-                def __init__(self, label):
-                    super().__init__(label=label, style=discord.ButtonStyle.secondary)
-
-                async def callback(self, interaction: discord.Interaction):
-                    nonlocal notifications, original_notifications, current_page, total_pages
-
-                    notifications = original_notifications.copy()
-                    search_keywords.clear()
-                    current_page = 0
-                    total_pages = (len(notifications) // page_size) + (1 if len(notifications) % page_size != 0 else 0)
-
-                    select.options = get_page_option(current_page)
-                    select.placeholder = f"Page {current_page + 1}/{total_pages} — Select a notification to view"
-
-                    reset_button.disabled = not search_keywords
-                    prev_button.disabled = current_page == 0
-                    next_button.disabled = current_page == total_pages - 1
-
-                    await interaction.response.edit_message(content="Showing all notifications.", view=view)
-
-            reset_button = ResetButton(label=f"{theme.retryIcon} Reset Filter")
-            reset_button.disabled = not search_keywords
+            prev_button = PaginationButton(state, label="Previous", emoji=f"{theme.prevIcon}", page_change=-1)
+            prev_button.disabled = state.current_page == 0
+            next_button = PaginationButton(state, label="Next", emoji=f"{theme.nextIcon}", page_change=1)
+            search_button = SearchButton(state, label=f"{theme.searchIcon} Search")
+            reset_button = ResetButton(state, label=f"{theme.retryIcon} Reset Filter")
+            reset_button.disabled = not state.search_keywords
+            state.select = select
+            state.prev_button = prev_button
+            state.next_button = next_button
+            state.search_button = search_button
+            state.reset_button = reset_button
 
             async def select_callback(select_interaction):
                 try:
@@ -3135,7 +4056,7 @@ class BearTrapView(discord.ui.View):
                     notification_id, notif_type = selected_value.split("|")
                     notification_id = int(notification_id)
 
-                    selected_notif = next(n for n in notifications if n[0] == notification_id)
+                    selected_notif = state.by_id[notification_id]
 
                     notification_types = {
                         1: "Sends notifications at 30 minutes, 10 minutes, 5 minutes before and when time's up",
@@ -3145,68 +4066,29 @@ class BearTrapView(discord.ui.View):
                         5: "Sends notification only when time's up",
                         6: "Sends notifications at custom times"
                     }
-                    notification_type_desc = notification_types.get(selected_notif[7], "Unknown Type")
-
-                    mention_display = selected_notif[8]
-                    if mention_display.startswith("role_"):
-                        mention_display = f"<@&{mention_display.split('_')[1]}>"
-                    elif mention_display.startswith("member_"):
-                        mention_display = f"<@{mention_display.split('_')[1]}>"
-                    elif mention_display == "everyone":
-                        mention_display = "@everyone"
-                    elif mention_display == "none":
-                        mention_display = "No mention"
-
-                    repeat_minutes = selected_notif[10]
-                    time_units = [
-                        ("month", 43200),
-                        ("week", 10080),
-                        ("day", 1440),
-                        ("hour", 60),
-                        ("minute", 1),
-                    ]
+                    notification_type_desc = notification_types.get(selected_notif.notification_type, "Unknown Type")
+
+                    mention_display = format_mention_display(selected_notif.mention_type)
+
+                    repeat_minutes = selected_notif.repeat_minutes
 
                     formatted_repeat = f"{theme.deniedIcon} No repeat"
                     if isinstance(repeat_minutes, int) and repeat_minutes > 0:
-                        result = []
-                        for name, unit in time_units:
-                            value = repeat_minutes // unit
-                            if value > 0:
-                                result.append(f"{value} {name}{'s' if value > 1 else ''}")
-                                repeat_minutes %= unit
-                        formatted_repeat = " and ".join(result)
+                        formatted_repeat = format_repeat_interval(repeat_minutes)
 
                     elif repeat_minutes == -1:
-                        self.cursor.execute("""
-                                SELECT weekday FROM notification_days
-                                WHERE notification_id = ?
-                            """, (selected_notif[0],))
-                        rows = self.cursor.fetchall()
-
-                        weekday_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-                        day_set = set()
-                        for row in rows:
-                            for part in row[0].split('|'):
-                                if part.strip().isdigit():
-                                    day_set.add(int(part))
-
-                        sorted_days = sorted(day_set)
-                        day_list = [weekday_names[day] for day in sorted_days]
-
-                        if len(day_list) == 1:
-                            formatted_repeat = f"Every {day_list[0]}"
-                        else:
-                            formatted_repeat = "Every " + ", ".join(day_list[:-1]) + " and " + day_list[-1]
+                        rows = await self.cog.db_fetchall(SQL_GET_NOTIFICATION_DAYS, (selected_notif.id,))
+                        formatted_repeat = format_repeat_weekdays(tuple(row[0] for row in rows))
 
                     # Check if channel exists
-                    channel = select_interaction.guild.get_channel(selected_notif[2])
+                    channel = select_interaction.guild.get_channel(selected_notif.channel_id)
                     if channel:
-                        channel_display = f"<#{selected_notif[2]}>"
+                        channel_display = f"<#{selected_notif.channel_id}>"
                     else:
                         channel_display = f"{theme.warnIcon} #unknown-channel (Deleted or Inaccessible)"
 
                     # Format delete delay display
-                    custom_delay = selected_notif[17] if len(selected_notif) > 17 else None
+                    custom_delay = selected_notif.custom_delete_delay_minutes
                     if custom_delay is not None:
                         delete_delay_display = f"{custom_delay} minutes (custom)"
                     else:
@@ -3214,554 +4096,67 @@ class BearTrapView(discord.ui.View):
 
                     details_embed = discord.Embed(
                         title=f"{theme.listIcon} Notification Details",
-                        description=(
-                            f"**{theme.calendarIcon} Next Notification date:** {datetime.fromisoformat(selected_notif[15]).strftime('%d/%m/%Y')}\n"
-                            f"**{theme.alarmClockIcon} Time:** {selected_notif[3]:02d}:{selected_notif[4]:02d} ({selected_notif[5]})\n"
-                            f"**{theme.announceIcon} Channel:** {channel_display}\n"
-                            f"**{theme.editListIcon} Description:** {selected_notif[6]}\n\n"
-                            f"**{theme.settingsIcon} Notification Type:** \n{notification_type_desc}\n\n"
-                            f"**{theme.userIcon} Mention:** {mention_display}\n"
-                            f"**{theme.refreshIcon} Repeat:** {formatted_repeat}\n"
-                            f"**{theme.trashIcon} Message Cleanup:** {delete_delay_display}\n"),
+                        description=NOTIFICATION_DETAILS_TEMPLATE.format_map({
+                            "calendar_icon": theme.calendarIcon,
+                            "clock_icon": theme.alarmClockIcon,
+                            "announce_icon": theme.announceIcon,
+                            "edit_icon": theme.editListIcon,
+                            "settings_icon": theme.settingsIcon,
+                            "user_icon": theme.userIcon,
+                            "refresh_icon": theme.refreshIcon,
+                            "trash_icon": theme.trashIcon,
+                            "next_date": datetime.fromisoformat(selected_notif.next_notification).strftime('%d/%m/%Y'),
+                            "hour": selected_notif.hour,
+                            "minute": selected_notif.minute,
+                            "timezone": selected_notif.timezone,
+                            "channel": channel_display,
+                            "description": selected_notif.description,
+                            "notification_type": notification_type_desc,
+                            "mention": mention_display,
+                            "repeat": formatted_repeat,
+                            "cleanup": delete_delay_display,
+                        }),
                         color=theme.emColor1
                     )
 
-                    view = discord.ui.View()
-
-                    class PreviewButton(discord.ui.Button):
-                        def __init__(self, cog, notification_id):
-                            super().__init__(label="👀 Preview", style=discord.ButtonStyle.primary)
-                            self.cog = cog
-                            self.notification_id = notification_id
-
-                        async def callback(self, interaction: discord.Interaction):
-                            try:
-                                self.cog.cursor.execute(
-                                    """SELECT channel_id, hour, minute, description, mention_type, next_notification, event_type
-                                       FROM bear_notifications WHERE id = ?""",
-                                    (self.notification_id,)
-                                )
-                                selected_notif = self.cog.cursor.fetchone()
-
-                                if not selected_notif:
-                                    await interaction.response.send_message(f"{theme.deniedIcon} Notification not found.", ephemeral=True)
-                                    return
-
-                                channel_id, hours, minutes, description, mention_type, next_notification, event_type = selected_notif
-
-                                # Sample values for preview variable replacement
-                                example_time = "30 minutes"
-                                example_name = event_type if event_type else "Event"
-                                example_emoji = get_event_icon(event_type) if event_type else "📅"
-                                example_event_time = f"{hours:02d}:{minutes:02d}"
-                                try:
-                                    next_dt = datetime.fromisoformat(next_notification.replace("+00:00", ""))
-                                    example_date = next_dt.strftime("%b %d")
-                                except:
-                                    example_date = "Dec 06"
-
-                                def replace_vars(text):
-                                    if not text:
-                                        return text
-                                    return (text
-                                        .replace("%t", example_time)
-                                        .replace("{time}", example_time)
-                                        .replace("%n", example_name)
-                                        .replace("%e", example_event_time)
-                                        .replace("%d", example_date)
-                                        .replace("%i", example_emoji))
-
-                                embed_data = None
-                                if "EMBED_MESSAGE:" in description:
-                                    self.cog.cursor.execute("""
-                                        SELECT title, description, color, image_url, thumbnail_url, footer, author, mention_message
-                                        FROM bear_notification_embeds WHERE notification_id = ?
-                                    """, (self.notification_id,))
-                                    embed_result = self.cog.cursor.fetchone()
-
-                                    if embed_result:
-                                        embed_data = {
-                                            'title': embed_result[0],
-                                            'description': embed_result[1],
-                                            'color': embed_result[2],
-                                            'image_url': embed_result[3],
-                                            'thumbnail_url': embed_result[4],
-                                            'footer': embed_result[5],
-                                            'author': embed_result[6],
-                                            'mention_message': embed_result[7]
-                                        }
-                                mention_display = ""
-                                if mention_type.startswith("role_"):
-                                    mention_display = f"<@&{mention_type.split('_')[1]}>"
-                                elif mention_type.startswith("member_"):
-                                    mention_display = f"<@{mention_type.split('_')[1]}>"
-                                elif mention_type == "everyone":
-                                    mention_display = "@everyone"
-                                elif mention_type == "none":
-                                    mention_display = ""
-
-                                preview_embed = None
-                                if embed_data:
-                                    mention_preview = embed_data['mention_message'] if embed_data[
-                                        'mention_message'] else ""
-                                    mention_preview = replace_vars(mention_preview).replace("@tag", mention_display)
-
-                                    preview_embed = discord.Embed(
-                                        title=replace_vars(embed_data['title']) if embed_data['title'] else "No Title",
-                                        description=replace_vars(embed_data['description']) if embed_data[
-                                            'description'] else "No Description",
-                                        color=embed_data['color'] if embed_data['color'] else discord.Color.blue()
-                                    )
-
-                                    if embed_data['image_url']:
-                                        preview_embed.set_image(url=embed_data['image_url'])
-                                    if embed_data['thumbnail_url']:
-                                        preview_embed.set_thumbnail(url=embed_data['thumbnail_url'])
-                                    if embed_data['footer']:
-                                        preview_embed.set_footer(text=replace_vars(embed_data['footer']))
-                                    if embed_data['author']:
-                                        preview_embed.set_author(name=replace_vars(embed_data['author']))
-
-                                    # Create copyable JSON data for the embed
-                                    copyable_data = {
-                                        'title': embed_data['title'],
-                                        'description': embed_data['description'],
-                                        'color': embed_data['color'],
-                                        'footer': embed_data['footer'],
-                                        'author': embed_data['author'],
-                                        'image_url': embed_data['image_url'],
-                                        'thumbnail_url': embed_data['thumbnail_url'],
-                                        'mention_message': embed_data['mention_message']
-                                    }
-
-                                    embed_json = json.dumps(copyable_data, indent=2)
-
-                                    # Create view with a "Show Code" button
-                                    view = discord.ui.View()
-                                    view.add_item(ShowCodeButton(embed_json))
-
-                                    await interaction.response.send_message(
-                                        content=mention_preview,
-                                        embed=preview_embed,
-                                        view=view,
-                                        ephemeral=True
-                                    )
-                                else:
-                                    message_preview = description.split("PLAIN_MESSAGE:", 1)[-1].strip()
-                                    message_preview = replace_vars(message_preview).replace("@tag", mention_display)
-
-                                    await interaction.response.send_message(
-                                        content=message_preview,
-                                        ephemeral=True
-                                    )
-
-                            except Exception as e:
-                                print(f"[ERROR] Exception in PreviewButton: {e}")
-                                await interaction.response.send_message(
-                                    f"{theme.deniedIcon} An error occurred while fetching the preview.", ephemeral=True)
-
-                    class ShowCodeButton(discord.ui.Button):
-                        def __init__(self, embed_json):
-                            super().__init__(label="💾 Show Code", style=discord.ButtonStyle.secondary)
-                            self.embed_json = embed_json
-
-                        async def callback(self, interaction: discord.Interaction):
-                            await interaction.response.send_message(
-                                content=f"```json\n{self.embed_json}\n```",
-                                ephemeral=True
-                            )
-
-                    class AdvancedSettingsButton(discord.ui.Button):
-                        def __init__(self, cog, notification_id):
-                            super().__init__(label="🧹 Message Cleanup", style=discord.ButtonStyle.secondary)
-                            self.cog = cog
-                            self.notification_id = notification_id
-
-                        async def callback(self, interaction: discord.Interaction):
-                            try:
-                                # Get current custom delete delay
-                                self.cog.cursor.execute("""
-                                    SELECT custom_delete_delay_minutes
-                                    FROM bear_notifications
-                                    WHERE id = ?
-                                """, (self.notification_id,))
-                                row = self.cog.cursor.fetchone()
-                                current_delay = row[0] if row and row[0] is not None else None
-
-                                modal = discord.ui.Modal(title="Message Cleanup Settings")
-                                delay_input = discord.ui.TextInput(
-                                    label="Custom Delete Delay (minutes)",
-                                    placeholder="Leave empty to use default delay (60 min)",
-                                    default=str(current_delay) if current_delay is not None else "",
-                                    required=False,
-                                    max_length=5
-                                )
-                                modal.add_item(delay_input)
-
-                                async def modal_callback(modal_interaction: discord.Interaction):
-                                    try:
-                                        if delay_input.value.strip():
-                                            new_delay = int(delay_input.value)
-                                            if new_delay < 1:
-                                                await modal_interaction.response.send_message(
-                                                    f"{theme.deniedIcon} Delay must be at least 1 minute.",
-                                                    ephemeral=True
-                                                )
-                                                return
-                                        else:
-                                            # Empty = use default
-                                            new_delay = None
-
-                                        self.cog.cursor.execute("""
-                                            UPDATE bear_notifications
-                                            SET custom_delete_delay_minutes = ?
-                                            WHERE id = ?
-                                        """, (new_delay, self.notification_id))
-                                        self.cog.conn.commit()
-
-                                        # Refresh the notification list to get updated data
-                                        notifications = await self.cog.get_notifications(modal_interaction.guild_id)
-                                        selected_notif = next(n for n in notifications if n[0] == self.notification_id)
-
-                                        # Update delete delay display
-                                        custom_delay = selected_notif[17] if len(selected_notif) > 17 else None
-                                        if custom_delay is not None:
-                                            delete_delay_display = f"{custom_delay} minutes (custom)"
-                                        else:
-                                            delete_delay_display = "Using default delay"
-
-                                        # Get current embed and update it
-                                        current_embed = modal_interaction.message.embeds[0]
-
-                                        # Rebuild description with updated delete delay
-                                        lines = current_embed.description.split('\n')
-                                        updated_lines = []
-                                        for line in lines:
-                                            if line.startswith("**🧹 Message Cleanup:**"):
-                                                updated_lines.append(f"**🧹 Message Cleanup:** {delete_delay_display}")
-                                            else:
-                                                updated_lines.append(line)
-
-                                        current_embed.description = '\n'.join(updated_lines)
-
-                                        await modal_interaction.response.edit_message(embed=current_embed)
-
-                                    except ValueError:
-                                        await modal_interaction.response.send_message(
-                                            f"{theme.deniedIcon} Please enter a valid number.",
-                                            ephemeral=True
-                                        )
-                                    except Exception as e:
-                                        print(f"Error updating custom delay: {e}")
-                                        traceback.print_exc()
-                                        await modal_interaction.response.send_message(
-                                            f"{theme.deniedIcon} An error occurred while updating settings.",
-                                            ephemeral=True
-                                        )
-
-                                modal.on_submit = modal_callback
-                                await interaction.response.send_modal(modal)
-
-                            except Exception as e:
-                                print(f"Error opening advanced settings: {e}")
-                                traceback.print_exc()
-                                await interaction.response.send_message(
-                                    f"{theme.deniedIcon} An error occurred while opening advanced settings.",
-                                    ephemeral=True
-                                )
-
-                    class DeleteButton(discord.ui.Button):
-                        def __init__(self, cog, notification_id):
-                            super().__init__(label="🗑️ Delete", style=discord.ButtonStyle.danger)
-                            self.cog = cog
-                            self.notification_id = notification_id
-
-                        async def callback(self, interaction: discord.Interaction):
-                            try:
-                                confirm_view = discord.ui.View()
-
-                                confirm_button = discord.ui.Button(label="Confirm", style=discord.ButtonStyle.danger)
-                                cancel_button = discord.ui.Button(label="Cancel", style=discord.ButtonStyle.primary)
-
-                                async def confirm_callback(interaction: discord.Interaction):
-                                    try:
-                                        result = await self.cog.delete_notification(self.notification_id)
-
-                                        if result:
-                                            new_view = discord.ui.View()
-
-                                            for row in interaction.message.components:
-                                                for item in row.children:
-                                                    if isinstance(item, discord.ui.Button) and item.label not in [
-                                                        "Confirm", "Cancel"]:
-                                                        new_view.add_item(
-                                                            item)
-
-                                            await interaction.response.edit_message(view=new_view)
-                                            await interaction.followup.send(f"{theme.verifiedIcon} Successfully deleted.", ephemeral=True)
-
-                                        else:
-                                            print(f"[DEBUG] Deletion failed for notification_id {self.notification_id}")
-                                            await interaction.response.send_message(
-                                                f"{theme.deniedIcon} Failed to delete the notification.", ephemeral=True
-                                            )
-
-                                    except Exception as e:
-                                        print(f"[ERROR] Exception in confirm_callback: {e}")
-                                        await interaction.response.send_message(
-                                            f"{theme.deniedIcon} An error occurred while deleting the notification.", ephemeral=True
-                                        )
-
-                                async def cancel_callback(interaction: discord.Interaction):
-                                    try:
-                                        await interaction.response.edit_message(
-                                            content=(
-                                                f"- **{theme.searchIcon} Search:** Filter the menu options based on specific keywords\n"
-                                                f"- **{theme.editListIcon} Edit:** Modify notification details.\n"
-                                                f"- **{theme.warnIcon} Notification is active/inactive:** Toggles between enabling or disabling the notification.\n"
-                                                f"  - -# Click to toggle between enabling or disabling.\n"
-                                                f"  - -# Enabling a non-repeating notification will keep its time but change its date to today's date or tomorrow if the time had passed.\n"
-                                                f"- **{theme.eyesIcon} Preview:** See how the notification will look when it's sent.\n"
-                                                f"- **{theme.trashIcon} Delete:** Remove the selected notification.\n\n"
-                                            ),
-                                            view=view
-                                        )
-                                    except Exception as e:
-                                        print(f"[ERROR] Exception in cancel callback: {e}")
-
-                                confirm_button.callback = confirm_callback
-                                cancel_button.callback = cancel_callback
-                                confirm_view.add_item(confirm_button)
-                                confirm_view.add_item(cancel_button)
-
-                                await interaction.response.edit_message(
-                                    content="Are you sure you want to delete this notification?",
-                                    view=confirm_view
-                                )
-
-                            except Exception as e:
-                                print(f"[ERROR] Exception in DeleteButton callback: {e}")
-                                await interaction.response.send_message(
-                                    f"{theme.deniedIcon} An error occurred while attempting to delete the notification.",
-                                    ephemeral=True
-                                )
-
-                    class EditButton(discord.ui.Button):
-                        def __init__(self):
-                            super().__init__(label=f"{theme.editListIcon} Edit", style=discord.ButtonStyle.primary)
-
-                        async def callback(self, button_interaction: discord.Interaction):
-                            editor_cog = self.view.editor_cog
-                            if editor_cog:
-                                try:
-                                    await editor_cog.start_edit_process(button_interaction, notification_id)
-                                except Exception as e:
-                                    print(f"Error in starting edit process: {e}")
-                            else:
-                                await button_interaction.response.send_message(
-                                    f"{theme.deniedIcon} Editor module not found!",
-                                    ephemeral=True
-                                )
-
-                    class ToggleButton(discord.ui.Button):
-                        def __init__(self, cog, notification_id, edit_button, select):
-                            self.cog = cog
-                            self.notification_id = notification_id
-                            self.edit_button = edit_button
-                            self.select = select
-
-                            self.cog.cursor.execute("""
-                                SELECT is_enabled FROM bear_notifications WHERE id = ? 
-                            """, (self.notification_id,))
-                            current_status = self.cog.cursor.fetchone()
-
-                            initial_label = "🟢 Notification is active" if current_status and current_status[
-                                0] else "🔴 Notification is inactive"
-                            super().__init__(label=initial_label,
-                                             style=discord.ButtonStyle.success if current_status and current_status[
-                                                 0] else discord.ButtonStyle.danger)
-
-                        async def callback(self, interaction: discord.Interaction):
-                            try:
-                                self.cog.cursor.execute("""
-                                    SELECT is_enabled FROM bear_notifications WHERE id = ? 
-                                """, (self.notification_id,))
-                                current_status = self.cog.cursor.fetchone()
-
-                                if current_status is None:
-                                    await interaction.response.send_message(f"{theme.deniedIcon} Notification not found.", ephemeral=True)
-                                    return
-
-                                new_status = not bool(current_status[0])
-
-                                result = await self.cog.toggle_notification(self.notification_id, new_status)
-
-                                if result:
-                                    new_label = "🟢 Notification is active" if new_status else "🔴 Notification is inactive"
-                                    new_style = discord.ButtonStyle.success if new_status else discord.ButtonStyle.danger
-                                    self.label = new_label
-                                    self.style = new_style
-
-                                    await interaction.response.edit_message(view=view)
-
-                                else:
-                                    await interaction.response.send_message(f"{theme.deniedIcon} Failed to toggle notification.",
-                                                                            ephemeral=True)
-
-                            except Exception as e:
-                                print(f"[ERROR] Exception in ToggleButton callback: {e}")
-                                await interaction.response.send_message(
-                                    f"{theme.deniedIcon} An error occurred while toggling notification!", ephemeral=True
-                                )
-
-                    class ChangeChannelButton(discord.ui.Button):
-                        def __init__(self, cog, notification_id, channel_exists):
-                            self.cog = cog
-                            self.notification_id = notification_id
-                            # Only show button if channel doesn't exist
-                            if not channel_exists:
-                                super().__init__(label=f"{theme.editListIcon} Change Channel", style=discord.ButtonStyle.primary)
-                            else:
-                                super().__init__(label=f"{theme.editListIcon} Change Channel", style=discord.ButtonStyle.secondary)
-
-                        async def callback(self, interaction: discord.Interaction):
-                            try:
-                                # Get current notification data
-                                self.cog.cursor.execute("""
-                                    SELECT channel_id, hour, minute, timezone, description, mention_type,
-                                           repeat_minutes, next_notification, notification_type
-                                    FROM bear_notifications WHERE id = ?
-                                """, (self.notification_id,))
-                                notif_data = self.cog.cursor.fetchone()
-
-                                if not notif_data:
-                                    await interaction.response.send_message(f"{theme.deniedIcon} Notification not found.", ephemeral=True)
-                                    return
-
-                                # Create channel selector view
-                                channel_select = discord.ui.ChannelSelect(
-                                    placeholder="Select a new channel for this notification",
-                                    channel_types=[discord.ChannelType.text],
-                                    min_values=1,
-                                    max_values=1
-                                )
-
-                                async def channel_select_callback(select_interaction: discord.Interaction):
-                                    try:
-                                        new_channel_id = int(select_interaction.data["values"][0])
-                                        new_channel = select_interaction.guild.get_channel(new_channel_id)
-
-                                        # Check if bot has permissions in the new channel
-                                        if not new_channel.permissions_for(select_interaction.guild.me).send_messages:
-                                            await select_interaction.response.send_message(
-                                                f"{theme.deniedIcon} I don't have permission to send messages in that channel!",
-                                                ephemeral=True
-                                            )
-                                            return
-
-                                        # Update the notification's channel
-                                        self.cog.cursor.execute("""
-                                            UPDATE bear_notifications
-                                            SET channel_id = ?
-                                            WHERE id = ?
-                                        """, (new_channel_id, self.notification_id))
-                                        self.cog.conn.commit()
-
-                                        await select_interaction.response.send_message(
-                                            f"{theme.verifiedIcon} Notification channel updated to <#{new_channel_id}>!",
-                                            ephemeral=True
-                                        )
-
-                                    except Exception as e:
-                                        print(f"[ERROR] Error updating channel: {e}")
-                                        await select_interaction.response.send_message(
-                                            f"{theme.deniedIcon} An error occurred while updating the channel.",
-                                            ephemeral=True
-                                        )
-
-                                channel_select.callback = channel_select_callback
-                                temp_view = discord.ui.View()
-                                temp_view.add_item(channel_select)
-
-                                await interaction.response.send_message(
-                                    "Select a new channel for this notification:",
-                                    view=temp_view,
-                                    ephemeral=True
-                                )
-
-                            except Exception as e:
-                                print(f"[ERROR] Exception in ChangeChannelButton callback: {e}")
-                                await interaction.response.send_message(
-                                    f"{theme.deniedIcon} An error occurred!",
-                                    ephemeral=True
-                                )
-
-                    view.add_item(select)
-                    if total_pages > 1:
-                        view.add_item(prev_button)
-                        view.add_item(next_button)
-                    view.add_item(search_button)
-                    view.add_item(reset_button)
-                    view.add_item(EditButton())
-                    view.add_item(ToggleButton(self.cog, notification_id, EditButton(), select))
+                    view = state.build_base_view()
+                    view.add_item(EditButton(notification_id))
+                    view.add_item(ToggleButton(self.cog, selected_notif, state))
                     view.add_item(PreviewButton(self.cog, notification_id))
                     view.add_item(AdvancedSettingsButton(self.cog, notification_id))
                     view.add_item(ChangeChannelButton(self.cog, notification_id, channel is not None))
                     view.add_item(DeleteButton(self.cog, notification_id))
 
-                    editor_cog = self.cog.bot.get_cog('NotificationEditor')
+                    editor_cog = self.cog.get_linked_cog('NotificationEditor')
                     view.editor_cog = editor_cog
 
-                    # Build help text - add Change Channel info if channel is missing
-                    help_text = (
-                        f"- **{theme.searchIcon} Search:** Filter the menu options based on specific keywords\n"
-                        f"- **{theme.editListIcon} Edit:** Modify notification details.\n"
-                        f"- **{theme.settingsIcon} Notification is active/inactive:** Toggles between enabling or disabling the notification.\n"
-                        f"  - -# Click to toggle between enabling or disabling.\n"
-                        f"  - -# Enabling a non-repeating notification will keep its time but change its date to today's date or tomorrow if the time had passed.\n"
-                        f"- **{theme.eyesIcon} Preview:** See how the notification will look when it's sent.\n"
-                        f"- **{theme.trashIcon} Message Cleanup:** Configure custom message deletion delay for this notification.\n"
-                    )
-
-                    if not channel:
-                        help_text += f"- **{theme.editListIcon} Change Channel:** {theme.warnIcon} Update the channel for this notification (current channel is unavailable).\n"
-                    else:
-                        help_text += f"- **{theme.editListIcon} Change Channel:** Update the channel for this notification.\n"
-
-                    help_text += f"- **{theme.trashIcon} Delete:** Remove the selected notification.\n\n"
-
                     await select_interaction.response.edit_message(
-                        content=help_text,
+                        content=build_notification_help(channel_available=bool(channel)),
                         embed=details_embed,
                         view=view
                     )
 
-                except Exception as e:
-                    print(f"[ERROR] Error in select callback: {e}")
+                except Exception:
+                    logger.exception("Error in select callback")
                     await select_interaction.response.send_message(
-                        f"{theme.deniedIcon} An error occurred while editing notification!",
+                        f"{theme.deniedIcon} {ERR_EDIT_NOTIFICATION}",
                         ephemeral=True
                     )
 
             select.callback = select_callback
 
-            view = discord.ui.View()
-            view.add_item(select)
-            if total_pages > 1:
-                view.add_item(prev_button)
-                view.add_item(next_button)
-            view.add_item(search_button)
-            view.add_item(reset_button)
+            view = state.build_base_view()
+            state.view = view
 
             await interaction.response.send_message(
                 view=view,
                 ephemeral=True
             )
 
-        except Exception as e:
-            print(f"[ERROR] Error in manage_notification button: {e}")
+        except Exception:
+            logger.exception("Error in manage_notification button")
             await interaction.response.send_message(
-                f"{theme.deniedIcon} An error occurred while starting the edit process!",
+                f"{theme.deniedIcon} {ERR_START_EDIT}",
                 ephemeral=True
             )
 
@@ -3777,7 +4172,7 @@ class BearTrapView(discord.ui.View):
         if not await self.cog.check_admin(interaction):
             return
         try:
-            schedule_cog = self.cog.bot.get_cog("BearTrapSchedule")
+            schedule_cog = self.cog.get_linked_cog("BearTrapSchedule")
             if schedule_cog:
                 await schedule_cog.show_main_menu(interaction, force_new=True)
             else:
@@ -3785,11 +4180,10 @@ class BearTrapView(discord.ui.View):
                     f"{theme.deniedIcon} Schedule board system is not loaded!",
                     ephemeral=True
                 )
-        except Exception as e:
-            print(f"[ERROR] Error in schedule boards button: {e}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error in schedule boards button")
             await interaction.response.send_message(
-                f"{theme.deniedIcon} An error occurred while loading schedule boards!",
+                f"{theme.deniedIcon} {ERR_SCHEDULE_BOARDS}",
                 ephemeral=True
             )
 
@@ -3804,7 +4198,7 @@ class BearTrapView(discord.ui.View):
         if not await self.cog.check_admin(interaction):
             return
         try:
-            templates_cog = self.cog.bot.get_cog("BearTrapTemplates")
+            templates_cog = self.cog.get_linked_cog("BearTrapTemplates")
             if templates_cog:
                 await templates_cog.show_templates(interaction)
             else:
@@ -3812,10 +4206,10 @@ class BearTrapView(discord.ui.View):
                     f"{theme.deniedIcon} Notification Templates module not found.",
                     ephemeral=True
                 )
-        except Exception as e:
-            print(f"Error loading templates: {e}")
+        except Exception:
+            logger.exception("Error loading templates")
             await interaction.response.send_message(
-                f"{theme.deniedIcon} An error occurred while loading templates.",
+                f"{theme.deniedIcon} {ERR_TEMPLATES}",
                 ephemeral=True
             )
 
@@ -3829,39 +4223,23 @@ class BearTrapView(discord.ui.View):
     async def settings_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         if not await self.cog.check_admin(interaction):
             return
+        # Acknowledge before touching the database so a slow disk can't expire the interaction
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            # Get current settings
-            self.cursor.execute("""
-                SELECT delete_messages_enabled, default_delete_delay_minutes
-                FROM bear_trap_settings
-                WHERE guild_id = ?
-            """, (interaction.guild_id,))
-            row = self.cursor.fetchone()
-
-            if row:
-                delete_enabled, default_delay = row
-            else:
-                # Create default settings
-                delete_enabled, default_delay = 1, 60
-                self.cursor.execute("""
-                    INSERT INTO bear_trap_settings (guild_id, delete_messages_enabled, default_delete_delay_minutes)
-                    VALUES (?, ?, ?)
-                """, (interaction.guild_id, delete_enabled, default_delay))
-                self.conn.commit()
+            delete_enabled, default_delay = await self.cog.ensure_deletion_settings(interaction.guild_id)
 
             # Create settings view
             settings_view = SettingsView(self.cog, delete_enabled, default_delay)
 
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 embed=settings_view.build_settings_embed(),
                 view=settings_view,
                 ephemeral=True
             )
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-            traceback.print_exc()
-            await interaction.response.send_message(
-                f"{theme.deniedIcon} An error occurred while loading settings.",
+        except Exception:
+            logger.exception("Error loading settings")
+            await interaction.followup.send(
+                f"{theme.deniedIcon} {ERR_SETTINGS}",
                 ephemeral=True
             )
 
@@ -3876,13 +4254,13 @@ class BearTrapView(discord.ui.View):
         if not await self.cog.check_admin(interaction):
             return
         try:
-            alliance_cog = self.cog.bot.get_cog("Alliance")
+            alliance_cog = self.cog.get_linked_cog("Alliance")
             if alliance_cog:
                 await alliance_cog.show_main_menu(interaction)
-        except Exception as e:
-            print(f"Error returning to main menu: {e}")
+        except Exception:
+            logger.exception("Error returning to main menu")
             await interaction.response.send_message(
-                f"{theme.deniedIcon} An error occurred while returning to main menu.",
+                f"{theme.deniedIcon} {ERR_MAIN_MENU}",
                 ephemeral=True
             )
 
@@ -3901,58 +4279,42 @@ class ChannelSelectView(discord.ui.View):
         self.add_item(ChannelSelectMenu(self))
 
 class ChannelSelectMenu(discord.ui.ChannelSelect):
+    channel_types_allowed = (
+        discord.ChannelType.text,
+        discord.ChannelType.private,
+        discord.ChannelType.news,
+        discord.ChannelType.forum,
+        discord.ChannelType.news_thread,
+        discord.ChannelType.public_thread,
+        discord.ChannelType.private_thread,
+        discord.ChannelType.stage_voice
+    )
+
     def __init__(self, view):
         self.parent_view = view
         super().__init__(
             placeholder="Select a channel for notifications",
-            channel_types=[
-                discord.ChannelType.text,
-                discord.ChannelType.private,
-                discord.ChannelType.news,
-                discord.ChannelType.forum,
-                discord.ChannelType.news_thread,
-                discord.ChannelType.public_thread,
-                discord.ChannelType.private_thread,
-                discord.ChannelType.stage_voice
-            ],
+            channel_types=list(self.channel_types_allowed),
             min_values=1,
             max_values=1
         )
 
     async def callback(self, interaction: discord.Interaction):
         try:
+            # Acknowledge first; the picker message is edited through the original response below
+            await interaction.response.defer()
+
             channel = self.values[0]
-            actual_channel = interaction.guild.get_channel(channel.id)
-            if not actual_channel.permissions_for(interaction.guild.me).send_messages:
-                await interaction.response.send_message(
-                    f"{theme.deniedIcon} I don't have permission to send messages in this channel!",
+            if not bot_can_send(interaction, channel.id):
+                await interaction.followup.send(
+                    f"{theme.deniedIcon} {ERR_NO_SEND_PERMISSION}",
                     ephemeral=True
                 )
                 return
 
             embed = discord.Embed(
                 title=f"{theme.alarmClockIcon} Select Notification Type",
-                description=(
-                    "Choose when to send notifications:\n\n"
-                    "**30m, 10m, 5m & Time**\n"
-                    "• 30 minutes before\n"
-                    "• 10 minutes before\n"
-                    "• 5 minutes before\n"
-                    "• When time's up\n\n"
-                    "**10m, 5m & Time**\n"
-                    "• 10 minutes before\n"
-                    "• 5 minutes before\n"
-                    "• When time's up\n\n"
-                    "**5m & Time**\n"
-                    "• 5 minutes before\n"
-                    "• When time's up\n\n"
-                    "**Only 5m**\n"
-                    "• Only 5 minutes before\n\n"
-                    "**Only Time**\n"
-                    "• Only when time's up\n\n"
-                    "**Custom Times**\n"
-                    "• Set your own notification times"
-                ),
+                description=NOTIFICATION_TYPE_CHOICES_TEXT,
                 color=theme.emColor1
             )
 
@@ -3968,24 +4330,15 @@ class ChannelSelectMenu(discord.ui.ChannelSelect):
                 event_type=self.parent_view.event_type
             )
 
-            await interaction.response.edit_message(
+            await interaction.edit_original_response(
                 content=None,
                 embed=embed,
                 view=view
             )
 
-        except Exception as e:
-            print(f"Error in channel select callback: {e}")
-            try:
-                await interaction.response.send_message(
-                    f"{theme.deniedIcon} An error occurred while processing your selection!",
-                    ephemeral=True
-                )
-            except discord.InteractionResponded:
-                await interaction.followup.send(
-                    f"{theme.deniedIcon} An error occurred while processing your selection!",
-                    ephemeral=True
-                )
+        except Exception:
+            logger.exception("Error in channel select callback")
+            await send_error(interaction, f"{theme.deniedIcon} {ERR_SELECTION}")
 
 async def setup(bot):
     await bot.add_cog(BearTrap(bot))
\ No newline at end of file
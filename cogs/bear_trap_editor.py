@@ -9,8 +9,15 @@ from .pimp_my_bot import theme
 from i18n import get_guild_language, t
 
 
+def _connect() -> sqlite3.Connection:
+    # The bear trap cog already switched the database to WAL; synchronous is per connection
+    conn = sqlite3.connect("db/beartime.sqlite")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
 def _get_lang(interaction: discord.Interaction | None) -> str:
-    guild_id = interaction.guild.id if interaction and interaction.guild else None
+    guild_id = interaction.guild_id if interaction else None
     return get_guild_language(guild_id)
 
 def check_mention_placeholder_misuse(text: str, is_embed: bool = False, lang: str = "en") -> str | None:
@@ -62,7 +69,7 @@ def format_repeat_interval(repeat_minutes, notification_id=None, lang: str = "en
         if notification_id is None:
             return t("bear.editor.repeat.custom_days", lang)
 
-        conn = sqlite3.connect("db/beartime.sqlite")
+        conn = _connect()
         cursor = conn.cursor()
         cursor.execute("""
             SELECT weekday FROM notification_days
@@ -409,7 +416,7 @@ class EmbedDataView(discord.ui.View):
         await interaction.response.defer()
         lang = _get_lang(interaction)
 
-        conn = sqlite3.connect("db/beartime.sqlite")
+        conn = _connect()
         cursor = conn.cursor()
         cursor.execute(
             "SELECT channel_id, hour, minute, description, mention_type, repeat_minutes, next_notification, timezone, notification_type FROM bear_notifications WHERE id = ?",
@@ -500,7 +507,7 @@ class PlainEditorView(discord.ui.View):
 
         if self.repeat == -1:
             try:
-                conn = sqlite3.connect("db/beartime.sqlite")
+                conn = _connect()
                 cursor = conn.cursor()
                 cursor.execute("SELECT weekday FROM notification_days WHERE notification_id = ?", (self.notification_id,))
                 weekday_value = cursor.fetchone()
@@ -1042,7 +1049,7 @@ class NotificationEditor(commands.Cog):
             )
             return
 
-        conn = sqlite3.connect("db/beartime.sqlite")
+        conn = _connect()
         cursor = conn.cursor()
         cursor.execute(
             "SELECT channel_id, hour, minute, description, mention_type, repeat_minutes, next_notification, timezone, notification_type, event_type FROM bear_notifications WHERE id = ?",
@@ -1166,7 +1173,7 @@ class NotificationEditor(commands.Cog):
         view.message = message
 
     async def update_notification(self, view):
-        conn = sqlite3.connect("db/beartime.sqlite")
+        conn = _connect()
         cursor = conn.cursor()
 
         if view.repeat == -1:
@@ -1198,7 +1205,7 @@ class NotificationEditor(commands.Cog):
                 await schedule_cog.on_notification_updated(guild_id, view.channel_id)
 
     async def update_embed_notification(self, view):
-        conn = sqlite3.connect("db/beartime.sqlite")
+        conn = _connect()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -1208,6 +1215,10 @@ class NotificationEditor(commands.Cog):
         )
         conn.commit()
 
+        bear_trap_cog = self.bot.get_cog("BearTrap")
+        if bear_trap_cog:
+            bear_trap_cog.invalidate_notification_cache(view.notification_id)
+
         # Get guild_id and channel_id for schedule board update
         cursor.execute("SELECT guild_id, channel_id FROM bear_notifications WHERE id = ?", (view.notification_id,))
         result = cursor.fetchone()
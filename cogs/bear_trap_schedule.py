@@ -1,39 +1,79 @@
 import discord
 from discord.ext import commands
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 import pytz
 import os
+import io
+import json
 import math
+import re
 import traceback
-import logging
-import logging.handlers
 import asyncio
-from .bear_event_types import get_event_icon
+import threading
+import heapq
+import bisect
+from itertools import groupby, islice
+from operator import itemgetter
+import functools
+from .bear_event_types import get_event_icon, get_timezone, get_bear_trap_logger
 from .permission_handler import PermissionManager
 from .pimp_my_bot import theme
 
+UTC = pytz.UTC
+
+# "Page X of Y" in a schedule embed footer; group 1 is the total page count
+PAGE_COUNT_RE = re.compile(r'Page \d+ of (\d+)')
+# Runs of spaces left behind when placeholders are removed from an event name
+MULTI_SPACE_RE = re.compile(r" {2,}")
+
+# Enabled notifications that have just entered the SOON (< 6h) or IMMINENT (< 1h) window, i.e. are
+# within one 5-minute urgency tick of a threshold; hours_until is computed by SQLite from the ISO text
+SQL_THRESHOLD_CROSSINGS = """
+    SELECT id, guild_id, channel_id
+    FROM (
+        SELECT id, guild_id, channel_id,
+               (julianday(next_notification) - julianday(?)) * 24.0 AS hours_until
+        FROM bear_notifications
+        WHERE is_enabled = 1 AND next_notification IS NOT NULL
+    )
+    WHERE (hours_until > 6.0 AND hours_until <= 6.083)
+       OR (hours_until > 1.0 AND hours_until <= 1.083)
+"""
+
+SQL_SELECT_BOARD_SETTINGS = """
+    SELECT guild_id, board_type, target_channel_id, max_events,
+           show_disabled, timezone, filter_name, filter_time_range, show_repeating_events, use_user_timezone, hide_daily_reset
+    FROM notification_schedule_boards
+    WHERE id = ?
+"""
+
+# Upcoming notifications for a board. Optional filters are switched off by binding NULL (or 1 for
+# show_disabled, 0 for hide_daily_reset); names is a JSON array of substrings, any of which the
+# description must contain
+SQL_BOARD_NOTIFICATIONS = """
+    SELECT id, channel_id, hour, minute, timezone, description,
+           notification_type, next_notification, is_enabled, repeat_enabled, repeat_minutes, event_type
+    FROM bear_notifications
+    WHERE guild_id = :guild_id
+    AND (:channel_id IS NULL OR channel_id = :channel_id)
+    AND (:show_disabled OR is_enabled = 1)
+    AND (NOT :hide_daily_reset OR event_type IS NOT 'Daily Reset')
+    AND (:names IS NULL OR EXISTS (
+        SELECT 1 FROM json_each(:names) j WHERE description LIKE '%' || j.value || '%'
+    ))
+    AND (:hours IS NULL OR datetime(next_notification) <= datetime('now', '+' || :hours || ' hours'))
+    AND next_notification IS NOT NULL AND datetime(next_notification) > datetime('now')
+    ORDER BY next_notification ASC
+"""
+
+
 class BearTrapSchedule(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-        # Logger Setup for bear_trap.txt (shared with other bear trap cogs)
-        self.logger = logging.getLogger('bear_trap')
-        self.logger.setLevel(logging.INFO)
-        self.logger.propagate = False  # Prevent propagation to root logger
-        log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-        log_dir = 'log'
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        log_file_path = os.path.join(log_dir, 'bear_trap.txt')
-
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file_path, maxBytes=3 * 1024 * 1024, backupCount=1, encoding='utf-8'
-        )
-        file_handler.setFormatter(log_formatter)
-        if not self.logger.hasHandlers():
-            self.logger.addHandler(file_handler)
+        # Logger for bear_trap.txt (shared with other bear trap cogs)
+        self.logger = get_bear_trap_logger()
 
         self.logger.info("[SCHEDULE] Cog initializing...")
 
@@ -46,6 +86,11 @@ class BearTrapSchedule(commands.Cog):
         # Enable WAL mode for better concurrency
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA synchronous=NORMAL")
+        # The refresh loops re-scan the same tables; keep them memory-mapped and in a larger page cache
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA busy_timeout=30000")
         self.conn.commit()
 
         # Create schedule boards table
@@ -70,28 +115,51 @@ class BearTrapSchedule(commands.Cog):
             )
         """)
 
-        # Add show_repeating_events column if it doesn't exist
-        try:
-            self.cursor.execute("SELECT show_repeating_events FROM notification_schedule_boards LIMIT 1")
-        except sqlite3.OperationalError:
-            self.cursor.execute("ALTER TABLE notification_schedule_boards ADD COLUMN show_repeating_events INTEGER DEFAULT 1")
-
-        # Add use_user_timezone column if it doesn't exist
-        try:
-            self.cursor.execute("SELECT use_user_timezone FROM notification_schedule_boards LIMIT 1")
-        except sqlite3.OperationalError:
-            self.cursor.execute("ALTER TABLE notification_schedule_boards ADD COLUMN use_user_timezone INTEGER DEFAULT 0")
-
-        # Add hide_daily_reset column if it doesn't exist
-        try:
-            self.cursor.execute("SELECT hide_daily_reset FROM notification_schedule_boards LIMIT 1")
-        except sqlite3.OperationalError:
-            self.cursor.execute("ALTER TABLE notification_schedule_boards ADD COLUMN hide_daily_reset INTEGER DEFAULT 1")
+        # Add columns introduced after the table was first created, if they don't exist
+        existing_columns = {row[1] for row in self.cursor.execute("PRAGMA table_info(notification_schedule_boards)")}
+        for column, definition in (
+            ("show_repeating_events", "INTEGER DEFAULT 1"),
+            ("use_user_timezone", "INTEGER DEFAULT 0"),
+            ("hide_daily_reset", "INTEGER DEFAULT 1"),
+        ):
+            if column not in existing_columns:
+                self.cursor.execute(f"ALTER TABLE notification_schedule_boards ADD COLUMN {column} {definition}")
+
+        # Daily refresh looks boards up by timezone; urgency refresh by guild, type and target channel
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_nsb_timezone ON notification_schedule_boards(timezone)")
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_nsb_guild_type_target
+            ON notification_schedule_boards(guild_id, board_type, target_channel_id)
+        """)
 
         self.conn.commit()
 
-        # Single lock for board updates
-        self._board_update_lock = asyncio.Lock()
+        # Read-only connection for the refresh loops and embed rendering, so those scans never
+        # share a handle with board writes
+        self.rconn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=30.0, check_same_thread=False)
+        self.rconn.execute("PRAGMA mmap_size=268435456")
+        self.rconn.execute("PRAGMA cache_size=-65536")
+        self._read_lock = threading.Lock()
+        # Serialises statements sent to the writer connection from worker threads
+        self._write_lock = threading.Lock()
+
+        # Per-board locks so the same board is never edited twice at once, while different boards
+        # refresh in parallel; the semaphore caps how many board refreshes are in flight
+        self._board_update_locks = {}
+        self._refresh_sem = asyncio.Semaphore(8)
+
+        # Event-loop time of each board's last successful refresh, so the background loops can
+        # skip boards that were just re-rendered
+        self._recent_refresh = {}
+
+        # Notification-driven refreshes waiting out the debounce window, by board id
+        self._pending_updates = {}
+        self._debounce_seconds = 2.0
+        # Every debounced refresh task, waiting or already rendering, so unload can cancel them all
+        self._update_tasks = set()
+
+        # Set when the set of board timezones may have changed, so daily_refresh_loop reschedules
+        self._board_timezones_changed = asyncio.Event()
 
         self.logger.info("[SCHEDULE] Cog initialized successfully")
 
@@ -100,6 +168,7 @@ class BearTrapSchedule(commands.Cog):
         self.logger.info("[SCHEDULE] Starting background tasks...")
         self.refresh_task = asyncio.create_task(self.daily_refresh_loop())
         self.urgency_task = asyncio.create_task(self.urgency_update_loop())
+        self.optimize_task = asyncio.create_task(self._pragma_optimize_loop())
 
         # Refresh all boards on startup
         self.logger.info("[SCHEDULE] Refreshing all boards on startup...")
@@ -114,7 +183,15 @@ class BearTrapSchedule(commands.Cog):
             self.refresh_task.cancel()
         if hasattr(self, 'urgency_task'):
             self.urgency_task.cancel()
-
+        if hasattr(self, 'optimize_task'):
+            self.optimize_task.cancel()
+        for task in self._update_tasks:
+            task.cancel()
+        self._update_tasks.clear()
+        self._pending_updates.clear()
+
+        if hasattr(self, 'rconn'):
+            self.rconn.close()
         if hasattr(self, 'conn'):
             self.conn.close()
         self.logger.info("[SCHEDULE] Cog unloaded")
@@ -124,77 +201,199 @@ class BearTrapSchedule(commands.Cog):
         await self.bot.wait_until_ready()
 
         try:
-            # Get all board IDs
-            self.cursor.execute("SELECT id FROM notification_schedule_boards")
-            board_ids = [row[0] for row in self.cursor.fetchall()]
+            # Only boards in guilds the bot is still in are worth a refresh
+            live_guilds = [guild.id for guild in self.bot.guilds]
+            if not live_guilds:
+                return
+            placeholders = ','.join('?' * len(live_guilds))
+            rows = await self.db_fetchall(f"""
+                SELECT id, channel_id FROM notification_schedule_boards
+                WHERE guild_id IN ({placeholders})
+            """, live_guilds)
+
+            # Boards whose channel is gone would be removed by update_schedule_board after a failed
+            # lookup; remove them in one batch up front instead
+            board_ids = [board_id for board_id, channel_id in rows if self.bot.get_channel(channel_id)]
+            stale_ids = [board_id for board_id, channel_id in rows if not self.bot.get_channel(channel_id)]
+            if stale_ids:
+                await self.db_execute(
+                    f"DELETE FROM notification_schedule_boards WHERE id IN ({','.join('?' * len(stale_ids))})",
+                    stale_ids
+                )
+                for board_id in stale_ids:
+                    self._forget_board(board_id)
+                self.invalidate_board_timezones()
+                self.logger.info(f"[SCHEDULE] Removed {len(stale_ids)} board(s) whose channel no longer exists")
 
             self.logger.info(f"[SCHEDULE] Found {len(board_ids)} board(s) to refresh on startup")
 
-            # Refresh each board
-            refreshed = 0
-            for board_id in board_ids:
-                try:
-                    await self.update_schedule_board(board_id)
-                    refreshed += 1
-                except Exception as e:
-                    self.logger.error(f"[SCHEDULE] Failed to refresh board {board_id} on startup: {e}")
-                    continue
+            # Refresh boards concurrently
+            results = await self._refresh_boards(board_ids)
+            refreshed = sum(1 for ok in results if ok)
 
             self.logger.info(f"[SCHEDULE] Startup refresh complete: {refreshed}/{len(board_ids)} boards updated")
 
         except Exception as e:
             self.logger.error(f"[SCHEDULE] Error during startup refresh: {e}")
 
+    async def _guarded_update(self, board_id: int) -> bool:
+        """Update one board under the refresh semaphore, logging instead of raising on failure"""
+        async with self._refresh_sem:
+            try:
+                return await self.update_schedule_board(board_id)
+            except Exception as e:
+                self.logger.error(f"[SCHEDULE] Failed to refresh board {board_id}: {e}")
+                return False
+
+    def _not_recently_refreshed(self, board_ids, window: float = 30.0) -> set:
+        """Drop boards refreshed within the last `window` seconds"""
+        now = asyncio.get_running_loop().time()
+        return {b for b in board_ids if now - self._recent_refresh.get(b, float('-inf')) > window}
+
+    def _forget_board(self, board_id: int):
+        """Drop the per-board refresh state of a board whose row was deleted"""
+        self._board_update_locks.pop(board_id, None)
+        self._recent_refresh.pop(board_id, None)
+        pending = self._pending_updates.pop(board_id, None)
+        if pending:
+            pending.cancel()
+
+    def schedule_update(self, board_id: int):
+        """Refresh a board after a short quiet period; further requests in the meantime restart the wait"""
+        pending = self._pending_updates.get(board_id)
+        if pending:
+            pending.cancel()
+        task = asyncio.create_task(self._debounced_update(board_id))
+        self._pending_updates[board_id] = task
+        self._update_tasks.add(task)
+        task.add_done_callback(self._update_tasks.discard)
+
+    async def _debounced_update(self, board_id: int):
+        await asyncio.sleep(self._debounce_seconds)
+        # Leave the pending map before rendering, so a request arriving mid-update queues a fresh one
+        self._pending_updates.pop(board_id, None)
+        await self._guarded_update(board_id)
+
+    async def _refresh_boards(self, board_ids) -> list:
+        """Refresh several boards concurrently (at most 8 at a time). Returns one success flag per board."""
+        return await asyncio.gather(*(self._guarded_update(board_id) for board_id in board_ids))
+
+    async def _pragma_optimize_loop(self):
+        """Let SQLite refresh its query planner statistics every 15 minutes"""
+        while True:
+            await asyncio.sleep(900)
+            try:
+                await self.db_execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                self.logger.error(f"[SCHEDULE] PRAGMA optimize failed: {e}")
+
+    def _run_read(self, query: str, params, fetch: str):
+        with self._read_lock:
+            cursor = self.rconn.execute(query, params)
+            return cursor.fetchone() if fetch == "one" else cursor.fetchall()
+
+    async def db_fetchone(self, query: str, params=()):
+        """Run a SELECT on a worker thread and return the first row."""
+        return await asyncio.to_thread(self._run_read, query, params, "one")
+
+    async def db_fetchall(self, query: str, params=()) -> list:
+        """Run a SELECT on a worker thread and return all rows."""
+        return await asyncio.to_thread(self._run_read, query, params, "all")
+
+    def _run_write(self, query: str, params):
+        with self._write_lock:
+            try:
+                cursor = self.conn.execute(query, params)
+                self.conn.commit()
+                return cursor
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    async def db_execute(self, query: str, params=()) -> int:
+        """Run a write statement on a worker thread and commit it. Returns the rowcount."""
+        cursor = await asyncio.to_thread(self._run_write, query, params)
+        return cursor.rowcount
+
+    async def db_insert(self, query: str, params=()) -> int:
+        """Run an INSERT on a worker thread and commit it. Returns the new row id."""
+        cursor = await asyncio.to_thread(self._run_write, query, params)
+        return cursor.lastrowid
+
+    def invalidate_board_timezones(self):
+        """Wake daily_refresh_loop to reload board timezones after a board is created, deleted or re-zoned."""
+        self._board_timezones_changed.set()
+
+    @staticmethod
+    def _next_daily_refresh(tz, now_utc: datetime) -> datetime:
+        """Return the next 00:01 local time in tz as a UTC datetime."""
+        now_local = now_utc.astimezone(tz)
+        fire_local = tz.localize(datetime.combine(now_local.date(), datetime.min.time()).replace(minute=1))
+        if fire_local <= now_local:
+            fire_local = tz.localize(datetime.combine(now_local.date() + timedelta(days=1), datetime.min.time()).replace(minute=1))
+        return fire_local.astimezone(UTC)
+
     async def daily_refresh_loop(self):
         """Background task that refreshes all boards daily at midnight in their timezone"""
         await self.bot.wait_until_ready()
 
         while not self.bot.is_closed():
             try:
+                self._board_timezones_changed.clear()
+
                 # Get all unique timezones from boards
-                self.cursor.execute("""
+                rows = await self.db_fetchall("""
                     SELECT DISTINCT timezone FROM notification_schedule_boards
                 """)
-                timezones = [row[0] for row in self.cursor.fetchall()]
-
-                # For each timezone, check if it's midnight (00:01)
-                now_utc = datetime.now(pytz.UTC)
+                timezones = [row[0] for row in rows]
 
+                # Min-heap of (next 00:01 in UTC, timezone) so the loop sleeps until the next one is due
+                now_utc = datetime.now(UTC)
+                schedule = []
                 for tz_str in timezones:
                     try:
-                        tz = pytz.timezone(tz_str)
-                        now_in_tz = now_utc.astimezone(tz)
+                        tz = get_timezone(tz_str)
+                    except Exception as e:
+                        self.logger.error(f"[SCHEDULE] Error refreshing timezone {tz_str}: {e}")
+                        continue
+                    schedule.append((self._next_daily_refresh(tz, now_utc), tz_str, tz))
+                heapq.heapify(schedule)
 
-                        # Check if it's 00:01 in this timezone (1-minute window)
-                        if now_in_tz.hour == 0 and now_in_tz.minute == 1:
-                            self.logger.info(f"[SCHEDULE] Daily refresh triggered for timezone: {tz_str}")
+                while not self._board_timezones_changed.is_set():
+                    delay = (schedule[0][0] - datetime.now(UTC)).total_seconds() if schedule else None
+                    if delay is None or delay > 0:
+                        try:
+                            # Board changes wake the loop early so it can rebuild the schedule
+                            await asyncio.wait_for(self._board_timezones_changed.wait(), timeout=delay)
+                            break
+                        except asyncio.TimeoutError:
+                            pass
+
+                    fire_at, tz_str, tz = schedule[0]
+                    heapq.heapreplace(schedule, (self._next_daily_refresh(tz, fire_at), tz_str, tz))
+
+                    try:
+                        self.logger.info(f"[SCHEDULE] Daily refresh triggered for timezone: {tz_str}")
 
-                            # Get all boards in this timezone
-                            self.cursor.execute("""
-                                SELECT id FROM notification_schedule_boards
-                                WHERE timezone = ?
-                            """, (tz_str,))
-                            board_ids = [row[0] for row in self.cursor.fetchall()]
+                        # Get all boards in this timezone
+                        rows = await self.db_fetchall("""
+                            SELECT id FROM notification_schedule_boards
+                            WHERE timezone = ?
+                        """, (tz_str,))
+                        board_ids = self._not_recently_refreshed(row[0] for row in rows)
 
-                            # Refresh each board
-                            for board_id in board_ids:
-                                await self.update_schedule_board(board_id)
+                        # Refresh boards concurrently
+                        await self._refresh_boards(board_ids)
 
-                            self.logger.info(f"[SCHEDULE] Refreshed {len(board_ids)} board(s) for timezone {tz_str}")
+                        self.logger.info(f"[SCHEDULE] Refreshed {len(board_ids)} board(s) for timezone {tz_str}")
 
                     except Exception as e:
                         self.logger.error(f"[SCHEDULE] Error refreshing timezone {tz_str}: {e}")
                         print(f"[ERROR] Error refreshing timezone {tz_str}: {e}")
-                        self.conn.rollback()
-                        continue
-
-                # Sleep for 60 seconds before next check
-                await asyncio.sleep(60)
 
             except Exception as e:
                 self.logger.error(f"[SCHEDULE] Error in daily refresh loop: {e}")
                 print(f"[ERROR] Error in daily refresh loop: {e}")
-                self.conn.rollback()
                 await asyncio.sleep(60)  # Continue even if error occurs
 
     async def urgency_update_loop(self):
@@ -206,66 +405,40 @@ class BearTrapSchedule(commands.Cog):
 
         while not self.bot.is_closed():
             try:
-                now_utc = datetime.now(pytz.UTC)
+                now_utc = datetime.now(UTC)
 
-                # Get all notifications that are approaching
-                self.cursor.execute("""
-                    SELECT id, channel_id, next_notification
-                    FROM bear_notifications
-                    WHERE is_enabled = 1 AND next_notification IS NOT NULL
-                """)
-                notifications = self.cursor.fetchall()
+                # Get only the notifications that just crossed the 6-hour or 1-hour threshold
+                crossings = await self.db_fetchall(SQL_THRESHOLD_CROSSINGS, (now_utc.isoformat(),))
 
-                boards_to_update = set()
+                # Skip notifications whose channel is not accessible
+                guild_ids = set()
+                channel_ids = set()
+                for notif_id, guild_id, channel_id in crossings:
+                    if self.bot.get_channel(channel_id):
+                        guild_ids.add(guild_id)
+                        channel_ids.add(channel_id)
 
-                for notif_id, channel_id, next_notif_str in notifications:
-                    try:
-                        # Parse next notification time
-                        next_time = datetime.fromisoformat(next_notif_str.replace('Z', '+00:00'))
-                        if next_time.tzinfo is None:
-                            next_time = pytz.UTC.localize(next_time)
-
-                        # Calculate time until notification
-                        time_until = (next_time - now_utc).total_seconds() / 3600.0  # in hours
-
-                        # Check if we're crossing the 6-hour or 1-hour threshold
-                        crossing_threshold = False
-
-                        if 6.0 < time_until <= 6.083:  # Just crossed 6-hour threshold
-                            crossing_threshold = True
-                        elif 1.0 < time_until <= 1.083:  # Just crossed 1-hour threshold
-                            crossing_threshold = True
-
-                        if crossing_threshold:
-                            # Find all boards that should show this notification
-                            channel = self.bot.get_channel(channel_id)
-                            if not channel:
-                                continue  # Skip if channel not accessible
-
-                            guild_id = channel.guild.id
-
-                            self.cursor.execute("""
-                                SELECT DISTINCT nsb.id
-                                FROM notification_schedule_boards nsb
-                                WHERE nsb.guild_id = ?
-                                AND (
-                                    (nsb.board_type = 'server')
-                                    OR (nsb.board_type = 'channel' AND nsb.target_channel_id = ?)
-                                )
-                            """, (guild_id, channel_id))
-
-                            for (board_id,) in self.cursor.fetchall():
-                                boards_to_update.add(board_id)
-
-                    except Exception as e:
-                        self.logger.error(f"[SCHEDULE] Error processing notification {notif_id}: {e}")
-                        continue
+                # Find all boards that should show any of these notifications in one query
+                # (channel ids are globally unique, so the guild filter keeps channel boards correct)
+                boards_to_update = set()
+                if guild_ids:
+                    guild_placeholders = ','.join('?' * len(guild_ids))
+                    channel_placeholders = ','.join('?' * len(channel_ids))
+                    rows = await self.db_fetchall(f"""
+                        SELECT DISTINCT nsb.id
+                        FROM notification_schedule_boards nsb
+                        WHERE nsb.guild_id IN ({guild_placeholders})
+                        AND (
+                            (nsb.board_type = 'server')
+                            OR (nsb.board_type = 'channel' AND nsb.target_channel_id IN ({channel_placeholders}))
+                        )
+                    """, (*guild_ids, *channel_ids))
+                    boards_to_update = self._not_recently_refreshed(board_id for (board_id,) in rows)
 
                 # Update all affected boards
                 if boards_to_update:
                     self.logger.info(f"[SCHEDULE] Urgency update - refreshing {len(boards_to_update)} board(s)")
-                    for board_id in boards_to_update:
-                        await self.update_schedule_board(board_id)
+                    await self._refresh_boards(boards_to_update)
 
                 # Check every 5 minutes
                 await asyncio.sleep(300)
@@ -273,7 +446,6 @@ class BearTrapSchedule(commands.Cog):
             except Exception as e:
                 self.logger.error(f"[SCHEDULE] Error in urgency update loop: {e}")
                 print(f"[ERROR] Error in urgency update loop: {e}")
-                self.conn.rollback()
                 await asyncio.sleep(300)  # Continue even if error occurs
 
     async def create_schedule_board(self, guild_id: int, channel_id: int, board_type: str,
@@ -292,11 +464,10 @@ class BearTrapSchedule(commands.Cog):
                 return (None, "Bot doesn't have permission to send messages in that channel!")
 
             # Check if a board with same configuration already exists
-            self.cursor.execute("""
+            existing = await self.db_fetchone("""
                 SELECT id FROM notification_schedule_boards
                 WHERE guild_id = ? AND channel_id = ? AND board_type = ? AND target_channel_id = ?
             """, (guild_id, channel_id, board_type, target_channel_id))
-            existing = self.cursor.fetchone()
             if existing:
                 return (None, "A board with this configuration already exists in this channel. Delete the existing board first or choose a different channel.")
 
@@ -316,7 +487,7 @@ class BearTrapSchedule(commands.Cog):
                     pass  # Bot lacks pin permissions, continue anyway
 
             # Save to database
-            self.cursor.execute("""
+            board_id = await self.db_insert("""
                 INSERT INTO notification_schedule_boards
                 (guild_id, channel_id, message_id, board_type, target_channel_id,
                  max_events, show_disabled, auto_pin, timezone, filter_name, filter_time_range, show_repeating_events, use_user_timezone, hide_daily_reset, created_by, last_updated)
@@ -333,11 +504,9 @@ class BearTrapSchedule(commands.Cog):
                 1 if settings.get('use_user_timezone', False) else 0,
                 1 if settings.get('hide_daily_reset', True) else 0,
                 creator_id,
-                datetime.now(pytz.UTC).isoformat()
+                datetime.now(UTC).isoformat()
             ))
-
-            self.conn.commit()
-            board_id = self.cursor.lastrowid
+            self.invalidate_board_timezones()
 
             # Attach pagination view with the board_id
             total_pages = self._get_total_pages_from_footer(embed.footer.text if embed.footer else "")
@@ -362,11 +531,10 @@ class BearTrapSchedule(commands.Cog):
         """
         try:
             # Fetch board info
-            self.cursor.execute("""
+            result = await self.db_fetchone("""
                 SELECT guild_id, channel_id, message_id, auto_pin FROM notification_schedule_boards
                 WHERE id = ?
             """, (board_id,))
-            result = self.cursor.fetchone()
 
             if not result:
                 return (False, "Board not found!")
@@ -392,8 +560,9 @@ class BearTrapSchedule(commands.Cog):
                 print(f"[ERROR] Failed to delete Discord message: {e}")
 
             # Remove from database
-            self.cursor.execute("DELETE FROM notification_schedule_boards WHERE id = ?", (board_id,))
-            self.conn.commit()
+            await self.db_execute("DELETE FROM notification_schedule_boards WHERE id = ?", (board_id,))
+            self.invalidate_board_timezones()
+            self._forget_board(board_id)
 
             self.logger.info(f"[SCHEDULE] Board deleted - ID: {board_id}, Guild: {guild_id}, Channel: {channel_id}")
 
@@ -412,13 +581,12 @@ class BearTrapSchedule(commands.Cog):
         """
         try:
             # Fetch board info
-            self.cursor.execute("""
+            result = await self.db_fetchone("""
                 SELECT guild_id, channel_id, message_id, board_type, target_channel_id,
                        max_events, show_disabled, auto_pin, timezone, filter_name, filter_time_range, show_repeating_events
                 FROM notification_schedule_boards
                 WHERE id = ?
             """, (board_id,))
-            result = self.cursor.fetchone()
 
             if not result:
                 return (False, "Board not found!")
@@ -478,13 +646,11 @@ class BearTrapSchedule(commands.Cog):
                 pass  # Old message already deleted
 
             # Update database
-            self.cursor.execute("""
+            await self.db_execute("""
                 UPDATE notification_schedule_boards
                 SET channel_id = ?, message_id = ?, last_updated = ?
                 WHERE id = ?
-            """, (new_channel_id, new_message.id, datetime.now(pytz.UTC).isoformat(), board_id))
-
-            self.conn.commit()
+            """, (new_channel_id, new_message.id, datetime.now(UTC).isoformat(), board_id))
 
             self.logger.info(f"[SCHEDULE] Board moved - ID: {board_id}, From: {old_channel_id}, To: {new_channel_id}")
 
@@ -509,13 +675,7 @@ class BearTrapSchedule(commands.Cog):
         """
         try:
             # Fetch board settings
-            self.cursor.execute("""
-                SELECT guild_id, board_type, target_channel_id, max_events,
-                       show_disabled, timezone, filter_name, filter_time_range, show_repeating_events, use_user_timezone, hide_daily_reset
-                FROM notification_schedule_boards
-                WHERE id = ?
-            """, (board_id,))
-            result = self.cursor.fetchone()
+            result = await self.db_fetchone(SQL_SELECT_BOARD_SETTINGS, (board_id,))
 
             if not result:
                 return self._create_error_embed("Board not found!")
@@ -547,46 +707,21 @@ class BearTrapSchedule(commands.Cog):
                                                 target_channel_id: int, settings: dict, page: int) -> discord.Embed:
         """Internal method to generate schedule embed"""
         try:
-            # Query notifications based on board type
-            query = """
-                SELECT id, channel_id, hour, minute, timezone, description,
-                       notification_type, next_notification, is_enabled, repeat_enabled, repeat_minutes, event_type
-                FROM bear_notifications
-                WHERE guild_id = ?
-            """
-            params = [guild_id]
-
-            # Filter by channel if per-channel board
-            if board_type == 'channel' and target_channel_id:
-                query += " AND channel_id = ?"
-                params.append(target_channel_id)
-
-            # Filter by enabled status
-            if not settings.get('show_disabled', False):
-                query += " AND is_enabled = 1"
-
-            # Filter by name if specified
+            # Query notifications based on board type; unused filters are bound as NULL so the
+            # statement text never changes
+            names = None
             if settings.get('filter_name'):
-                names = [n.strip() for n in settings['filter_name'].split(',')]
-                name_conditions = " OR ".join(["description LIKE ?" for _ in names])
-                query += f" AND ({name_conditions})"
-                params.extend([f"%{name}%" for name in names])
-
-            # Filter by time range if specified
-            if settings.get('filter_time_range'):
-                hours = settings['filter_time_range']
-                query += " AND datetime(next_notification) <= datetime('now', '+' || ? || ' hours')"
-                params.append(hours)
-
-            # Exclude past events
-            query += " AND next_notification IS NOT NULL AND datetime(next_notification) > datetime('now') ORDER BY next_notification ASC"
-
-            self.cursor.execute(query, params)
-            notifications = self.cursor.fetchall()
-
-            # Filter out Daily Reset events
-            if settings.get('hide_daily_reset', True):
-                notifications = [n for n in notifications if n[11] != 'Daily Reset']  # n[11] is event_type
+                names = json.dumps([n.strip() for n in settings['filter_name'].split(',')])
+
+            notifications = await self.db_fetchall(SQL_BOARD_NOTIFICATIONS, {
+                'guild_id': guild_id,
+                # Filter by channel if per-channel board
+                'channel_id': target_channel_id if board_type == 'channel' and target_channel_id else None,
+                'show_disabled': int(bool(settings.get('show_disabled', False))),
+                'names': names,
+                'hours': settings.get('filter_time_range') or None,
+                'hide_daily_reset': int(bool(settings.get('hide_daily_reset', True))),
+            })
 
             # No notifications found
             if not notifications:
@@ -594,150 +729,150 @@ class BearTrapSchedule(commands.Cog):
 
             # Expand repeating events if enabled
             show_repeating = settings.get('show_repeating_events', True)
-            expanded_events = []
-            now = datetime.now(pytz.UTC)
+            now = datetime.now(UTC)
 
             # Determine time window for expanding repeating events (30 days)
             max_future_time = now + timedelta(days=30)
 
-            for notif in notifications:
+            # Fetch the weekdays of every weekday-repeating notification in one query
+            days_by_id = {}
+            if show_repeating:
+                weekday_ids = [n[0] for n in notifications if n[9] and n[10] == -1]
+                if weekday_ids:
+                    placeholders = ','.join('?' * len(weekday_ids))
+                    rows = await self.db_fetchall(f"""
+                        SELECT notification_id, weekday FROM notification_days
+                        WHERE notification_id IN ({placeholders})
+                    """, weekday_ids)
+                    for nid, weekday in rows:
+                        days_by_id.setdefault(nid, set()).update(int(p) for p in weekday.split('|'))
+
+            def occurrences(next_time, notif):
+                """Yield (time, notif) for each occurrence of one notification, in time order.
+                notif is the row as fetched; its next_notification (parsed as next_time) is the first occurrence only."""
                 (notif_id, channel_id, hour, minute, notif_timezone, description,
                  notification_type, next_notification, is_enabled, repeat_enabled, repeat_minutes, event_type) = notif
 
-                next_time = datetime.fromisoformat(next_notification)
-
-                # Add the first occurrence
-                expanded_events.append((next_time, notif))
+                # The first occurrence
+                yield (next_time, notif)
 
                 # If repeating events are enabled and this event repeats, generate future occurrences
                 if show_repeating and repeat_enabled:
                     if isinstance(repeat_minutes, int) and repeat_minutes > 0:
-                        # Handle interval-based repeating (every X minutes)
-                        current_time = next_time
-                        while True:
-                            current_time = current_time + timedelta(minutes=repeat_minutes)
-                            if current_time > max_future_time:
-                                break
-                            # Create a modified notification tuple with updated next_notification
-                            modified_notif = list(notif)
-                            modified_notif[7] = current_time.isoformat()  # Update next_notification
-                            expanded_events.append((current_time, tuple(modified_notif)))
+                        # Handle interval-based repeating (every X minutes): the number of
+                        # occurrences inside the window is known up front, so step by multiples
+                        step = timedelta(minutes=repeat_minutes)
+                        occurrence_count = (max_future_time - next_time) // step
+                        for k in range(1, occurrence_count + 1):
+                            # The occurrence time travels alongside the unchanged notification tuple
+                            yield (next_time + step * k, notif)
 
                     elif repeat_minutes == -1:
                         # Handle fixed weekday repeating
-                        self.cursor.execute("""
-                            SELECT weekday FROM notification_days
-                            WHERE notification_id = ?
-                        """, (notif_id,))
-                        rows = self.cursor.fetchall()
-                        notification_days = set()
-
-                        for row in rows:
-                            parts = row[0].split('|')
-                            notification_days.update(int(p) for p in parts)
-
-                        # Generate occurrences for each matching weekday
+                        notification_days = days_by_id.get(notif_id, set())
+
+                        # Generate occurrences for each matching weekday; weekdays are stepped
+                        # arithmetically so only matching days build a datetime
                         current_date = next_time.date()
-                        event_tz = pytz.timezone(notif_timezone)
+                        start_weekday = current_date.weekday()
+                        event_tz = get_timezone(notif_timezone)
+                        time_of_day = time(hour, minute)
 
                         for day_offset in range(1, 31):  # Check next 30 days
-                            check_date = current_date + timedelta(days=day_offset)
-                            if check_date.weekday() in notification_days:
-                                occurrence_time = event_tz.localize(
-                                    datetime.combine(check_date, datetime.min.time()).replace(hour=hour, minute=minute)
-                                )
-                                occurrence_time_utc = occurrence_time.astimezone(pytz.UTC)
+                            if (start_weekday + day_offset) % 7 in notification_days:
+                                check_date = current_date + timedelta(days=day_offset)
+                                occurrence_time = event_tz.localize(datetime.combine(check_date, time_of_day))
+                                occurrence_time_utc = occurrence_time.astimezone(UTC)
 
                                 if occurrence_time_utc > max_future_time:
                                     break
 
-                                # Create a modified notification tuple
-                                modified_notif = list(notif)
-                                modified_notif[7] = occurrence_time_utc.isoformat()
-                                expanded_events.append((occurrence_time_utc, tuple(modified_notif)))
+                                yield (occurrence_time_utc, notif)
 
-            # Sort all events by time
-            expanded_events.sort(key=lambda x: x[0])
+            def future_count(next_time, notif):
+                """Number of occurrences after now, without generating interval repeats"""
+                repeat_enabled, repeat_minutes = notif[9], notif[10]
+                if show_repeating and repeat_enabled and isinstance(repeat_minutes, int) and repeat_minutes > 0:
+                    step = timedelta(minutes=repeat_minutes)
+                    last_k = (max_future_time - next_time) // step
+                    first_k = max(1, (now - next_time) // step + 1)
+                    return (1 if next_time > now else 0) + max(0, last_k - first_k + 1)
+                return sum(1 for event_time, _ in occurrences(next_time, notif) if event_time > now)
 
-            # Filter to only future events
-            future_events = [(time, notif) for time, notif in expanded_events if time > now]
-
-            if not future_events:
-                return self._create_empty_schedule_embed(board_type, target_channel_id, settings)
+            parsed = [(datetime.fromisoformat(notif[7]), notif) for notif in notifications]
 
             # Pagination (cap at 30 events per page)
             max_events = min(settings.get('max_events', 15), 30)
-            total_events = len(future_events)
-            total_pages = math.ceil(total_events / max_events) if total_events > 0 else 1
+            total_events = sum(future_count(next_time, notif) for next_time, notif in parsed)
+
+            if not total_events:
+                return self._create_empty_schedule_embed(board_type, target_channel_id, settings)
+
+            total_pages = math.ceil(total_events / max_events)
             page = max(0, min(page, total_pages - 1))  # Clamp page
 
+            # Each notification's occurrences are already in time order, so merge them and stop once
+            # the requested page is filled instead of expanding the whole 30-day window
+            merged = heapq.merge(*(occurrences(next_time, notif) for next_time, notif in parsed), key=itemgetter(0))
             start_idx = page * max_events
-            end_idx = min(start_idx + max_events, total_events)
-            page_events = future_events[start_idx:end_idx]
+            page_events = list(islice((event for event in merged if event[0] > now), start_idx, start_idx + max_events))
 
             # Format notifications by urgency
             tz_string = settings.get('timezone', 'UTC')
             tz = self._get_timezone_object(tz_string)
-
+            use_user_tz = settings.get('use_user_timezone', 0)
+            tz_display = self._format_timezone_display(tz_string)
+            now_tz = now.astimezone(tz)
+            one_year_from_now = now_tz.date() + timedelta(days=365)
+
+            # page_events is in time order, so each urgency section is a contiguous slice; find the
+            # boundaries by bisecting on the event times
+            section_names = ('imminent', 'soon', 'upcoming', 'this_week', 'next_week', 'later')
+            cutoffs = (
+                now + timedelta(hours=1),   # imminent: < 1 hour
+                now + timedelta(hours=6),   # soon: 1-6 hours
+                now + timedelta(hours=24),  # upcoming: 6-24 hours
+                now + timedelta(days=7),    # this_week: 1-7 days
+                now + timedelta(days=14),   # next_week: 7-14 days
+            )                               # later: 14-30 days
+            event_times = [event_time for event_time, _ in page_events]
+            bounds = [0, *(bisect.bisect_left(event_times, cutoff) for cutoff in cutoffs), len(page_events)]
             sections = {
-                'imminent': [],   # < 1 hour
-                'soon': [],       # 1-6 hours
-                'upcoming': [],   # 6-24 hours
-                'this_week': [],  # 1-7 days
-                'next_week': [],  # 7-14 days
-                'later': []       # 14-30 days
+                name: page_events[bounds[i]:bounds[i + 1]]
+                for i, name in enumerate(section_names)
             }
 
-            for event_time, notif in page_events:
-                time_until = event_time - now
-                hours_until = time_until.total_seconds() / 3600
-                days_until = hours_until / 24
-
-                # Store event with its time for later grouping by date
-                event_data = (event_time, notif)
-
-                if hours_until < 1:
-                    sections['imminent'].append(event_data)
-                elif hours_until < 6:
-                    sections['soon'].append(event_data)
-                elif hours_until < 24:
-                    sections['upcoming'].append(event_data)
-                elif days_until < 7:
-                    sections['this_week'].append(event_data)
-                elif days_until < 14:
-                    sections['next_week'].append(event_data)
-                else:
-                    sections['later'].append(event_data)
-
             # Build embed
             if board_type == 'channel':
                 channel_text = f"from <#{target_channel_id}> "
             else:
                 channel_text = ""
 
-            if settings.get('use_user_timezone', 0):
+            if use_user_tz:
                 tz_info = f"Showing all upcoming events {channel_text}in your local timezone."
             else:
-                tz_display = self._format_timezone_display(settings.get('timezone', 'UTC'))
                 tz_info = f"Showing all upcoming events {channel_text}in {tz_display}."
-            description = f"{theme.calendarIcon} **Upcoming Event Schedule**\n{tz_info}\n\n"
-
-            # Helper function to format section with day grouping
-            async def format_section_with_days(events, show_channel):
-                from collections import defaultdict
-                days_dict = defaultdict(list)
-
-                # Group events by date
-                for event_time, notif in events:
-                    event_time_tz = event_time.astimezone(tz)
-                    date_key = event_time_tz.date()
-                    days_dict[date_key].append((event_time, notif))
-
-                # Build formatted output
-                output_lines = []
-                one_year_from_now = now.date() + timedelta(days=365)
 
-                for date in sorted(days_dict.keys()):
+            # Fetch the titles of all embed notifications on this page in one query
+            embed_ids = list({notif[0] for _, notif in page_events if "EMBED_MESSAGE:" in notif[5]})
+            title_cache = {}
+            if embed_ids:
+                rows = await self.db_fetchall(f"""
+                    SELECT notification_id, title FROM bear_notification_embeds
+                    WHERE notification_id IN ({','.join('?' * len(embed_ids))})
+                """, embed_ids)
+                title_cache = dict(rows)
+
+            # The description is written into one buffer rather than grown by repeated concatenation
+            buf = io.StringIO()
+            buf.write(f"{theme.calendarIcon} **Upcoming Event Schedule**\n{tz_info}\n\n")
+
+            # Helper function to write a titled section with day grouping into the buffer
+            async def write_section_with_days(title, events, show_channel):
+                buf.write(f"{title}\n")
+
+                # Events are in time order, so consecutive runs share a date in the board timezone
+                for date, day_events in groupby(events, key=lambda event: event[0].astimezone(tz).date()):
                     # Date header
                     if date <= one_year_from_now:
                         # "27 November - Saturday"
@@ -746,40 +881,36 @@ class BearTrapSchedule(commands.Cog):
                         # "27 November 2025 - Saturday"
                         date_str = date.strftime('%d %B %Y - %A')
 
-                    output_lines.append(f"- **{date_str}**")
+                    buf.write(f"- **{date_str}**\n")
 
                     # Format events for this day
-                    for event_time, notif in days_dict[date]:
-                        line = await self._format_event_line(notif, tz, show_channel, settings.get('use_user_timezone', 0))
-                        output_lines.append(f"└ {line}")
+                    for event_time, notif in day_events:
+                        line = await self._format_event_line(notif, tz, show_channel, use_user_tz,
+                                                             event_time=event_time, title_cache=title_cache)
+                        buf.write(f"└ {line}\n")
 
-                return "\n".join(output_lines)
+                buf.write("\n")
 
             if sections['imminent']:
-                description += "🔴 **IMMINENT** (< 1 hour)\n"
-                description += await format_section_with_days(sections['imminent'], board_type == 'server') + "\n\n"
+                await write_section_with_days("🔴 **IMMINENT** (< 1 hour)", sections['imminent'], board_type == 'server')
 
             if sections['soon']:
-                description += "🟡 **SOON** (1-6 hours)\n"
-                description += await format_section_with_days(sections['soon'], board_type == 'server') + "\n\n"
+                await write_section_with_days("🟡 **SOON** (1-6 hours)", sections['soon'], board_type == 'server')
 
             if sections['upcoming']:
-                description += "🟢 **UPCOMING** (6-24 hours)\n"
-                description += await format_section_with_days(sections['upcoming'], board_type == 'server') + "\n\n"
+                await write_section_with_days("🟢 **UPCOMING** (6-24 hours)", sections['upcoming'], board_type == 'server')
 
             if sections['this_week']:
-                description += f"{theme.calendarIcon} **2-7 DAYS**\n"
-                description += await format_section_with_days(sections['this_week'], board_type == 'server') + "\n\n"
+                await write_section_with_days(f"{theme.calendarIcon} **2-7 DAYS**", sections['this_week'], board_type == 'server')
 
             if sections['next_week']:
-                description += f"{theme.calendarIcon} **1-2 WEEKS**\n"
-                description += await format_section_with_days(sections['next_week'], board_type == 'server') + "\n\n"
+                await write_section_with_days(f"{theme.calendarIcon} **1-2 WEEKS**", sections['next_week'], board_type == 'server')
 
             if sections['later']:
-                description += "🗓️ **FUTURE** (14+ days)\n"
-                description += await format_section_with_days(sections['later'], board_type == 'server') + "\n\n"
+                await write_section_with_days("🗓️ **FUTURE** (14+ days)", sections['later'], board_type == 'server')
 
-            description += theme.lowerDivider
+            buf.write(theme.lowerDivider)
+            description = buf.getvalue()
 
             # Determine embed color based on nearest event
             if sections['imminent']:
@@ -797,12 +928,12 @@ class BearTrapSchedule(commands.Cog):
             )
 
             # Footer with pagination
-            if settings.get('use_user_timezone', 0):
+            if use_user_tz:
                 tz_indicator = "(Local Time)"
             else:
-                tz_indicator = f"({self._format_timezone_display(settings.get('timezone', 'UTC'))})"
+                tz_indicator = f"({tz_display})"
 
-            footer_text = f"Last updated: {now.astimezone(tz).strftime('%b %d, %I:%M %p')} {tz_indicator}"
+            footer_text = f"Last updated: {now_tz.strftime('%b %d, %I:%M %p')} {tz_indicator}"
             if total_pages > 1:
                 footer_text += f" | Page {page + 1} of {total_pages}"
             embed.set_footer(text=footer_text)
@@ -814,7 +945,8 @@ class BearTrapSchedule(commands.Cog):
             traceback.print_exc()
             return self._create_error_embed(f"Error: {str(e)}")
 
-    async def _format_event_line(self, notification, timezone_obj, show_channel: bool, use_user_timezone: int = 0) -> str:
+    async def _format_event_line(self, notification, timezone_obj, show_channel: bool, use_user_timezone: int = 0,
+                                 event_time: datetime = None, title_cache: dict = None) -> str:
         """Formats a single notification as a line in the schedule
 
         Args:
@@ -822,13 +954,15 @@ class BearTrapSchedule(commands.Cog):
             timezone_obj: Timezone object for calculations
             show_channel: Whether to show channel info
             use_user_timezone: Whether to use Discord timestamps for local timezone (1) or custom format (0)
+            event_time: Already-parsed occurrence time; parsed from next_notification when omitted
+            title_cache: Prefetched embed titles by notification id; queried per line when omitted
         """
         try:
             (notif_id, channel_id, hour, minute, notif_timezone, description,
              notification_type, next_notification, is_enabled, repeat_enabled, repeat_minutes, event_type) = notification
 
-            # Parse next notification time
-            next_time = datetime.fromisoformat(next_notification)
+            # Parse next notification time (the schedule passes the one it already parsed)
+            next_time = event_time if event_time is not None else datetime.fromisoformat(next_notification)
             next_time_tz = next_time.astimezone(timezone_obj)
 
             # Format time
@@ -841,18 +975,19 @@ class BearTrapSchedule(commands.Cog):
             # Get emoji for this event type
             emoji = get_event_icon(event_type) if event_type else "📅"
             event_name = event_type if event_type else "Event"
-            event_time_str = next_time_tz.strftime('%H:%M')
-            event_date_str = next_time_tz.strftime('%b %d')
 
             # Extract notification name
             if "EMBED_MESSAGE:" in description:
                 # Get embed title
-                self.cursor.execute("""
-                    SELECT title FROM bear_notification_embeds
-                    WHERE notification_id = ?
-                """, (notif_id,))
-                embed_result = self.cursor.fetchone()
-                name = embed_result[0] if embed_result and embed_result[0] else "Event"
+                if title_cache is not None:
+                    title = title_cache.get(notif_id)
+                else:
+                    embed_result = await self.db_fetchone("""
+                        SELECT title FROM bear_notification_embeds
+                        WHERE notification_id = ?
+                    """, (notif_id,))
+                    title = embed_result[0] if embed_result else None
+                name = title if title else "Event"
             elif "PLAIN_MESSAGE:" in description:
                 # Extract from plain message
                 name = description.split("PLAIN_MESSAGE:")[-1].split("|")[0].strip()
@@ -861,21 +996,22 @@ class BearTrapSchedule(commands.Cog):
             else:
                 name = description[:30] if len(description) > 30 else description
 
-            # Replace all placeholders in the name (from templates)
+            # Replace all placeholders in the name (from templates); the event time/date are only
+            # formatted when the name actually uses them
+            if "%e" in name:
+                name = name.replace("%e", time_str if not use_user_timezone else next_time_tz.strftime('%H:%M'))
+            if "%d" in name:
+                name = name.replace("%d", next_time_tz.strftime('%b %d'))
             name = (name
                 .replace("%i", emoji)
                 .replace("%n", event_name)
-                .replace("%e", event_time_str)
-                .replace("%d", event_date_str)
                 .replace("%t", "")  # Time remaining doesn't make sense in schedule board title
                 .replace("{time}", "")
                 .replace("{tag}", "")  # Mentions don't make sense in schedule board title
                 .replace("@tag", "")
             )
             # Clean up any double spaces from removed placeholders
-            while "  " in name:
-                name = name.replace("  ", " ")
-            name = name.strip()
+            name = MULTI_SPACE_RE.sub(" ", name).strip()
 
             # Strip "Notification" suffix if present (for backwards compatibility)
             if name.endswith(" Notification"):
@@ -905,32 +1041,40 @@ class BearTrapSchedule(commands.Cog):
         else:
             channel_text = ""
 
-        if settings.get('use_user_timezone', 0):
+        tz_string = settings.get('timezone', 'UTC')
+        use_user_tz = settings.get('use_user_timezone', 0)
+        tz_display = self._format_timezone_display(tz_string)
+
+        if use_user_tz:
             tz_info = f"Showing all upcoming events {channel_text}in your local timezone."
         else:
-            tz_display = self._format_timezone_display(settings.get('timezone', 'UTC'))
             tz_info = f"Showing all upcoming events {channel_text}in {tz_display}."
-        description = f"{theme.calendarIcon} **Upcoming Event Schedule**\n{tz_info}\n\n"
-
         if settings.get('filter_time_range'):
-            description += f"No events in the next {settings['filter_time_range']} hours.\n\n"
+            empty_text = f"No events in the next {settings['filter_time_range']} hours."
         else:
-            description += "No upcoming events scheduled.\n\n"
+            empty_text = "No upcoming events scheduled."
 
-        description += theme.lowerDivider
+        description = "\n".join((
+            f"{theme.calendarIcon} **Upcoming Event Schedule**",
+            tz_info,
+            "",
+            empty_text,
+            "",
+            theme.lowerDivider,
+        ))
 
-        tz = self._get_timezone_object(settings.get('timezone', 'UTC'))
-        now = datetime.now(pytz.UTC).astimezone(tz)
+        tz = self._get_timezone_object(tz_string)
+        now = datetime.now(UTC).astimezone(tz)
 
         embed = discord.Embed(
             description=description,
             color=0x808080  # Gray
         )
 
-        if settings.get('use_user_timezone', 0):
+        if use_user_tz:
             tz_indicator = "(Local Time)"
         else:
-            tz_indicator = f"({self._format_timezone_display(settings.get('timezone', 'UTC'))})"
+            tz_indicator = f"({tz_display})"
 
         embed.set_footer(text=f"Last updated: {now.strftime('%b %d, %I:%M %p')} {tz_indicator}")
 
@@ -944,8 +1088,10 @@ class BearTrapSchedule(commands.Cog):
             color=0xFF0000
         )
 
-    def _get_timezone_object(self, tz_string: str):
-        """Convert timezone string to a usable timezone object
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_timezone_object(tz_string: str):
+        """Convert timezone string to a usable timezone object (cached per string)
 
         Handles:
             - "UTC" -> pytz.UTC
@@ -955,7 +1101,7 @@ class BearTrapSchedule(commands.Cog):
         from datetime import timezone, timedelta
 
         if tz_string == "UTC":
-            return pytz.UTC
+            return UTC
         elif tz_string.startswith("UTC+") or tz_string.startswith("UTC-"):
             # Parse fractional offset like UTC+05:30
             try:
@@ -968,18 +1114,20 @@ class BearTrapSchedule(commands.Cog):
                     return timezone(timedelta(minutes=total_minutes))
                 else:
                     # Shouldn't happen with our validation, but fallback
-                    return pytz.UTC
+                    return UTC
             except:
-                return pytz.UTC
+                return UTC
         else:
             # Etc/GMT zones or other standard pytz timezones
             try:
-                return pytz.timezone(tz_string)
+                return get_timezone(tz_string)
             except:
-                return pytz.UTC
+                return UTC
 
-    def _format_timezone_display(self, tz_zone: str) -> str:
-        """Convert timezone name to user-friendly format
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_timezone_display(tz_zone: str) -> str:
+        """Convert timezone name to user-friendly format (cached per name)
 
         Examples:
             Etc/GMT-3 -> UTC+3
@@ -1026,8 +1174,7 @@ class BearTrapSchedule(commands.Cog):
         """Extract total pages from embed footer text"""
         try:
             if "Page" in footer_text:
-                import re
-                match = re.search(r'Page \d+ of (\d+)', footer_text)
+                match = PAGE_COUNT_RE.search(footer_text)
                 if match:
                     return int(match.group(1))
         except:
@@ -1039,15 +1186,14 @@ class BearTrapSchedule(commands.Cog):
         Updates a schedule board by regenerating and editing the Discord message.
         Returns True if successful, False otherwise.
         """
-        # Acquire lock to prevent concurrent updates
-        async with self._board_update_lock:
+        # Acquire this board's lock to prevent concurrent updates of the same message
+        async with self._board_update_locks.setdefault(board_id, asyncio.Lock()):
             try:
                 # Fetch board info
-                self.cursor.execute("""
+                result = await self.db_fetchone("""
                     SELECT channel_id, message_id FROM notification_schedule_boards
                     WHERE id = ?
                 """, (board_id,))
-                result = self.cursor.fetchone()
 
                 if not result:
                     print(f"[WARNING] Board {board_id} not found in database")
@@ -1059,16 +1205,16 @@ class BearTrapSchedule(commands.Cog):
                 channel = self.bot.get_channel(channel_id)
                 if not channel:
                     print(f"[WARNING] Channel {channel_id} not found, removing board {board_id}")
-                    self.cursor.execute("DELETE FROM notification_schedule_boards WHERE id = ?", (board_id,))
-                    self.conn.commit()
+                    await self.db_execute("DELETE FROM notification_schedule_boards WHERE id = ?", (board_id,))
+                    self._forget_board(board_id)
                     return False
 
                 try:
                     message = await channel.fetch_message(message_id)
                 except discord.NotFound:
                     print(f"[WARNING] Message {message_id} not found, removing board {board_id}")
-                    self.cursor.execute("DELETE FROM notification_schedule_boards WHERE id = ?", (board_id,))
-                    self.conn.commit()
+                    await self.db_execute("DELETE FROM notification_schedule_boards WHERE id = ?", (board_id,))
+                    self._forget_board(board_id)
                     return False
                 except Exception as e:
                     print(f"[ERROR] Failed to fetch message: {e}")
@@ -1085,13 +1231,13 @@ class BearTrapSchedule(commands.Cog):
                 await message.edit(embed=embed, view=view)
 
                 # Update last_updated timestamp
-                self.cursor.execute("""
+                await self.db_execute("""
                     UPDATE notification_schedule_boards
                     SET last_updated = ?
                     WHERE id = ?
-                """, (datetime.now(pytz.UTC).isoformat(), board_id))
-                self.conn.commit()
+                """, (datetime.now(UTC).isoformat(), board_id))
 
+                self._recent_refresh[board_id] = asyncio.get_running_loop().time()
                 self.logger.debug(f"[SCHEDULE] Board updated - ID: {board_id}")
 
                 return True
@@ -1099,20 +1245,17 @@ class BearTrapSchedule(commands.Cog):
             except Exception as e:
                 self.logger.error(f"[SCHEDULE] Failed to update board {board_id}: {e}")
                 print(f"[ERROR] Failed to update board {board_id}: {e}")
-                self.conn.rollback()
                 return False
 
     async def update_all_boards_for_guild(self, guild_id: int):
         """Updates all boards for a given server"""
         try:
-            self.cursor.execute("""
+            boards = await self.db_fetchall("""
                 SELECT id FROM notification_schedule_boards
                 WHERE guild_id = ?
             """, (guild_id,))
-            boards = self.cursor.fetchall()
 
-            for (board_id,) in boards:
-                await self.update_schedule_board(board_id)
+            await self._refresh_boards(board_id for (board_id,) in boards)
 
         except Exception as e:
             print(f"[ERROR] Failed to update all boards for guild {guild_id}: {e}")
@@ -1120,25 +1263,19 @@ class BearTrapSchedule(commands.Cog):
     async def update_boards_for_notification_channel(self, guild_id: int, notification_channel_id: int):
         """Updates boards that show notifications for a specific channel"""
         try:
-            # Update channel-specific boards
-            self.cursor.execute("""
+            # Channel-specific boards for this channel plus all server-wide boards, updated together
+            boards = await self.db_fetchall("""
                 SELECT id FROM notification_schedule_boards
-                WHERE guild_id = ? AND board_type = 'channel' AND target_channel_id = ?
+                WHERE guild_id = ?
+                AND (
+                    (board_type = 'channel' AND target_channel_id = ?)
+                    OR board_type = 'server'
+                )
             """, (guild_id, notification_channel_id))
-            channel_boards = self.cursor.fetchall()
-
-            for (board_id,) in channel_boards:
-                await self.update_schedule_board(board_id)
-
-            # Also update server-wide boards
-            self.cursor.execute("""
-                SELECT id FROM notification_schedule_boards
-                WHERE guild_id = ? AND board_type = 'server'
-            """, (guild_id,))
-            server_boards = self.cursor.fetchall()
 
-            for (board_id,) in server_boards:
-                await self.update_schedule_board(board_id)
+            # Bursts of notification changes (e.g. bulk edits) collapse into one refresh per board
+            for (board_id,) in boards:
+                self.schedule_update(board_id)
 
         except Exception as e:
             print(f"[ERROR] Failed to update boards for channel {notification_channel_id}: {e}")
@@ -1190,13 +1327,12 @@ class BearTrapSchedule(commands.Cog):
 
         try:
             # Get boards for this guild
-            self.cursor.execute("""
+            boards = await self.db_fetchall("""
                 SELECT id, board_type, target_channel_id, channel_id
                 FROM notification_schedule_boards
                 WHERE guild_id = ?
                 ORDER BY created_at DESC
-            """, (interaction.guild.id,))
-            boards = self.cursor.fetchall()
+            """, (interaction.guild_id,))
 
             embed = discord.Embed(
                 title=f"{theme.calendarIcon} Schedule Board Management",
@@ -1208,7 +1344,7 @@ class BearTrapSchedule(commands.Cog):
                 color=theme.emColor1
             )
 
-            view = ScheduleBoardMainView(self, interaction.guild.id, boards)
+            view = ScheduleBoardMainView(self, interaction.guild_id, boards)
 
             # If force_new is True, always send a new ephemeral message
             if force_new:
@@ -1300,8 +1436,7 @@ class ScheduleBoardPaginationView(discord.ui.View):
             footer = embed.footer.text
             if "Page" in footer:
                 # Extract "Page X of Y"
-                import re
-                match = re.search(r'Page \d+ of (\d+)', footer)
+                match = PAGE_COUNT_RE.search(footer)
                 if match:
                     return int(match.group(1))
         except:
@@ -2084,7 +2219,7 @@ class BoardSelectionView(discord.ui.View):
             board_id = int(interaction.data["values"][0])
 
             # Show board management view
-            view = BoardManagementView(self.cog, self.guild_id, board_id)
+            view = await BoardManagementView.create(self.cog, self.guild_id, board_id)
             embed = await view.create_embed()
             await interaction.response.edit_message(embed=embed, view=view)
 
@@ -2098,16 +2233,12 @@ class BoardSelectionView(discord.ui.View):
 
 class BoardManagementView(discord.ui.View):
     """View to manage a specific board (edit/delete/move/preview)"""
-    def __init__(self, cog, guild_id: int, board_id: int):
+    def __init__(self, cog, guild_id: int, board_id: int, board_type: str = None):
         super().__init__(timeout=None)
         self.cog = cog
         self.guild_id = guild_id
         self.board_id = board_id
-
-        # Check if this is a per-channel board
-        cog.cursor.execute("SELECT board_type FROM notification_schedule_boards WHERE id = ?", (board_id,))
-        result = cog.cursor.fetchone()
-        self.board_type = result[0] if result else None
+        self.board_type = board_type
 
         # Hide "Change Tracking" button for server-wide boards
         if self.board_type != "channel":
@@ -2116,16 +2247,21 @@ class BoardManagementView(discord.ui.View):
                     self.remove_item(item)
                     break
 
+    @classmethod
+    async def create(cls, cog, guild_id: int, board_id: int):
+        """Build the view after looking up whether this is a per-channel board"""
+        result = await cog.db_fetchone("SELECT board_type FROM notification_schedule_boards WHERE id = ?", (board_id,))
+        return cls(cog, guild_id, board_id, result[0] if result else None)
+
     async def create_embed(self) -> discord.Embed:
         """Creates embed showing board info"""
         try:
-            self.cog.cursor.execute("""
+            result = await self.cog.db_fetchone("""
                 SELECT board_type, target_channel_id, channel_id, max_events,
                        show_disabled, auto_pin, timezone, created_at, show_repeating_events
                 FROM notification_schedule_boards
                 WHERE id = ?
             """, (self.board_id,))
-            result = self.cog.cursor.fetchone()
 
             if not result:
                 return discord.Embed(
@@ -2170,7 +2306,7 @@ class BoardManagementView(discord.ui.View):
     @discord.ui.button(label="Edit Settings", emoji=f"{theme.editListIcon}", style=discord.ButtonStyle.primary, row=0)
     async def edit_settings_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
-            view = EditBoardSettingsView(self.cog, self.board_id, self.guild_id)
+            view = await EditBoardSettingsView.create(self.cog, self.board_id, self.guild_id)
             embed = await view._create_settings_embed()
             await interaction.response.edit_message(embed=embed, view=view)
         except Exception as e:
@@ -2192,12 +2328,11 @@ class BoardManagementView(discord.ui.View):
                 new_target_channel_id = int(select_interaction.data["values"][0])
 
                 # Update target channel in database
-                self.cog.cursor.execute("""
+                await self.cog.db_execute("""
                     UPDATE notification_schedule_boards
                     SET target_channel_id = ?
                     WHERE id = ?
                 """, (new_target_channel_id, self.board_id))
-                self.cog.conn.commit()
 
                 # Update the board
                 await self.cog.update_schedule_board(self.board_id)
@@ -2307,26 +2442,29 @@ class BoardManagementView(discord.ui.View):
 
 class EditBoardSettingsView(discord.ui.View):
     """Interactive view to edit board settings with buttons"""
-    def __init__(self, cog, board_id: int, guild_id: int):
+    def __init__(self, cog, board_id: int, guild_id: int, settings: tuple = None):
         super().__init__(timeout=300)
         self.cog = cog
         self.board_id = board_id
         self.guild_id = guild_id
 
         # Load current settings
-        self._load_settings()
+        self._load_settings(settings)
         self._update_button_labels()
         self._update_button_styles()
 
-    def _load_settings(self):
-        """Load current settings from database"""
-        self.cog.cursor.execute("""
+    @classmethod
+    async def create(cls, cog, board_id: int, guild_id: int):
+        """Build the view from the board's current settings row"""
+        settings = await cog.db_fetchone("""
             SELECT max_events, timezone, show_disabled, auto_pin, show_repeating_events, use_user_timezone, hide_daily_reset
             FROM notification_schedule_boards
             WHERE id = ?
-        """, (self.board_id,))
-        result = self.cog.cursor.fetchone()
+        """, (board_id,))
+        return cls(cog, board_id, guild_id, settings)
 
+    def _load_settings(self, result):
+        """Apply a settings row fetched by create(), or the defaults when there is none"""
         if result:
             self.max_events, self.timezone, self.show_disabled, self.auto_pin, self.show_repeating_events, self.use_user_timezone, self.hide_daily_reset = result
             # Handle NULL values
@@ -2440,12 +2578,11 @@ class EditBoardSettingsView(discord.ui.View):
                             raise ValueError()
 
                         # Update database
-                        parent_view.cog.cursor.execute("""
+                        await parent_view.cog.db_execute("""
                             UPDATE notification_schedule_boards
                             SET max_events = ?
                             WHERE id = ?
                         """, (max_events, parent_view.board_id))
-                        parent_view.cog.conn.commit()
 
                         # Update view state
                         parent_view.max_events = max_events
@@ -2516,12 +2653,12 @@ class EditBoardSettingsView(discord.ui.View):
                         pytz.timezone(tz_name)
 
                         # Update database
-                        parent_view.cog.cursor.execute("""
+                        await parent_view.cog.db_execute("""
                             UPDATE notification_schedule_boards
                             SET timezone = ?
                             WHERE id = ?
                         """, (tz_name, parent_view.board_id))
-                        parent_view.cog.conn.commit()
+                        parent_view.cog.invalidate_board_timezones()
 
                         # Update view state
                         parent_view.timezone = tz_name
@@ -2555,12 +2692,11 @@ class EditBoardSettingsView(discord.ui.View):
             self.use_user_timezone = 0 if self.use_user_timezone else 1
 
             # Update database
-            self.cog.cursor.execute("""
+            await self.cog.db_execute("""
                 UPDATE notification_schedule_boards
                 SET use_user_timezone = ?
                 WHERE id = ?
             """, (self.use_user_timezone, self.board_id))
-            self.cog.conn.commit()
 
             # Update button styles (this will also update timezone button visibility)
             self._update_button_styles()
@@ -2584,12 +2720,11 @@ class EditBoardSettingsView(discord.ui.View):
             self.show_disabled = 0 if self.show_disabled else 1
 
             # Update database
-            self.cog.cursor.execute("""
+            await self.cog.db_execute("""
                 UPDATE notification_schedule_boards
                 SET show_disabled = ?
                 WHERE id = ?
             """, (self.show_disabled, self.board_id))
-            self.cog.conn.commit()
 
             # Update button style
             self._update_button_styles()
@@ -2613,19 +2748,17 @@ class EditBoardSettingsView(discord.ui.View):
             self.auto_pin = 0 if self.auto_pin else 1
 
             # Update database
-            self.cog.cursor.execute("""
+            await self.cog.db_execute("""
                 UPDATE notification_schedule_boards
                 SET auto_pin = ?
                 WHERE id = ?
             """, (self.auto_pin, self.board_id))
-            self.cog.conn.commit()
 
             # Get the board's message to pin/unpin it
-            self.cog.cursor.execute("""
+            result = await self.cog.db_fetchone("""
                 SELECT channel_id, message_id FROM notification_schedule_boards
                 WHERE id = ?
             """, (self.board_id,))
-            result = self.cog.cursor.fetchone()
 
             if result:
                 channel_id, message_id = result
@@ -2671,12 +2804,11 @@ class EditBoardSettingsView(discord.ui.View):
             self.show_repeating_events = 0 if self.show_repeating_events else 1
 
             # Update database
-            self.cog.cursor.execute("""
+            await self.cog.db_execute("""
                 UPDATE notification_schedule_boards
                 SET show_repeating_events = ?
                 WHERE id = ?
             """, (self.show_repeating_events, self.board_id))
-            self.cog.conn.commit()
 
             # Update button style
             self._update_button_styles()
@@ -2700,12 +2832,11 @@ class EditBoardSettingsView(discord.ui.View):
             self.hide_daily_reset = 0 if self.hide_daily_reset else 1
 
             # Update database
-            self.cog.cursor.execute("""
+            await self.cog.db_execute("""
                 UPDATE notification_schedule_boards
                 SET hide_daily_reset = ?
                 WHERE id = ?
             """, (self.hide_daily_reset, self.board_id))
-            self.cog.conn.commit()
 
             # Update button style
             self._update_button_styles()
@@ -2725,7 +2856,7 @@ class EditBoardSettingsView(discord.ui.View):
     async def done_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Return to board management view"""
         try:
-            view = BoardManagementView(self.cog, self.guild_id, self.board_id)
+            view = await BoardManagementView.create(self.cog, self.guild_id, self.board_id)
             embed = await view.create_embed()
             await interaction.response.edit_message(embed=embed, view=view)
         except Exception as e:
@@ -2734,19 +2865,12 @@ class EditBoardSettingsView(discord.ui.View):
 
 class EditBoardSettingsModal(discord.ui.Modal):
     """Modal to edit board settings"""
-    def __init__(self, cog, board_id: int):
+    def __init__(self, cog, board_id: int, result: tuple = None):
         super().__init__(title="Edit Board Settings")
         self.cog = cog
         self.board_id = board_id
 
-        # Load current settings
-        cog.cursor.execute("""
-            SELECT max_events, timezone, show_disabled, auto_pin, show_repeating_events
-            FROM notification_schedule_boards
-            WHERE id = ?
-        """, (board_id,))
-        result = cog.cursor.fetchone()
-
+        # Current settings, fetched by create()
         if result:
             max_events, timezone, show_disabled, auto_pin, show_repeating_events = result
 
@@ -2783,6 +2907,16 @@ class EditBoardSettingsModal(discord.ui.Modal):
             )
             self.add_item(self.show_repeating_events)
 
+    @classmethod
+    async def create(cls, cog, board_id: int):
+        """Build the modal from the board's current settings row"""
+        result = await cog.db_fetchone("""
+            SELECT max_events, timezone, show_disabled, auto_pin, show_repeating_events
+            FROM notification_schedule_boards
+            WHERE id = ?
+        """, (board_id,))
+        return cls(cog, board_id, result)
+
     async def on_submit(self, interaction: discord.Interaction):
         try:
             # Parse and validate timezone (support UTC+X format including decimals and HH:MM)
@@ -2888,21 +3022,21 @@ class EditBoardSettingsModal(discord.ui.Modal):
             await interaction.response.defer()
 
             # Update database
-            self.cog.cursor.execute("""
+            await self.cog.db_execute("""
                 UPDATE notification_schedule_boards
                 SET max_events = ?, timezone = ?, show_disabled = ?, show_repeating_events = ?
                 WHERE id = ?
             """, (max_events, tz_name, 1 if show_disabled else 0, 1 if show_repeating_events else 0, self.board_id))
-            self.cog.conn.commit()
 
             # Update the board
             await self.cog.update_schedule_board(self.board_id)
 
             # Refresh the board management view with updated data
-            view = BoardManagementView(self.cog, self.cog.cursor.execute(
+            guild_row = await self.cog.db_fetchone(
                 "SELECT guild_id FROM notification_schedule_boards WHERE id = ?",
                 (self.board_id,)
-            ).fetchone()[0], self.board_id)
+            )
+            view = await BoardManagementView.create(self.cog, guild_row[0], self.board_id)
 
             embed = await view.create_embed()
             await interaction.edit_original_response(embed=embed, view=view)
@@ -2942,7 +3076,7 @@ class ConfirmDeleteView(discord.ui.View):
     @discord.ui.button(label="Cancel", emoji=f"{theme.deniedIcon}", style=discord.ButtonStyle.secondary, row=0)
     async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         # Return to board management
-        view = BoardManagementView(self.cog, self.guild_id, self.board_id)
+        view = await BoardManagementView.create(self.cog, self.guild_id, self.board_id)
         embed = await view.create_embed()
         await interaction.response.edit_message(embed=embed, view=view)
 
@@ -2852,18 +2852,17 @@ class WizardCompletionView(discord.ui.View):
                 return
 
             # Check if a channel-specific board already exists for this channel
-            schedule_cog.cursor.execute("""
+            existing_channel_board = await schedule_cog.db_fetchone("""
                 SELECT id, board_type FROM notification_schedule_boards
                 WHERE guild_id = ? AND channel_id = ? AND board_type = 'channel' AND target_channel_id = ?
-            """, (interaction.guild.id, self.session.channel_id, self.session.channel_id))
-            existing_channel_board = schedule_cog.cursor.fetchone()
+            """, (interaction.guild_id, self.session.channel_id, self.session.channel_id))
 
             # Also check for existing server boards in this channel (to warn user)
-            schedule_cog.cursor.execute("""
+            server_boards_row = await schedule_cog.db_fetchone("""
                 SELECT COUNT(*) FROM notification_schedule_boards
                 WHERE guild_id = ? AND channel_id = ? AND board_type = 'server'
-            """, (interaction.guild.id, self.session.channel_id))
-            server_boards_count = schedule_cog.cursor.fetchone()[0]
+            """, (interaction.guild_id, self.session.channel_id))
+            server_boards_count = server_boards_row[0]
 
             if existing_channel_board:
                 # Update existing channel board
@@ -2884,7 +2883,7 @@ class WizardCompletionView(discord.ui.View):
             else:
                 # Create new channel-specific schedule board
                 board_id, error = await schedule_cog.create_schedule_board(
-                    guild_id=interaction.guild.id,
+                    guild_id=interaction.guild_id,
                     channel_id=self.session.channel_id,
                     board_type="channel",
                     target_channel_id=self.session.channel_id,